@@ -0,0 +1,90 @@
+"""
+Build time, top-K latency and recall of the in-process embedding index (modules/embedding/index.py)
+on synthetic vectors, without a database or an encoder.
+
+Vectors are drawn around --clusters random directions with --noise spread, roughly like
+resumes grouped by profession; recall is measured against an exact float32 scan. Run from the backend directory:
+
+    python -m benchmarks.bench_embedding_index --size 1000000 --dimensions 256 --k 50 --probes 32
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import numpy as np
+
+from src.modules.embedding.encoders import normalize_rows
+from src.modules.embedding.index import VectorIndex
+
+
+def synthetic_vectors(size: int, dimensions: int, clusters: int, noise: float, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = normalize_rows(rng.standard_normal((clusters, dimensions)))
+    vectors = np.empty((size, dimensions), dtype=np.float16)
+    # Generated in chunks so a million float32 rows are never held at once
+    for start in range(0, size, 100000):
+        count = min(100000, size - start)
+        chunk = centers[rng.integers(0, clusters, count)] + noise * rng.standard_normal((count, dimensions)).astype(np.float32) / np.sqrt(dimensions)
+        vectors[start:start + count] = normalize_rows(chunk)
+    return vectors
+
+
+def exact_top_k(vectors: np.ndarray, query: np.ndarray, k: int) -> set:
+    scores = np.concatenate([
+        vectors[start:start + 100000].astype(np.float32) @ query for start in range(0, len(vectors), 100000)
+    ])
+    return set(np.argpartition(-scores, k - 1)[:k].tolist())
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark the embedding index")
+    parser.add_argument("--size", type=int, default=1000000)
+    parser.add_argument("--dimensions", type=int, default=256)
+    parser.add_argument("--clusters", type=int, default=500)
+    parser.add_argument("--noise", type=float, default=1.0)
+    parser.add_argument("--k", type=int, default=50)
+    parser.add_argument("--probes", type=int, default=32)
+    parser.add_argument("--lists", type=int, default=0, help="IVF lists (0 = sqrt of size)")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--recall-queries", type=int, default=20)
+    args = parser.parse_args()
+
+    vectors = synthetic_vectors(args.size, args.dimensions, args.clusters, args.noise)
+    index = VectorIndex("bench", args.dimensions, ivf_lists=args.lists, ivf_probes=args.probes)
+
+    started = time.perf_counter()
+    await index.rebuild(np.arange(args.size, dtype=np.int64), vectors)
+    build_seconds = time.perf_counter() - started
+
+    queries = synthetic_vectors(args.queries, args.dimensions, args.clusters, args.noise, seed=1).astype(np.float32)
+    latencies = []
+    for query in queries:
+        started = time.perf_counter()
+        index.search(query, args.k)
+        latencies.append((time.perf_counter() - started) * 1000)
+    latencies.sort()
+
+    recalls = []
+    for query in queries[:args.recall_queries]:
+        found = {item_id for item_id, _ in index.search(query, args.k)}
+        recalls.append(len(found & exact_top_k(vectors, query, args.k)) / args.k)
+
+    started = time.perf_counter()
+    for item_id in range(args.size, args.size + 1000):
+        index.add(item_id, queries[item_id % len(queries)])
+    for item_id in range(args.size, args.size + 1000):
+        index.remove(item_id)
+    update_us = (time.perf_counter() - started) / 2000 * 1e6
+
+    stats = index.stats()
+    print(f"vectors:        {args.size} x {args.dimensions} ({stats['type']}, {stats['lists']} lists, {args.probes} probes)")
+    print(f"memory:         {stats['memory_bytes'] / 2 ** 20:.0f} MiB")
+    print(f"build:          {build_seconds:.2f}s")
+    print(f"top-{args.k} latency: p50 {statistics.median(latencies):.2f} ms, p99 {latencies[int(len(latencies) * 0.99) - 1]:.2f} ms")
+    print(f"recall@{args.k}:     {statistics.mean(recalls):.3f}")
+    print(f"insert/delete:  {update_us:.1f} us per operation")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,176 @@
+"""
+Throughput and latency of ResumeService.create_resume and ApplicationService.create_application
+under concurrent load, without Azure OpenAI, Blob Storage or a database.
+
+The LLM is the simulated model (LLM_BACKEND=fake, or replayed fixtures with --replay) and resume
+files go to the in-memory store, so the numbers reflect the app's own overhead, the LLM limiter
+and the configured latency distribution. Run from the backend directory:
+
+    python -m benchmarks.bench_offline --requests 200 --concurrency 20 --llm-ms 800 --tokens-per-second 80
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from io import BytesIO
+from types import SimpleNamespace
+
+import fitz
+from fastapi import UploadFile
+
+from src.core.fake_llm import FakeChatModel, RecordReplayChatModel
+from src.core.llm_limiter import LLMLimiter
+from src.core.llm_resilience import LLMCaller
+from src.models import ExperienceTimeEnum
+from src.modules.application.service import ApplicationService
+from src.modules.resume.pdf_extractor import PdfExtractionPool
+from src.modules.resume.service import ResumeService
+from src.modules.storage.memory_storage import InMemoryStorage
+
+
+def build_pdf(index: int) -> bytes:
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), f"Candidate {index}\nSoftware Engineer\nPython, SQL, FastAPI, Docker")
+    return doc.tobytes()
+
+
+class ResumeDatabaseStandIn:
+    async def create_resume(self, db, resume_data):
+        return SimpleNamespace(id=1, **resume_data.model_dump())
+
+
+class ApplicationDatabaseStandIn:
+    def __init__(self):
+        self.created = 0
+
+    async def create_application(self, db, user_id, vacancy_id, resume_id, matching_score, summary, resume_path, matching_source=None):
+        self.created += 1
+        return SimpleNamespace(id=self.created, matching_score=matching_score, matching_source=matching_source)
+
+
+def build_resume(resume_id: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=resume_id, user_id=resume_id, first_name="Алихан", last_name="Нурсеитов",
+        experience_time=float(resume_id % 8), profession="Software Engineer",
+        skills=["Python", "SQL", "Docker"][:1 + resume_id % 3], grade="Middle",
+        min_salary=400000.0 + resume_id % 5 * 100000, resume_link=f"memory://{resume_id}.pdf"
+    )
+
+
+def build_vacancy(vacancy_id: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=vacancy_id, title="Backend Developer", description=f"Разработка сервисов на Python, команда {vacancy_id}",
+        experience_time=ExperienceTimeEnum.one_to_three_years, skills="Python, SQL, FastAPI, Docker",
+        position="Middle", salary_min=500000.0, salary_max=800000.0
+    )
+
+
+class VacancyServiceStandIn:
+    async def get_applied_vacancies(self, db, user_id):
+        return []
+
+    async def get_accepted_vacancy_by_id(self, db, vacancy_id):
+        return build_vacancy(vacancy_id)
+
+    async def get_vacancy_by_id(self, db, vacancy_id):
+        return build_vacancy(vacancy_id)
+
+
+class ResumeServiceStandIn:
+    async def get_resume_by_id(self, db, resume_id):
+        return build_resume(resume_id)
+
+
+def build_llm(args):
+    fake = FakeChatModel(
+        latency_ms=args.llm_ms,
+        latency_distribution=args.distribution,
+        latency_spread=args.spread,
+        tokens_per_second=args.tokens_per_second,
+        error_rate=args.error_rate,
+        seed=args.seed
+    )
+    if args.replay:
+        return RecordReplayChatModel(mode="replay", fixtures_path=args.replay, fallback=fake)
+    return fake
+
+
+async def run_load(call, requests: int, concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+    timings, errors = [], 0
+
+    async def one(index: int):
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await call(index)
+            except Exception:
+                errors += 1
+                return
+            timings.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(index) for index in range(requests)))
+    return timings, errors, time.perf_counter() - started
+
+
+def report(name: str, timings: list[float], errors: int, elapsed: float):
+    if not timings:
+        print(f"{name:<20} all {errors} requests failed")
+        return
+    timings = sorted(timings)
+    p95 = timings[max(0, int(len(timings) * 0.95) - 1)]
+    print(
+        f"{name:<20} {len(timings) / elapsed:7.1f} req/s  mean={statistics.mean(timings):8.1f} ms  "
+        f"p50={statistics.median(timings):8.1f} ms  p95={p95:8.1f} ms  errors={errors}"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--llm-ms", type=float, default=800)
+    parser.add_argument("--distribution", choices=["fixed", "uniform", "lognormal"], default="lognormal")
+    parser.add_argument("--spread", type=float, default=0.3)
+    parser.add_argument("--tokens-per-second", type=float, default=80)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--blob-ms", type=float, default=50)
+    parser.add_argument("--replay", help="Fixtures file recorded with LLM_BACKEND=record")
+    args = parser.parse_args()
+
+    # A fresh limiter and circuit breaker per scenario with the configured limits, so the numbers include
+    # queueing and, with --error-rate, retries
+    resume_service = ResumeService(
+        resume_database=ResumeDatabaseStandIn(),
+        llm=build_llm(args),
+        storage=InMemoryStorage(args.blob_ms / 1000),
+        pdf_extractor=PdfExtractionPool(max_workers=0),
+        llm_caller=LLMCaller(LLMLimiter())
+    )
+    pdfs = [build_pdf(index) for index in range(args.requests)]
+
+    async def create_resume(index: int):
+        file = UploadFile(file=BytesIO(pdfs[index]), filename="cv.pdf")
+        await resume_service.create_resume(file, user_id=1, db=None)
+
+    application_service = ApplicationService(
+        application_database=ApplicationDatabaseStandIn(),
+        vacancy_service=VacancyServiceStandIn(),
+        resume_service=ResumeServiceStandIn(),
+        llm=build_llm(args),
+        llm_caller=LLMCaller(LLMLimiter())
+    )
+
+    async def create_application(index: int):
+        await application_service.create_application(None, user_id=index, vacancy_id=index % 50 + 1, resume_id=index + 1)
+
+    report("create_resume", *await run_load(create_resume, args.requests, args.concurrency))
+    report("create_application", *await run_load(create_application, args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,133 @@
+"""
+End-to-end latency of ResumeService.create_resume: sequential stages vs. overlapped stages.
+
+External services are replaced by stand-ins with fixed latencies, so the numbers show the
+effect of the pipeline layout rather than network noise. Run from the backend directory:
+
+    python -m benchmarks.bench_resume_pipeline --runs 20 --blob-ms 400 --llm-ms 1500 --rate-ms 300
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from io import BytesIO
+from types import SimpleNamespace
+
+import fitz
+from fastapi import UploadFile
+from langchain_core.runnables import RunnableLambda
+
+from src.modules.resume.pdf_extractor import PdfExtractionPool
+from src.modules.resume.service import ResumeService
+from src.modules.resume.upload import spool_upload
+from src.modules.storage.azure_storage import AzureBlobStorage
+
+
+def build_pdf() -> bytes:
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), "Alikhan Nurseitov\nSoftware Engineer\nPython, SQL, FastAPI")
+    return doc.tobytes()
+
+
+class BlobStandIn:
+    account_name = "benchmark"
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def get_blob_client(self, container: str, blob: str):
+        latency = self.latency
+
+        class Client:
+            async def upload_blob(self, data, **kwargs):
+                await asyncio.sleep(latency)
+
+            async def delete_blob(self):
+                pass
+
+        return Client()
+
+
+class ResumeDatabaseStandIn:
+    async def create_resume(self, db, resume_data):
+        return SimpleNamespace(id=1, **resume_data.model_dump())
+
+
+class BenchmarkResumeService(ResumeService):
+    def __init__(self, rate_latency: float, **kwargs):
+        super().__init__(**kwargs)
+        self.rate_latency = rate_latency
+
+    async def get_exchange_rate(self, currency: str) -> float:
+        await asyncio.sleep(self.rate_latency)
+        return 450.0
+
+
+class SequentialResumeService(BenchmarkResumeService):
+    """The previous create_resume layout: every stage waits for the one before it."""
+
+    async def create_resume(self, file, user_id, db):
+        upload = await spool_upload(file)
+        try:
+            resume_link = await self.save_resume(upload)
+            _, resume_data = await self.get_resume_analysis(upload.path)
+            return await self.save_resume_to_db(db, resume_data, resume_link, user_id)
+        finally:
+            upload.cleanup()
+
+
+def build_service(service_class, args):
+    async def fake_llm(prompt_value):
+        await asyncio.sleep(args.llm_ms / 1000)
+        return json.dumps({
+            "first_name": "Alikhan", "last_name": "Nurseitov", "email": None, "phone": None,
+            "experience_time": 3.0, "profession": "Software Engineer", "skills": ["Python", "SQL"],
+            "min_salary": 2000, "max_salary": 3000, "currency": "USD"
+        })
+
+    return service_class(
+        rate_latency=args.rate_ms / 1000,
+        resume_database=ResumeDatabaseStandIn(),
+        llm=RunnableLambda(fake_llm),
+        storage=AzureBlobStorage(BlobStandIn(args.blob_ms / 1000), "resumes"),
+        pdf_extractor=PdfExtractionPool(max_workers=0)
+    )
+
+
+async def measure(service, pdf_bytes: bytes, runs: int) -> list[float]:
+    timings = []
+    for _ in range(runs):
+        file = UploadFile(file=BytesIO(pdf_bytes), filename="cv.pdf")
+        started = time.perf_counter()
+        await service.create_resume(file, user_id=1, db=None)
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def report(name: str, timings: list[float]):
+    timings = sorted(timings)
+    p95 = timings[max(0, int(len(timings) * 0.95) - 1)]
+    print(f"{name:<12} mean={statistics.mean(timings):8.1f} ms  p50={statistics.median(timings):8.1f} ms  p95={p95:8.1f} ms")
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--blob-ms", type=float, default=400)
+    parser.add_argument("--llm-ms", type=float, default=1500)
+    parser.add_argument("--rate-ms", type=float, default=300)
+    args = parser.parse_args()
+
+    pdf_bytes = build_pdf()
+    sequential = await measure(build_service(SequentialResumeService, args), pdf_bytes, args.runs)
+    overlapped = await measure(build_service(BenchmarkResumeService, args), pdf_bytes, args.runs)
+
+    report("sequential", sequential)
+    report("overlapped", overlapped)
+    print(f"speedup      {statistics.mean(sequential) / statistics.mean(overlapped):.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
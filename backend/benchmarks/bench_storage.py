@@ -0,0 +1,79 @@
+"""
+Throughput of the resume storage backends: upload from a spooled file, full read and ranged reads.
+
+Local storage always runs; Azure runs when AZURE_STORAGE_CONNECTION_STRING is set
+(a real account or Azurite). Run from the backend directory:
+
+    python -m benchmarks.bench_storage --files 20 --size-mb 2 --backend local --backend azure
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import uuid
+
+from src.core.config import BackendConfig
+from src.modules.storage.base import ResumeStorage
+from src.modules.storage.dependencies import build_resume_storage
+from src.modules.storage.local_storage import LocalFileStorage
+
+
+async def timed(label: str, total_bytes: int, coroutine):
+    started = time.perf_counter()
+    await coroutine
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<14} {elapsed * 1000:9.1f} ms  {total_bytes / elapsed / 1024 / 1024:9.1f} MB/s")
+
+
+async def run(storage: ResumeStorage, files: int, size: int, range_size: int, concurrency: int):
+    print(f"{storage.name} ({files} files x {size // 1024} KB, concurrency {concurrency})")
+    semaphore = asyncio.Semaphore(concurrency)
+    keys = [f"bench-{uuid.uuid4()}.pdf" for _ in range(files)]
+
+    fd, source = tempfile.mkstemp(suffix=".pdf")
+    with os.fdopen(fd, "wb") as f:
+        f.write(os.urandom(size))
+
+    async def bounded(coroutine):
+        async with semaphore:
+            return await coroutine
+
+    async def read_ranges(key: str):
+        for start in range(0, size, range_size):
+            async for _ in storage.iter_range(key, start, min(start + range_size, size) - 1, BackendConfig.STORAGE_DOWNLOAD_CHUNK_SIZE):
+                pass
+
+    try:
+        await timed("upload", files * size, asyncio.gather(*(bounded(storage.save_file(key, source, size)) for key in keys)))
+        await timed("read", files * size, asyncio.gather(*(bounded(storage.read(key)) for key in keys)))
+        await timed("ranged read", files * size, asyncio.gather(*(bounded(read_ranges(key)) for key in keys)))
+    finally:
+        await asyncio.gather(*(storage.delete(key) for key in keys), return_exceptions=True)
+        os.unlink(source)
+        await storage.close()
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=20)
+    parser.add_argument("--size-mb", type=float, default=2)
+    parser.add_argument("--range-kb", type=int, default=512)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--backend", action="append", choices=["local", "azure"])
+    args = parser.parse_args()
+
+    size = int(args.size_mb * 1024 * 1024)
+    for backend in args.backend or ["local", "azure"]:
+        if backend == "azure" and not BackendConfig.AZURE_STORAGE_CONNECTION_STRING:
+            print("azure: skipped, AZURE_STORAGE_CONNECTION_STRING is not set")
+            continue
+        if backend == "local":
+            storage = LocalFileStorage(tempfile.mkdtemp(prefix="bench-storage-"))
+        else:
+            storage = build_resume_storage("azure")
+        await run(storage, args.files, size, args.range_kb * 1024, args.concurrency)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,78 @@
+"""
+Embeds resumes and vacancies that have no embedding from the current encoder, e.g. rows created
+before embeddings existed, saved while the encoder was unavailable, or after EMBEDDING_BACKEND changed.
+
+    python -m src.commands.backfill_embeddings [--batch-size 200] [--limit 0]
+
+Rows are read in id order, batch_size per encoder call. An embedded row no longer matches the query,
+so an interrupted run simply starts again; running app instances pick the new vectors up on their next index refresh.
+"""
+import argparse
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict
+from src.core.clients import close_clients
+from src.core.database import SessionLocal, engine
+from src.core.config import backend_config
+from src.core.llm_limiter import LLMPriority, llm_priority
+from src.modules.embedding.dependencies import build_embedding_service
+from src.modules.embedding.encoders import resume_embedding_text, to_bytes, vacancy_embedding_text
+
+
+async def backfill(batch_size: int = 200, limit: int = 0) -> Dict[str, int]:
+    llm_priority.set(LLMPriority.bulk)
+    embedding_service = build_embedding_service()
+    embedding_database = embedding_service.embedding_database
+    model_name = embedding_service.model_name
+    counters = {"resumes": 0, "vacancies": 0, "failed": 0}
+
+    for kind, load, to_text in (
+        ("resumes", embedding_database.get_resumes_without_embedding, resume_embedding_text),
+        ("vacancies", embedding_database.get_vacancies_without_embedding, vacancy_embedding_text),
+    ):
+        after_id = 0
+        while not limit or counters[kind] < limit:
+            async with SessionLocal() as db:
+                rows = await load(db, model_name, after_id, batch_size)
+                if not rows:
+                    break
+                after_id = rows[-1].id
+
+                vectors = await embedding_service.try_encode([to_text(row) for row in rows], f"backfill_{kind}")
+                if vectors is None:
+                    counters["failed"] += len(rows)
+                    continue
+
+                embedded_at = datetime.utcnow()
+                for row, vector in zip(rows, vectors):
+                    row.embedding = to_bytes(vector)
+                    row.embedding_model = model_name
+                    row.embedded_at = embedded_at
+                await db.commit()
+                counters[kind] += len(rows)
+            logging.info(f"[EMBEDDING BACKFILL] {kind} up to id {after_id}: {counters[kind]} embedded, {counters['failed']} failed")
+
+    return counters
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Embed resumes and vacancies missing an embedding from the current encoder")
+    parser.add_argument("--batch-size", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=0, help="Stop after this many rows of each kind (0 = no limit)")
+    args = parser.parse_args()
+
+    backend_config.configure_logging()
+    try:
+        counters = await backfill(batch_size=args.batch_size, limit=args.limit)
+        logging.info(
+            f"[EMBEDDING BACKFILL] Finished with {counters['resumes']} resumes and {counters['vacancies']} vacancies embedded, "
+            f"{counters['failed']} failed"
+        )
+    finally:
+        await close_clients()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,52 @@
+"""
+Fills the candidate search columns (skill_tags, language_tags, profession_tags, grade_level) of resumes
+saved before they existed, or recomputes them for every resume after the normalization rules change.
+
+    python -m src.commands.backfill_search_tags [--batch-size 1000] [--all]
+
+Only the stored analysis is read, no LLM calls are made. Rows are read in id order, and a filled row no longer
+matches the query, so an interrupted run simply starts again.
+"""
+import argparse
+import asyncio
+import logging
+from src.core.database import SessionLocal, engine
+from src.core.config import backend_config
+from src.modules.candidate.crud import CandidateDatabase
+from src.modules.candidate.tags import search_tags
+
+
+async def backfill(batch_size: int = 1000, recompute_all: bool = False) -> int:
+    candidate_database = CandidateDatabase()
+    updated = 0
+    after_id = 0
+    while True:
+        async with SessionLocal() as db:
+            rows = await candidate_database.get_resumes_for_tagging(db, after_id, batch_size, only_missing=not recompute_all)
+            if not rows:
+                break
+            after_id = rows[-1].id
+            await candidate_database.update_search_tags(
+                db, [{"id": row.id, **search_tags(row._asdict())} for row in rows]
+            )
+            updated += len(rows)
+        logging.info(f"[SEARCH TAGS BACKFILL] Up to id {after_id}: {updated} resumes updated")
+    return updated
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Fill the candidate search columns of resumes")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--all", action="store_true", help="Recompute every resume, not only those without search columns")
+    args = parser.parse_args()
+
+    backend_config.configure_logging()
+    try:
+        updated = await backfill(batch_size=args.batch_size, recompute_all=args.all)
+        logging.info(f"[SEARCH TAGS BACKFILL] Finished with {updated} resumes updated")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,56 @@
+"""
+Rebuilds the inverted skill index (resume_skill, vacancy_skill) of every resume and vacancy from their stored
+skills, e.g. after migration 007 or after the skill dictionary changes. Run backfill_search_tags --all as well
+when the dictionary changes, so the candidate search columns use the same names.
+
+    python -m src.commands.backfill_skill_index [--batch-size 1000]
+
+Rows are read in id order and each batch replaces its own postings, so an interrupted run can simply start again.
+"""
+import argparse
+import asyncio
+import logging
+from src.core.database import SessionLocal, engine
+from src.core.config import backend_config
+from src.modules.application.scoring import parse_skills
+from src.modules.skill.crud import SkillIndexDatabase
+
+
+async def backfill(batch_size: int = 1000) -> dict:
+    skill_index_database = SkillIndexDatabase()
+    targets = {
+        "resumes": (skill_index_database.get_resumes_for_indexing, skill_index_database.replace_resume_skills),
+        "vacancies": (skill_index_database.get_vacancies_for_indexing, skill_index_database.replace_vacancy_skills),
+    }
+    indexed = {}
+    for kind, (read_batch, replace_postings) in targets.items():
+        indexed[kind] = 0
+        after_id = 0
+        while True:
+            async with SessionLocal() as db:
+                rows = await read_batch(db, after_id, batch_size)
+                if not rows:
+                    break
+                after_id = rows[-1].id
+                await replace_postings(db, {row.id: parse_skills(row.skills) for row in rows})
+                await db.commit()
+                indexed[kind] += len(rows)
+            logging.info(f"[SKILL INDEX BACKFILL] Up to {kind} id {after_id}: {indexed[kind]} {kind} indexed")
+    return indexed
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Rebuild the inverted skill index of resumes and vacancies")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    backend_config.configure_logging()
+    try:
+        indexed = await backfill(batch_size=args.batch_size)
+        logging.info(f"[SKILL INDEX BACKFILL] Finished: {indexed}")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,133 @@
+"""
+Re-analyzes stored resumes whose analysis was produced by an older prompt version.
+
+    python -m src.commands.reanalyze_resumes [--concurrency 4] [--batch-size 50] [--checkpoint path]
+
+Rows are processed in id order in batches; after every batch the last processed id is written
+to a checkpoint file, so an interrupted run continues where it stopped. Failed ids are recorded
+in the checkpoint and skipped on later runs unless --retry-failed is given.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+from typing import Any, Dict
+from src.core.clients import close_clients
+from src.core.config import BackendConfig, backend_config
+from src.core.database import SessionLocal, engine
+from src.core.llm_limiter import LLMPriority, llm_priority
+from src.modules.ingestion.dependencies import build_resume_service
+from src.modules.resume.constants import RESUME_PROMPT_VERSION
+from src.modules.resume.crud import ResumeDatabase
+from src.modules.resume.pdf_extractor import pdf_extraction_pool
+from src.modules.exchange_rate.service import exchange_rate_service
+
+
+def load_checkpoint(path: str) -> Dict[str, Any]:
+    checkpoint = {"analysis_version": RESUME_PROMPT_VERSION, "last_id": 0, "processed": 0, "failed": {}}
+    if not os.path.exists(path):
+        return checkpoint
+
+    with open(path) as f:
+        saved = json.load(f)
+    if saved.get("analysis_version") != RESUME_PROMPT_VERSION:
+        logging.info(f"[RESUME REANALYSIS] Checkpoint is for {saved.get('analysis_version')}, starting over")
+        return checkpoint
+    checkpoint.update(saved)
+    return checkpoint
+
+
+def save_checkpoint(path: str, checkpoint: Dict[str, Any]) -> None:
+    # Written to a temporary file first so an interrupted write never corrupts the checkpoint
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(checkpoint, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+async def reanalyze_resumes(
+    concurrency: int = BackendConfig.REANALYSIS_CONCURRENCY,
+    batch_size: int = BackendConfig.REANALYSIS_BATCH_SIZE,
+    checkpoint_path: str = BackendConfig.REANALYSIS_CHECKPOINT_PATH,
+    retry_failed: bool = False,
+    reextract: bool = False,
+    limit: int = 0
+) -> Dict[str, Any]:
+    llm_priority.set(LLMPriority.bulk)
+    resume_service = build_resume_service()
+    resume_database = ResumeDatabase()
+    checkpoint = load_checkpoint(checkpoint_path)
+    if retry_failed:
+        checkpoint["last_id"] = 0
+        checkpoint["failed"] = {}
+    semaphore = asyncio.Semaphore(concurrency)
+    started_with = checkpoint["processed"]
+
+    async def reanalyze(resume_id: int) -> None:
+        async with semaphore, SessionLocal() as db:
+            try:
+                resume = await resume_database.get_resume_with_text(db, resume_id)
+                if resume and resume.analysis_version != RESUME_PROMPT_VERSION:
+                    await resume_service.reanalyze_resume(db, resume, reextract=reextract)
+                checkpoint["processed"] += 1
+            except Exception as e:
+                detail = getattr(e, "detail", None) or str(e)
+                logging.error(f"[RESUME REANALYSIS] Resume {resume_id} failed: {detail}")
+                checkpoint["failed"][str(resume_id)] = str(detail)
+
+    while not limit or checkpoint["processed"] - started_with < limit:
+        async with SessionLocal() as db:
+            resumes = await resume_database.get_stale_resumes(
+                db, RESUME_PROMPT_VERSION, checkpoint["last_id"], batch_size
+            )
+            resume_ids = [resume.id for resume in resumes if str(resume.id) not in checkpoint["failed"]]
+            last_id = resumes[-1].id if resumes else None
+
+        if last_id is None:
+            break
+
+        await asyncio.gather(*(reanalyze(resume_id) for resume_id in resume_ids))
+        checkpoint["last_id"] = last_id
+        save_checkpoint(checkpoint_path, checkpoint)
+        logging.info(
+            f"[RESUME REANALYSIS] Up to id {last_id}: {checkpoint['processed']} processed, "
+            f"{len(checkpoint['failed'])} failed"
+        )
+
+    save_checkpoint(checkpoint_path, checkpoint)
+    return checkpoint
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=f"Re-analyze resumes not analyzed with {RESUME_PROMPT_VERSION}")
+    parser.add_argument("--concurrency", type=int, default=BackendConfig.REANALYSIS_CONCURRENCY)
+    parser.add_argument("--batch-size", type=int, default=BackendConfig.REANALYSIS_BATCH_SIZE)
+    parser.add_argument("--checkpoint", default=BackendConfig.REANALYSIS_CHECKPOINT_PATH)
+    parser.add_argument("--retry-failed", action="store_true", help="Start over and retry previously failed resumes")
+    parser.add_argument("--reextract", action="store_true", help="Parse the PDF again instead of using the stored text")
+    parser.add_argument("--limit", type=int, default=0, help="Stop after this many resumes (0 = no limit)")
+    args = parser.parse_args()
+
+    backend_config.configure_logging()
+    try:
+        checkpoint = await reanalyze_resumes(
+            concurrency=args.concurrency,
+            batch_size=args.batch_size,
+            checkpoint_path=args.checkpoint,
+            retry_failed=args.retry_failed,
+            reextract=args.reextract,
+            limit=args.limit
+        )
+        logging.info(
+            f"[RESUME REANALYSIS] Finished: {checkpoint['processed']} processed, {len(checkpoint['failed'])} failed"
+        )
+    finally:
+        pdf_extraction_pool.shutdown()
+        await exchange_rate_service.aclose()
+        await close_clients()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,150 @@
+import logging
+import time
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Generic, Hashable, Optional, TypeVar
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from src.core.database import SessionLocal
+from src.models import LLMResponseCacheEntry
+
+ValueType = TypeVar("ValueType")
+
+
+class TTLCache(Generic[ValueType]):
+    """
+    In-process LRU cache with a maximum size and a per-entry time to live.
+    Keeps hit/miss/eviction counters so the cache can be observed through the metrics endpoint.
+    """
+
+    def __init__(self, name: str, max_size: int = 1024, ttl_seconds: float = 3600):
+        self.name = name
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple[float, ValueType]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[ValueType]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.evictions += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: ValueType) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "name": self.name,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+class DatabaseCacheTier:
+    """
+    Cache tier backed by the llm_response_cache table, shared by all gunicorn workers.
+    Uses its own short sessions; errors are logged and treated as misses so the cache never fails a request.
+    """
+
+    def __init__(self, namespace: str, ttl_seconds: float = 86400, session_factory=SessionLocal):
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.session_factory = session_factory
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    async def get(self, key: str) -> Optional[Any]:
+        try:
+            async with self.session_factory() as db:
+                result = await db.execute(
+                    select(LLMResponseCacheEntry.value).where(
+                        LLMResponseCacheEntry.cache_key == key,
+                        LLMResponseCacheEntry.expires_at > datetime.utcnow()
+                    )
+                )
+                value = result.scalar_one_or_none()
+        except Exception as e:
+            self.errors += 1
+            logging.warning(f"[DB CACHE] {self.namespace}: lookup failed: {e}")
+            return None
+
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: Any) -> None:
+        now = datetime.utcnow()
+        expires_at = now + timedelta(seconds=self.ttl_seconds)
+        statement = insert(LLMResponseCacheEntry).values(
+            cache_key=key, namespace=self.namespace, value=value, created_at=now, expires_at=expires_at
+        ).on_conflict_do_update(
+            index_elements=[LLMResponseCacheEntry.cache_key],
+            set_={"value": value, "created_at": now, "expires_at": expires_at}
+        )
+        try:
+            async with self.session_factory() as db:
+                await db.execute(statement)
+                await db.commit()
+        except Exception as e:
+            self.errors += 1
+            logging.warning(f"[DB CACHE] {self.namespace}: write failed: {e}")
+
+    async def purge_expired(self) -> None:
+        async with self.session_factory() as db:
+            await db.execute(
+                delete(LLMResponseCacheEntry).where(
+                    LLMResponseCacheEntry.namespace == self.namespace,
+                    LLMResponseCacheEntry.expires_at <= datetime.utcnow()
+                )
+            )
+            await db.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "namespace": self.namespace,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
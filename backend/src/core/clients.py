@@ -0,0 +1,125 @@
+import logging
+from typing import Optional
+import httpx
+from langchain_openai import AzureChatOpenAI
+from src.core.config import BackendConfig
+from src.core.fake_llm import FakeChatModel, RecordReplayChatModel
+from src.core.llm_metrics import llm_metrics
+from src.modules.embedding.encoders import build_encoder
+from src.modules.storage.base import ResumeStorage
+from src.modules.storage.dependencies import build_resume_storage
+
+# Resume analysis wants stable extraction, matching and classification a bit more freedom
+ANALYSIS_TEMPERATURE = 0.2
+MATCHING_TEMPERATURE = 0.4
+
+
+def build_azure_llm(temperature: float, http_client: httpx.AsyncClient = None) -> AzureChatOpenAI:
+    return AzureChatOpenAI(
+        azure_endpoint=BackendConfig.AZURE_OPENAI_ENDPOINT,
+        openai_api_key=BackendConfig.AZURE_OPENAI_API_KEY,
+        deployment_name=BackendConfig.AZURE_OPENAI_DEPLOYMENT_NAME,
+        api_version=BackendConfig.AZURE_OPENAI_API_VERSION,
+        temperature=temperature,
+        # Retries and timeouts are handled by LLMCaller, within each call's deadline
+        timeout=BackendConfig.LLM_ATTEMPT_TIMEOUT_SECONDS,
+        max_retries=0,
+        http_async_client=http_client
+    )
+
+
+def build_llm(temperature: float, http_client: httpx.AsyncClient = None, backend: str = BackendConfig.LLM_BACKEND):
+    if backend == "azure":
+        return build_azure_llm(temperature, http_client)
+    if backend == "fake":
+        return FakeChatModel(temperature=temperature)
+    if backend == "record":
+        return RecordReplayChatModel(mode="record", inner=build_azure_llm(temperature, http_client))
+    if backend == "replay":
+        return RecordReplayChatModel(mode="replay", fallback=FakeChatModel(temperature=temperature))
+    raise ValueError(f"Unknown LLM_BACKEND: {backend}")
+
+
+class ClientRegistry:
+    """
+    Long-lived clients shared by every request and background worker in the process.
+    Both LLM clients send through one pooled httpx client, so connections and TLS sessions
+    are reused instead of being set up for every request.
+    """
+
+    def __init__(self, http_client: httpx.AsyncClient, analysis_llm, matching_llm, storage: ResumeStorage, embedding_encoder):
+        self.http_client = http_client
+        self.analysis_llm = analysis_llm
+        self.matching_llm = matching_llm
+        self.storage = storage
+        self.embedding_encoder = embedding_encoder
+
+    @classmethod
+    def build(cls) -> "ClientRegistry":
+        http_client = httpx.AsyncClient(
+            timeout=BackendConfig.HTTP_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=BackendConfig.HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=BackendConfig.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=BackendConfig.HTTP_KEEPALIVE_EXPIRY_SECONDS
+            ),
+            # Counts failed attempts the OpenAI client retries
+            event_hooks={"response": [llm_metrics.on_http_response]}
+        )
+        return cls(
+            http_client=http_client,
+            analysis_llm=build_llm(ANALYSIS_TEMPERATURE, http_client),
+            matching_llm=build_llm(MATCHING_TEMPERATURE, http_client),
+            storage=build_resume_storage(),
+            embedding_encoder=build_encoder(http_client)
+        )
+
+    async def aclose(self):
+        await self.storage.close()
+        await self.http_client.aclose()
+
+
+_registry: Optional[ClientRegistry] = None
+
+
+def init_clients() -> ClientRegistry:
+    global _registry
+    if _registry is None:
+        _registry = ClientRegistry.build()
+        logging.info("[CLIENTS] Shared clients created")
+    return _registry
+
+
+async def close_clients():
+    global _registry
+    if _registry is not None:
+        await _registry.aclose()
+        _registry = None
+        logging.info("[CLIENTS] Shared clients closed")
+
+
+def get_client_registry() -> ClientRegistry:
+    """
+    Returns the registry created by the app lifespan; scripts running outside the app get one on first use.
+    """
+    return _registry or init_clients()
+
+
+def get_analysis_llm():
+    return get_client_registry().analysis_llm
+
+
+def get_matching_llm():
+    return get_client_registry().matching_llm
+
+
+def get_embedding_encoder():
+    return get_client_registry().embedding_encoder
+
+
+def get_resume_storage() -> ResumeStorage:
+    return get_client_registry().storage
+
+
+def get_http_client() -> httpx.AsyncClient:
+    return get_client_registry().http_client
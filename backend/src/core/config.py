@@ -14,9 +14,79 @@ class BackendConfig:
     AZURE_OPENAI_API_VERSION = os.getenv("AZURE_OPENAI_API_VERSION", "")
     AZURE_OPENAI_ENDPOINT = os.getenv("AZURE_OPENAI_ENDPOINT", "")
     
+    # "azure", or for tests without Azure OpenAI: "fake" (simulated model), "record" (Azure, responses
+    # saved to LLM_FIXTURES_PATH) or "replay" (recorded responses, simulated model for the rest)
+    LLM_BACKEND = os.getenv("LLM_BACKEND", "azure")
+    LLM_FIXTURES_PATH = os.getenv("LLM_FIXTURES_PATH", "fixtures/llm_responses.jsonl")
+    # Simulated model: time to first token ("fixed", "uniform" or "lognormal" around the mean), output rate, failures
+    FAKE_LLM_LATENCY_MS = float(os.getenv("FAKE_LLM_LATENCY_MS", "800"))
+    FAKE_LLM_LATENCY_DISTRIBUTION = os.getenv("FAKE_LLM_LATENCY_DISTRIBUTION", "lognormal")
+    FAKE_LLM_LATENCY_SPREAD = float(os.getenv("FAKE_LLM_LATENCY_SPREAD", "0.3"))
+    FAKE_LLM_TOKENS_PER_SECOND = float(os.getenv("FAKE_LLM_TOKENS_PER_SECOND", "80"))
+    FAKE_LLM_ERROR_RATE = float(os.getenv("FAKE_LLM_ERROR_RATE", "0"))
+    FAKE_LLM_SEED = int(os.getenv("FAKE_LLM_SEED", "0"))
+
+    # Estimated cost per 1000 tokens (in the billing currency) and whether model output is logged in full
+    LLM_PROMPT_COST_PER_1K = float(os.getenv("LLM_PROMPT_COST_PER_1K", "0.0025"))
+    LLM_COMPLETION_COST_PER_1K = float(os.getenv("LLM_COMPLETION_COST_PER_1K", "0.01"))
+    LLM_LOG_RESPONSES: bool = os.getenv("LLM_LOG_RESPONSES", "False").upper() == "TRUE"
+
+    # Limits for all Azure OpenAI calls in the process (0 disables a limit)
+    LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+    LLM_REQUESTS_PER_MINUTE = int(os.getenv("LLM_REQUESTS_PER_MINUTE", "300"))
+    LLM_TOKENS_PER_MINUTE = int(os.getenv("LLM_TOKENS_PER_MINUTE", "120000"))
+    LLM_MAX_QUEUE_SIZE = int(os.getenv("LLM_MAX_QUEUE_SIZE", "100"))
+    LLM_MAX_WAIT_SECONDS = float(os.getenv("LLM_MAX_WAIT_SECONDS", "30"))
+
+    # Failure handling for LLM calls: a deadline for the whole call including retries, a timeout per attempt,
+    # jittered exponential backoff between attempts, optional hedging (0 disables) and a circuit breaker per deployment
+    LLM_DEADLINE_SECONDS = float(os.getenv("LLM_DEADLINE_SECONDS", "25"))
+    LLM_ATTEMPT_TIMEOUT_SECONDS = float(os.getenv("LLM_ATTEMPT_TIMEOUT_SECONDS", "12"))
+    LLM_MAX_ATTEMPTS = int(os.getenv("LLM_MAX_ATTEMPTS", "3"))
+    LLM_RETRY_BASE_DELAY_SECONDS = float(os.getenv("LLM_RETRY_BASE_DELAY_SECONDS", "0.5"))
+    LLM_RETRY_MAX_DELAY_SECONDS = float(os.getenv("LLM_RETRY_MAX_DELAY_SECONDS", "4"))
+    LLM_HEDGE_AFTER_SECONDS = float(os.getenv("LLM_HEDGE_AFTER_SECONDS", "0"))
+    LLM_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("LLM_CIRCUIT_FAILURE_THRESHOLD", "5"))
+    LLM_CIRCUIT_RESET_SECONDS = float(os.getenv("LLM_CIRCUIT_RESET_SECONDS", "30"))
+
+    # Batched resume/vacancy matching
+    MATCHING_BATCH_SIZE = int(os.getenv("MATCHING_BATCH_SIZE", "8"))
+    MAX_BATCH_APPLICATIONS = int(os.getenv("MAX_BATCH_APPLICATIONS", "20"))
+    # "llm": LLM score for every application; "local": local score only;
+    # "hybrid": local score, LLM only for scores inside the borderline band
+    MATCHING_MODE = os.getenv("MATCHING_MODE", "llm")
+    MATCHING_BORDERLINE_MIN = int(os.getenv("MATCHING_BORDERLINE_MIN", "40"))
+    MATCHING_BORDERLINE_MAX = int(os.getenv("MATCHING_BORDERLINE_MAX", "75"))
+
+    # Shared HTTP connection pool (LLM and exchange rate requests)
+    HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+    HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    HTTP_KEEPALIVE_EXPIRY_SECONDS = float(os.getenv("HTTP_KEEPALIVE_EXPIRY_SECONDS", "30"))
+    HTTP_TIMEOUT_SECONDS = float(os.getenv("HTTP_TIMEOUT_SECONDS", "120"))
+
     # Azure Blob Storage
     AZURE_STORAGE_CONNECTION_STRING = os.getenv("AZURE_STORAGE_CONNECTION_STRING", "")
     AZURE_STORAGE_CONTAINER_NAME = os.getenv("AZURE_STORAGE_CONTAINER_NAME", "resumes")
+    BLOB_UPLOAD_BLOCK_SIZE = int(os.getenv("BLOB_UPLOAD_BLOCK_SIZE", str(4 * 1024 * 1024)))
+    BLOB_UPLOAD_CONCURRENCY = int(os.getenv("BLOB_UPLOAD_CONCURRENCY", "2"))
+
+    # Resume file storage: "azure", "local" or "memory" (tests; files are lost on restart)
+    RESUME_STORAGE_BACKEND = os.getenv("RESUME_STORAGE_BACKEND", "azure")
+    LOCAL_STORAGE_PATH = os.getenv("LOCAL_STORAGE_PATH", "storage/resumes")
+    # Simulated per-operation latency of the "memory" backend
+    MEMORY_STORAGE_LATENCY_MS = float(os.getenv("MEMORY_STORAGE_LATENCY_MS", "0"))
+    STORAGE_DOWNLOAD_CHUNK_SIZE = int(os.getenv("STORAGE_DOWNLOAD_CHUNK_SIZE", str(256 * 1024)))
+
+    # Resume uploads
+    MAX_RESUME_UPLOAD_BYTES = int(os.getenv("MAX_RESUME_UPLOAD_BYTES", str(10 * 1024 * 1024)))
+    UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(256 * 1024)))
+    UPLOAD_TMP_DIR = os.getenv("UPLOAD_TMP_DIR", "")
+
+    # Bulk resume import
+    BULK_MAX_FILES = int(os.getenv("BULK_MAX_FILES", "500"))
+    BULK_MAX_UPLOAD_BYTES = int(os.getenv("BULK_MAX_UPLOAD_BYTES", str(500 * 1024 * 1024)))
+    BULK_IMPORT_CONCURRENCY = int(os.getenv("BULK_IMPORT_CONCURRENCY", "4"))
+    BULK_IMPORT_DB_BATCH_SIZE = int(os.getenv("BULK_IMPORT_DB_BATCH_SIZE", "20"))
 
     # Allowed hosts
     ALLOWED_HOSTS = os.getenv("ALLOWED_HOSTS", "http://localhost:5173,http://127.0.0.1").split(",")
@@ -30,6 +100,73 @@ class BackendConfig:
 
     #Bank for exchange rate
     NATIONAL_BANK_API_URL = os.getenv("NATIONAL_BANK_API_URL", "") 
+    EXCHANGE_RATE_TTL_SECONDS = float(os.getenv("EXCHANGE_RATE_TTL_SECONDS", "3600"))
+    EXCHANGE_RATE_MAX_STALE_SECONDS = float(os.getenv("EXCHANGE_RATE_MAX_STALE_SECONDS", str(3 * 24 * 3600)))
+    EXCHANGE_RATE_TIMEOUT_SECONDS = float(os.getenv("EXCHANGE_RATE_TIMEOUT_SECONDS", "10"))
+    EXCHANGE_RATE_REFRESH_INTERVAL_SECONDS = float(os.getenv("EXCHANGE_RATE_REFRESH_INTERVAL_SECONDS", "0"))
+
+    # Resume analysis cache (keyed by PDF content hash)
+    RESUME_CACHE_MAX_SIZE = int(os.getenv("RESUME_CACHE_MAX_SIZE", "1000"))
+    RESUME_CACHE_TTL_SECONDS = int(os.getenv("RESUME_CACHE_TTL_SECONDS", "86400"))
+
+    # Resume text preprocessing before LLM analysis
+    RESUME_TOKEN_BUDGET = int(os.getenv("RESUME_TOKEN_BUDGET", "3000"))
+    RESUME_TOKENIZER_ENCODING = os.getenv("RESUME_TOKENIZER_ENCODING", "cl100k_base")
+
+    # Vacancy classification cache: in-process LRU plus an optional tier in the database
+    VACANCY_CLASSIFICATION_CACHE_MAX_SIZE = int(os.getenv("VACANCY_CLASSIFICATION_CACHE_MAX_SIZE", "1000"))
+    VACANCY_CLASSIFICATION_CACHE_TTL_SECONDS = int(os.getenv("VACANCY_CLASSIFICATION_CACHE_TTL_SECONDS", str(7 * 86400)))
+    VACANCY_CLASSIFICATION_DB_CACHE: bool = os.getenv("VACANCY_CLASSIFICATION_DB_CACHE", "True").upper() == "TRUE"
+
+    # PDF text extraction (process pool)
+    PDF_EXTRACTION_WORKERS = int(os.getenv("PDF_EXTRACTION_WORKERS", "2"))
+    PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", "30"))
+    PDF_EXTRACTION_TIMEOUT_SECONDS = float(os.getenv("PDF_EXTRACTION_TIMEOUT_SECONDS", "15"))
+    PDF_EXTRACTION_MAX_TASKS_PER_CHILD = int(os.getenv("PDF_EXTRACTION_MAX_TASKS_PER_CHILD", "200"))
+
+    # Background resume ingestion
+    INGESTION_WORKERS = int(os.getenv("INGESTION_WORKERS", "2"))
+    INGESTION_POLL_INTERVAL_SECONDS = float(os.getenv("INGESTION_POLL_INTERVAL_SECONDS", "2"))
+    INGESTION_LEASE_SECONDS = int(os.getenv("INGESTION_LEASE_SECONDS", "300"))
+    INGESTION_MAX_ATTEMPTS = int(os.getenv("INGESTION_MAX_ATTEMPTS", "3"))
+
+    # Background re-scoring of pending applications after vacancy or resume edits
+    RESCORING_WORKERS = int(os.getenv("RESCORING_WORKERS", "1"))
+    RESCORING_POLL_INTERVAL_SECONDS = float(os.getenv("RESCORING_POLL_INTERVAL_SECONDS", "5"))
+    # Edits of the same vacancy or resume within this window are coalesced into one pass
+    RESCORING_DEBOUNCE_SECONDS = float(os.getenv("RESCORING_DEBOUNCE_SECONDS", "30"))
+    RESCORING_CHUNK_SIZE = int(os.getenv("RESCORING_CHUNK_SIZE", "50"))
+    RESCORING_LEASE_SECONDS = int(os.getenv("RESCORING_LEASE_SECONDS", "300"))
+    RESCORING_MAX_ATTEMPTS = int(os.getenv("RESCORING_MAX_ATTEMPTS", "5"))
+
+    # Embeddings of resumes and vacancies for semantic candidate search
+    EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "hashing")  # hashing (offline) or azure
+    AZURE_OPENAI_EMBEDDING_DEPLOYMENT = os.getenv("AZURE_OPENAI_EMBEDDING_DEPLOYMENT", "")
+    EMBEDDING_DIMENSIONS = int(os.getenv("EMBEDDING_DIMENSIONS", "256"))
+    # Below this many vectors the index is searched exhaustively, above it an IVF index is trained on load
+    EMBEDDING_IVF_MIN_SIZE = int(os.getenv("EMBEDDING_IVF_MIN_SIZE", "20000"))
+    EMBEDDING_IVF_LISTS = int(os.getenv("EMBEDDING_IVF_LISTS", "0"))  # 0: sqrt of the number of vectors
+    EMBEDDING_IVF_PROBES = int(os.getenv("EMBEDDING_IVF_PROBES", "32"))
+    EMBEDDING_LOAD_BATCH_SIZE = int(os.getenv("EMBEDDING_LOAD_BATCH_SIZE", "10000"))
+    # Picks up vectors written by other processes
+    EMBEDDING_INDEX_REFRESH_SECONDS = float(os.getenv("EMBEDDING_INDEX_REFRESH_SECONDS", "60"))
+
+    # Vacancy recommendations for job seekers
+    RECOMMENDATION_CACHE_MAX_SIZE = int(os.getenv("RECOMMENDATION_CACHE_MAX_SIZE", "10000"))
+    RECOMMENDATION_CACHE_TTL_SECONDS = int(os.getenv("RECOMMENDATION_CACHE_TTL_SECONDS", "600"))
+    # Ranked vacancies kept per user; a page is cut from them after removing vacancies the user applied to
+    RECOMMENDATION_CACHE_DEPTH = int(os.getenv("RECOMMENDATION_CACHE_DEPTH", "200"))
+    # Accepted vacancies are re-read at least this often, for changes made by other processes
+    RECOMMENDATION_CATALOG_MAX_AGE_SECONDS = float(os.getenv("RECOMMENDATION_CATALOG_MAX_AGE_SECONDS", "60"))
+
+    # Full-text vacancy search ranks the newest matches in windows of this size, so a query matching
+    # most vacancies does not rank all of them; up to this many matches the order is exact
+    VACANCY_SEARCH_RANK_WINDOW = int(os.getenv("VACANCY_SEARCH_RANK_WINDOW", "1000"))
+
+    # Batch re-analysis of resumes after prompt changes
+    REANALYSIS_CONCURRENCY = int(os.getenv("REANALYSIS_CONCURRENCY", "4"))
+    REANALYSIS_BATCH_SIZE = int(os.getenv("REANALYSIS_BATCH_SIZE", "50"))
+    REANALYSIS_CHECKPOINT_PATH = os.getenv("REANALYSIS_CHECKPOINT_PATH", "reanalysis_checkpoint.json")
     
     def configure_logging(self):
         if self.LOGTAIL_SOURCE_TOKEN:
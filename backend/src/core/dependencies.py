@@ -11,6 +11,7 @@ from src.modules.auth.dependencies import (
 )
 from src.models import User, HR, Admin
 from src.modules.auth.service import AuthService
+from src.core.llm_metrics import set_request_user_type
 
 
 async def get_current_user(
@@ -31,6 +32,7 @@ async def get_current_user(
 
         if not user_id or not user_type:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload")
+        set_request_user_type(user_type)
 
         if user_type == "user":
             user = await user_service.get_user_by_id(db, user_id)
@@ -0,0 +1,283 @@
+"""
+Offline stand-ins for AzureChatOpenAI, selected with LLM_BACKEND:
+
+- "fake": FakeChatModel answers every prompt of the app with a deterministic, well-formed response
+  after a simulated latency, streams it at a fixed token rate and fails at a configured rate.
+- "record": calls Azure OpenAI and appends every response to LLM_FIXTURES_PATH.
+- "replay": answers from LLM_FIXTURES_PATH; prompts that were not recorded go to FakeChatModel.
+
+Responses depend only on the prompt, latencies and failures on FAKE_LLM_SEED and the call order,
+so two runs with the same settings see the same load.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import PrivateAttr
+from src.core.config import BackendConfig
+
+_BATCH_ID_RE = re.compile(r"\[id=(\d+)\]")
+_FAKE_SKILLS = ["Python", "SQL", "FastAPI", "Docker", "PostgreSQL", "Git", "Linux", "Excel", "Java", "React"]
+_FAKE_GRADES = ["Junior", "Middle", "Senior"]
+
+
+class FakeLLMError(Exception):
+    """Raised by FakeChatModel for simulated provider failures."""
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def prompt_text(messages: List[BaseMessage]) -> str:
+    return "\n".join(f"{message.type}: {message.content}" for message in messages)
+
+
+def prompt_key(messages: List[BaseMessage]) -> str:
+    return hashlib.sha256(prompt_text(messages).encode("utf-8")).hexdigest()
+
+
+def estimate_token_count(text: str) -> int:
+    return max(1, (len(text) + 3) // 4)
+
+
+def fake_response(prompt: str) -> str:
+    """A well-formed answer for each prompt the app sends, derived from the prompt's hash."""
+    digest = hashlib.sha256(prompt.encode("utf-8")).digest()
+
+    if "анализируешь резюме" in prompt:
+        experience = digest[0] % 12
+        skills = [skill for i, skill in enumerate(_FAKE_SKILLS) if digest[1 + i] % 3 == 0] or _FAKE_SKILLS[:2]
+        min_salary = 300000 + (digest[12] % 20) * 50000
+        return json.dumps({
+            "first_name": "Алихан",
+            "last_name": "Нурсеитов",
+            "email": f"candidate{digest[13]}@example.com",
+            "phone": None,
+            "experience_time": float(experience),
+            "profession": "Software Engineer",
+            "education": "КазНУ, Информационные технологии",
+            "skills": skills,
+            "awards": [],
+            "projects": [],
+            "courses": [],
+            "languages": {"Русский": "C2", "Английский": "B2"},
+            "summary": f"Разработчик с опытом {experience} лет.",
+            "grade": _FAKE_GRADES[min(experience // 3, 2)],
+            "min_salary": float(min_salary),
+            "max_salary": float(min_salary + 200000),
+            "currency": "KZT"
+        }, ensure_ascii=False)
+
+    if "классификации вакансий" in prompt:
+        return json.dumps([
+            {"profession": "Software Engineer", "grade": _FAKE_GRADES[digest[0] % 3]},
+            {"profession": "Backend Developer", "grade": _FAKE_GRADES[digest[1] % 3]},
+            {"profession": "Data Engineer", "grade": "не указано"}
+        ], ensure_ascii=False)
+
+    if '"results"' in prompt:
+        ids = [int(item_id) for item_id in _BATCH_ID_RE.findall(prompt)]
+        return json.dumps({"results": [
+            {"id": item_id, "score": 30 + (digest[i % len(digest)] + item_id) % 66, "analysis": "Частичное совпадение навыков."}
+            for i, item_id in enumerate(ids)
+        ]}, ensure_ascii=False)
+
+    if "Соответствие:" in prompt:
+        return (
+            f"- Соответствие: {30 + digest[0] % 66}\n"
+            "- Пояснение: Кандидат владеет частью требуемых навыков. "
+            "Стоит углубить знания в недостающих технологиях и получить практический опыт на проектах."
+        )
+
+    return "OK"
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    Deterministic chat model for load tests without Azure OpenAI.
+
+    Time to first token is drawn from latency_distribution ("fixed", "uniform" or "lognormal",
+    centred on latency_ms with relative spread latency_spread); the answer then takes
+    output tokens / tokens_per_second. A share error_rate of calls fails with a simulated 429 or 500.
+    """
+    latency_ms: float = BackendConfig.FAKE_LLM_LATENCY_MS
+    latency_distribution: str = BackendConfig.FAKE_LLM_LATENCY_DISTRIBUTION
+    latency_spread: float = BackendConfig.FAKE_LLM_LATENCY_SPREAD
+    tokens_per_second: float = BackendConfig.FAKE_LLM_TOKENS_PER_SECOND
+    error_rate: float = BackendConfig.FAKE_LLM_ERROR_RATE
+    seed: int = BackendConfig.FAKE_LLM_SEED
+    temperature: float = 0.0
+
+    _rng: Optional[random.Random] = PrivateAttr(default=None)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat"
+
+    def _sample(self) -> tuple[float, float, Optional[FakeLLMError]]:
+        """(seconds to first token, seconds per output token, simulated error) for one call."""
+        with self._lock:
+            if self._rng is None:
+                self._rng = random.Random(self.seed)
+            rng = self._rng
+            if self.latency_distribution == "uniform":
+                latency = rng.uniform(1 - self.latency_spread, 1 + self.latency_spread) * self.latency_ms
+            elif self.latency_distribution == "lognormal":
+                latency = rng.lognormvariate(0, self.latency_spread) * self.latency_ms
+            else:
+                latency = self.latency_ms
+            error = None
+            if rng.random() < self.error_rate:
+                error = FakeLLMError(429, "Simulated rate limit") if rng.random() < 0.5 else FakeLLMError(500, "Simulated server error")
+        per_token = 1 / self.tokens_per_second if self.tokens_per_second > 0 else 0.0
+        return max(latency, 0.0) / 1000, per_token, error
+
+    def _result(self, messages: List[BaseMessage], answer: str) -> ChatResult:
+        message = AIMessage(
+            content=answer,
+            usage_metadata={
+                "input_tokens": estimate_token_count(prompt_text(messages)),
+                "output_tokens": estimate_token_count(answer),
+                "total_tokens": estimate_token_count(prompt_text(messages)) + estimate_token_count(answer)
+            }
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    @staticmethod
+    def _pieces(answer: str) -> List[str]:
+        # About one token per piece
+        return [answer[i:i + 4] for i in range(0, len(answer), 4)]
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager=None, **kwargs: Any) -> ChatResult:
+        answer = fake_response(prompt_text(messages))
+        latency, per_token, error = self._sample()
+        time.sleep(latency)
+        if error:
+            raise error
+        time.sleep(per_token * estimate_token_count(answer))
+        return self._result(messages, answer)
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager=None, **kwargs: Any) -> ChatResult:
+        answer = fake_response(prompt_text(messages))
+        latency, per_token, error = self._sample()
+        await asyncio.sleep(latency)
+        if error:
+            raise error
+        await asyncio.sleep(per_token * estimate_token_count(answer))
+        return self._result(messages, answer)
+
+    def _stream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager=None, **kwargs: Any) -> Iterator[ChatGenerationChunk]:
+        answer = fake_response(prompt_text(messages))
+        latency, per_token, error = self._sample()
+        time.sleep(latency)
+        if error:
+            raise error
+        for piece in self._pieces(answer):
+            yield ChatGenerationChunk(message=AIMessageChunk(content=piece))
+            time.sleep(per_token)
+
+    async def _astream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager=None, **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        answer = fake_response(prompt_text(messages))
+        latency, per_token, error = self._sample()
+        await asyncio.sleep(latency)
+        if error:
+            raise error
+        for piece in self._pieces(answer):
+            yield ChatGenerationChunk(message=AIMessageChunk(content=piece))
+            await asyncio.sleep(per_token)
+
+
+class FixtureStore:
+    """Recorded responses in a JSON Lines file, one {"key", "prompt", "response"} object per line."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._responses: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._responses[entry["key"]] = entry["response"]
+            logging.info(f"[LLM FIXTURES] Loaded {len(self._responses)} recorded responses from {path}")
+
+    def get(self, key: str) -> Optional[str]:
+        return self._responses.get(key)
+
+    def add(self, key: str, prompt: str, response: str):
+        with self._lock:
+            if key in self._responses:
+                return
+            self._responses[key] = response
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"key": key, "prompt": prompt[:500], "response": response}, ensure_ascii=False) + "\n")
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+
+_fixture_stores: Dict[str, FixtureStore] = {}
+
+
+def get_fixture_store(path: str = BackendConfig.LLM_FIXTURES_PATH) -> FixtureStore:
+    """One store per file, shared by the analysis and matching models."""
+    if path not in _fixture_stores:
+        _fixture_stores[path] = FixtureStore(path)
+    return _fixture_stores[path]
+
+
+class RecordReplayChatModel(BaseChatModel):
+    """
+    mode="record": forwards to `inner` and records each response.
+    mode="replay": answers from the fixtures; unrecorded prompts go to `fallback`, or fail if it is not set.
+    """
+    mode: str = "replay"
+    fixtures_path: str = BackendConfig.LLM_FIXTURES_PATH
+    inner: Optional[BaseChatModel] = None
+    fallback: Optional[BaseChatModel] = None
+
+    @property
+    def _llm_type(self) -> str:
+        return f"{self.mode}-chat"
+
+    def _replayed(self, messages: List[BaseMessage]) -> Optional[ChatResult]:
+        response = get_fixture_store(self.fixtures_path).get(prompt_key(messages))
+        if response is None:
+            return None
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=response))])
+
+    def _record(self, messages: List[BaseMessage], message: BaseMessage) -> ChatResult:
+        get_fixture_store(self.fixtures_path).add(prompt_key(messages), prompt_text(messages), message.content)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _model_for_miss(self, messages: List[BaseMessage]) -> BaseChatModel:
+        if self.mode == "record":
+            return self.inner
+        if self.fallback is None:
+            raise LookupError(f"No recorded response for prompt {prompt_key(messages)[:12]} in {self.fixtures_path}")
+        return self.fallback
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager=None, **kwargs: Any) -> ChatResult:
+        if self.mode == "replay" and (result := self._replayed(messages)):
+            return result
+        message = self._model_for_miss(messages).invoke(messages, stop=stop, **kwargs)
+        return self._record(messages, message) if self.mode == "record" else ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager=None, **kwargs: Any) -> ChatResult:
+        if self.mode == "replay" and (result := self._replayed(messages)):
+            return result
+        message = await self._model_for_miss(messages).ainvoke(messages, stop=stop, **kwargs)
+        return self._record(messages, message) if self.mode == "record" else ChatResult(generations=[ChatGeneration(message=message)])
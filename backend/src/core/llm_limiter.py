@@ -0,0 +1,289 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, AsyncIterator, Dict, List, Optional
+from fastapi import HTTPException
+from src.core.config import BackendConfig
+from src.core.llm_metrics import current_llm_call_site
+
+
+class LLMPriority(IntEnum):
+    """Lower value is served first."""
+    interactive = 0  # a user is waiting on the response, e.g. vacancy classification
+    standard = 1     # regular request handling: resume upload, application matching
+    bulk = 2         # background work: ingestion queue, bulk import, re-analysis, re-scoring
+
+
+# Priority of LLM calls made from the current task; background workers set it once for their task
+llm_priority: ContextVar[LLMPriority] = ContextVar("llm_priority", default=LLMPriority.standard)
+
+
+@contextmanager
+def use_llm_priority(priority: LLMPriority):
+    """Tasks created inside the block inherit the priority."""
+    token = llm_priority.set(priority)
+    try:
+        yield
+    finally:
+        llm_priority.reset(token)
+
+
+def estimate_tokens(text: str, completion_tokens: int = 0) -> int:
+    """Rough prompt size (about 4 characters per token) plus the expected completion."""
+    return (len(text or "") + 3) // 4 + completion_tokens
+
+
+class LLMOverloadedError(HTTPException):
+    def __init__(self, retry_after: int):
+        super().__init__(
+            status_code=503,
+            detail="AI service is busy, please retry later",
+            headers={"Retry-After": str(retry_after)}
+        )
+
+
+@dataclass(eq=False)
+class _Waiter:
+    call_site: str
+    tokens: int
+    future: asyncio.Future
+
+
+@dataclass
+class _CallSiteMetrics:
+    requests: int = 0
+    started: int = 0
+    rejected: int = 0
+    timed_out: int = 0
+    errors: int = 0
+    waiting: int = 0
+    in_flight: int = 0
+    estimated_tokens: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    total_call_seconds: float = 0.0
+    wait_samples: List[float] = field(default_factory=list)
+
+    def record_wait(self, seconds: float):
+        self.started += 1
+        self.total_wait_seconds += seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+        self.wait_samples.append(seconds)
+        if len(self.wait_samples) > 1000:
+            del self.wait_samples[:500]
+
+    def stats(self) -> Dict[str, Any]:
+        samples = sorted(self.wait_samples)
+        return {
+            "requests": self.requests,
+            "started": self.started,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "errors": self.errors,
+            "waiting": self.waiting,
+            "in_flight": self.in_flight,
+            "estimated_tokens": self.estimated_tokens,
+            "avg_wait_seconds": round(self.total_wait_seconds / self.started, 4) if self.started else 0.0,
+            "p95_wait_seconds": round(samples[int(len(samples) * 0.95) - 1], 4) if len(samples) >= 20 else None,
+            "max_wait_seconds": round(self.max_wait_seconds, 4),
+            "avg_call_seconds": round(self.total_call_seconds / self.started, 4) if self.started else 0.0,
+        }
+
+
+class LLMLimiter:
+    """
+    Process-wide gate in front of every Azure OpenAI call.
+
+    A call starts when fewer than max_concurrency calls are in flight and both token buckets
+    (requests per minute and estimated tokens per minute) have room; otherwise it waits in a
+    priority queue, so interactive calls overtake bulk work. The queue is bounded: when it is full,
+    or a call waits longer than max_wait_seconds, a 503 with Retry-After is raised instead of
+    letting requests pile up behind provider 429s. A limit of 0 disables that limit.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = BackendConfig.LLM_MAX_CONCURRENCY,
+        requests_per_minute: int = BackendConfig.LLM_REQUESTS_PER_MINUTE,
+        tokens_per_minute: int = BackendConfig.LLM_TOKENS_PER_MINUTE,
+        max_queue_size: int = BackendConfig.LLM_MAX_QUEUE_SIZE,
+        max_wait_seconds: float = BackendConfig.LLM_MAX_WAIT_SECONDS
+    ):
+        self.max_concurrency = max_concurrency
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_queue_size = max_queue_size
+        self.max_wait_seconds = max_wait_seconds
+
+        self._request_budget = float(requests_per_minute)
+        self._token_budget = float(tokens_per_minute)
+        self._refilled_at = time.monotonic()
+        self._waiters: List[tuple[int, int, _Waiter]] = []
+        self._sequence = itertools.count()
+        self._queued = 0
+        self._in_flight = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._call_sites: Dict[str, _CallSiteMetrics] = {}
+        self._avg_call_seconds = 5.0
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._refilled_at
+        self._refilled_at = now
+        if self.requests_per_minute:
+            self._request_budget = min(self.requests_per_minute, self._request_budget + elapsed * self.requests_per_minute / 60)
+        if self.tokens_per_minute:
+            self._token_budget = min(self.tokens_per_minute, self._token_budget + elapsed * self.tokens_per_minute / 60)
+
+    def _budget_delay(self, tokens: int) -> float:
+        """Seconds until both buckets can cover a call of `tokens` tokens; 0 if it can start now."""
+        delay = 0.0
+        if self.requests_per_minute and self._request_budget < 1:
+            delay = max(delay, (1 - self._request_budget) * 60 / self.requests_per_minute)
+        if self.tokens_per_minute and self._token_budget < tokens:
+            delay = max(delay, (tokens - self._token_budget) * 60 / self.tokens_per_minute)
+        return delay
+
+    def _has_slot(self) -> bool:
+        return not self.max_concurrency or self._in_flight < self.max_concurrency
+
+    def _take(self, tokens: int):
+        if self.requests_per_minute:
+            self._request_budget -= 1
+        if self.tokens_per_minute:
+            self._token_budget -= tokens
+        self._in_flight += 1
+
+    def _dispatch(self):
+        self._refill()
+        while self._waiters:
+            _, _, waiter = self._waiters[0]
+            if waiter.future.done():
+                # Timed out or cancelled while queued
+                heapq.heappop(self._waiters)
+                continue
+            if not self._has_slot():
+                return
+            delay = self._budget_delay(waiter.tokens)
+            if delay > 0:
+                self._schedule(delay)
+                return
+            heapq.heappop(self._waiters)
+            self._take(waiter.tokens)
+            waiter.future.set_result(None)
+
+    def _schedule(self, delay: float):
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = asyncio.get_running_loop().call_later(delay, self._on_timer)
+
+    def _on_timer(self):
+        self._timer = None
+        self._dispatch()
+
+    def _release(self):
+        self._in_flight -= 1
+        self._dispatch()
+
+    def _retry_after(self) -> int:
+        slots = self.max_concurrency or 1
+        return max(1, min(60, math.ceil(self._queued * self._avg_call_seconds / slots)))
+
+    def _metrics(self, call_site: str) -> _CallSiteMetrics:
+        metrics = self._call_sites.get(call_site)
+        if metrics is None:
+            metrics = self._call_sites[call_site] = _CallSiteMetrics()
+        return metrics
+
+    async def _acquire(self, call_site: str, tokens: int, priority: LLMPriority, metrics: _CallSiteMetrics):
+        self._refill()
+        if not self._waiters and self._has_slot() and self._budget_delay(tokens) == 0:
+            self._take(tokens)
+            return
+
+        if self.max_queue_size and self._queued >= self.max_queue_size:
+            metrics.rejected += 1
+            retry_after = self._retry_after()
+            logging.warning(f"[LLM LIMITER] Queue full ({self._queued}), rejecting {call_site}, retry after {retry_after}s")
+            raise LLMOverloadedError(retry_after)
+
+        waiter = _Waiter(call_site, tokens, asyncio.get_running_loop().create_future())
+        heapq.heappush(self._waiters, (int(priority), next(self._sequence), waiter))
+        self._queued += 1
+        metrics.waiting += 1
+        self._dispatch()
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), timeout=self.max_wait_seconds or None)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Granted at the same moment: hand the slot back
+                self._release()
+            else:
+                waiter.future.cancel()
+            if isinstance(e, asyncio.TimeoutError):
+                metrics.timed_out += 1
+                retry_after = self._retry_after()
+                logging.warning(f"[LLM LIMITER] {call_site} waited over {self.max_wait_seconds}s, retry after {retry_after}s")
+                raise LLMOverloadedError(retry_after)
+            raise
+        finally:
+            self._queued -= 1
+            metrics.waiting -= 1
+
+    @asynccontextmanager
+    async def limit(
+        self,
+        call_site: str,
+        estimated_tokens: int = 0,
+        priority: Optional[LLMPriority] = None
+    ) -> AsyncIterator[None]:
+        """
+        Holds an LLM slot for the duration of the block.
+        Priority defaults to the one set for the current task with use_llm_priority.
+        """
+        priority = llm_priority.get() if priority is None else priority
+        tokens = min(estimated_tokens, self.tokens_per_minute) if self.tokens_per_minute else estimated_tokens
+        metrics = self._metrics(call_site)
+        metrics.requests += 1
+
+        queued_at = time.monotonic()
+        await self._acquire(call_site, tokens, priority, metrics)
+        started_at = time.monotonic()
+        metrics.record_wait(started_at - queued_at)
+        metrics.estimated_tokens += tokens
+        metrics.in_flight += 1
+        call_site_token = current_llm_call_site.set(call_site)
+        try:
+            yield
+        except Exception:
+            metrics.errors += 1
+            raise
+        finally:
+            current_llm_call_site.reset(call_site_token)
+            elapsed = time.monotonic() - started_at
+            metrics.in_flight -= 1
+            metrics.total_call_seconds += elapsed
+            self._avg_call_seconds = 0.9 * self._avg_call_seconds + 0.1 * elapsed
+            self._release()
+
+    def stats(self) -> Dict[str, Any]:
+        self._refill()
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self._in_flight,
+            "queue_depth": self._queued,
+            "max_queue_size": self.max_queue_size,
+            "requests_budget": round(self._request_budget, 1) if self.requests_per_minute else None,
+            "tokens_budget": round(self._token_budget) if self.tokens_per_minute else None,
+            "call_sites": {name: metrics.stats() for name, metrics in self._call_sites.items()},
+        }
+
+
+llm_limiter = LLMLimiter()
@@ -0,0 +1,283 @@
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+import httpx
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.outputs import LLMResult
+from src.core.config import BackendConfig
+
+# Set by LLMLimiter.limit for the duration of a call, so HTTP-level retries can be attributed to it
+current_llm_call_site: ContextVar[Optional[str]] = ContextVar("current_llm_call_site", default=None)
+
+
+def estimate_cost(prompt_tokens: int, completion_tokens: int) -> float:
+    return (
+        prompt_tokens * BackendConfig.LLM_PROMPT_COST_PER_1K
+        + completion_tokens * BackendConfig.LLM_COMPLETION_COST_PER_1K
+    ) / 1000
+
+
+def response_for_log(response: Any) -> str:
+    """Model output is logged in full only with LLM_LOG_RESPONSES (it contains candidates' personal data)."""
+    text = str(response)
+    return text if BackendConfig.LLM_LOG_RESPONSES else f"<{len(text)} chars>"
+
+
+@dataclass
+class RequestLLMUsage:
+    """LLM usage of one HTTP request, filled in by the callback and logged when the request ends."""
+    user_type: str = "anonymous"
+    calls: int = 0
+    errors: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost: float = 0.0
+    seconds: float = 0.0
+    call_sites: Dict[str, int] = field(default_factory=dict)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "user_type": self.user_type,
+            "calls": self.calls,
+            "errors": self.errors,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "cost": round(self.cost, 6),
+            "llm_seconds": round(self.seconds, 3),
+            "call_sites": self.call_sites,
+        }
+
+
+current_llm_usage: ContextVar[Optional[RequestLLMUsage]] = ContextVar("current_llm_usage", default=None)
+
+
+def set_request_user_type(user_type: str):
+    usage = current_llm_usage.get()
+    if usage is not None:
+        usage.user_type = user_type
+
+
+@dataclass
+class _UsageMetrics:
+    calls: int = 0
+    errors: int = 0
+    retries: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    # Calls whose token counts were estimated from text because the provider did not report usage
+    estimated_usage: int = 0
+    cost: float = 0.0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    latency_samples: List[float] = field(default_factory=list)
+    first_token_samples: List[float] = field(default_factory=list)
+
+    @staticmethod
+    def _keep(samples: List[float], value: float):
+        samples.append(value)
+        if len(samples) > 1000:
+            del samples[:500]
+
+    @staticmethod
+    def _p95(samples: List[float]) -> Optional[float]:
+        if len(samples) < 20:
+            return None
+        return round(sorted(samples)[int(len(samples) * 0.95) - 1], 4)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "retries": self.retries,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "estimated_usage": self.estimated_usage,
+            "cost": round(self.cost, 6),
+            "avg_seconds": round(self.total_seconds / self.calls, 4) if self.calls else 0.0,
+            "p95_seconds": self._p95(self.latency_samples),
+            "max_seconds": round(self.max_seconds, 4),
+            "p95_first_token_seconds": self._p95(self.first_token_samples),
+        }
+
+
+@dataclass
+class _Run:
+    call_site: str
+    prompt_version: str
+    user_type: str
+    usage: Optional[RequestLLMUsage]
+    started_at: float
+    estimated_prompt_tokens: int
+    first_token_at: Optional[float] = None
+
+
+class LLMMetrics(AsyncCallbackHandler):
+    """
+    LangChain callback passed to every model invocation through llm_run_config.
+    Records tokens (as reported by the provider, estimated from text otherwise), latency,
+    time to first token when streaming, errors and estimated cost, grouped by call site,
+    user type and prompt version, and adds each call to the current request's usage.
+    """
+
+    def __init__(self):
+        self._runs: Dict[UUID, _Run] = {}
+        self._metrics: Dict[tuple, _UsageMetrics] = {}
+        self._retries: Dict[str, int] = {}
+
+    def _start(self, run_id: UUID, metadata: Optional[dict], prompt_chars: int):
+        metadata = metadata or {}
+        usage = current_llm_usage.get()
+        self._runs[run_id] = _Run(
+            call_site=metadata.get("call_site") or "unknown",
+            prompt_version=metadata.get("prompt_version") or "-",
+            user_type=usage.user_type if usage else "background",
+            usage=usage,
+            started_at=time.monotonic(),
+            estimated_prompt_tokens=(prompt_chars + 3) // 4
+        )
+
+    async def on_chat_model_start(self, serialized, messages, *, run_id: UUID, metadata: Optional[dict] = None, **kwargs: Any):
+        self._start(run_id, metadata, sum(len(str(message.content)) for batch in messages for message in batch))
+
+    async def on_llm_start(self, serialized, prompts, *, run_id: UUID, metadata: Optional[dict] = None, **kwargs: Any):
+        self._start(run_id, metadata, sum(len(prompt) for prompt in prompts))
+
+    async def on_llm_new_token(self, token: str, *, run_id: UUID, **kwargs: Any):
+        run = self._runs.get(run_id)
+        if run and run.first_token_at is None:
+            run.first_token_at = time.monotonic()
+
+    async def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any):
+        run = self._runs.pop(run_id, None)
+        if run is None:
+            return
+        usage = self._token_usage(response)
+        if usage is None:
+            text = "".join(generation.text for generations in response.generations for generation in generations)
+            self._record(run, run.estimated_prompt_tokens, (len(text) + 3) // 4, error=False, estimated=True)
+        else:
+            self._record(run, *usage, error=False, estimated=False)
+
+    async def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any):
+        run = self._runs.pop(run_id, None)
+        if run is not None:
+            # Prompt tokens of a failed call are usually billed as well
+            self._record(run, run.estimated_prompt_tokens, 0, error=True, estimated=True)
+
+    @staticmethod
+    def _token_usage(response: LLMResult) -> Optional[tuple[int, int]]:
+        token_usage = (response.llm_output or {}).get("token_usage") or {}
+        if token_usage.get("prompt_tokens") is not None:
+            return token_usage["prompt_tokens"], token_usage.get("completion_tokens") or 0
+        for generations in response.generations:
+            for generation in generations:
+                usage_metadata = getattr(getattr(generation, "message", None), "usage_metadata", None)
+                if usage_metadata:
+                    return usage_metadata.get("input_tokens", 0), usage_metadata.get("output_tokens", 0)
+        return None
+
+    def _record(self, run: _Run, prompt_tokens: int, completion_tokens: int, error: bool, estimated: bool):
+        finished_at = time.monotonic()
+        seconds = finished_at - run.started_at
+        cost = estimate_cost(prompt_tokens, completion_tokens)
+
+        key = (run.call_site, run.user_type, run.prompt_version)
+        metrics = self._metrics.get(key)
+        if metrics is None:
+            metrics = self._metrics[key] = _UsageMetrics()
+        metrics.calls += 1
+        metrics.errors += int(error)
+        metrics.retries += self._retries.pop(run.call_site, 0)
+        metrics.prompt_tokens += prompt_tokens
+        metrics.completion_tokens += completion_tokens
+        metrics.estimated_usage += int(estimated)
+        metrics.cost += cost
+        metrics.total_seconds += seconds
+        metrics.max_seconds = max(metrics.max_seconds, seconds)
+        metrics._keep(metrics.latency_samples, seconds)
+        if run.first_token_at is not None:
+            metrics._keep(metrics.first_token_samples, run.first_token_at - run.started_at)
+
+        if run.usage is not None:
+            run.usage.calls += 1
+            run.usage.errors += int(error)
+            run.usage.prompt_tokens += prompt_tokens
+            run.usage.completion_tokens += completion_tokens
+            run.usage.cost += cost
+            run.usage.seconds += seconds
+            run.usage.call_sites[run.call_site] = run.usage.call_sites.get(run.call_site, 0) + 1
+
+        logging.info(
+            f"[LLM CALL] {run.call_site} ({run.prompt_version}, {run.user_type}): {seconds:.2f}s, "
+            f"{prompt_tokens}+{completion_tokens} tokens{' (estimated)' if estimated else ''}, "
+            f"cost {cost:.5f}{', failed' if error else ''}"
+        )
+
+    async def on_http_response(self, response: httpx.Response):
+        """httpx response hook: failed attempts to the model endpoint are retried by the OpenAI client."""
+        call_site = current_llm_call_site.get()
+        if call_site and (response.status_code == 429 or response.status_code >= 500):
+            self._retries[call_site] = self._retries.get(call_site, 0) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        entries = [
+            {"call_site": call_site, "user_type": user_type, "prompt_version": prompt_version, **metrics.stats()}
+            for (call_site, user_type, prompt_version), metrics in sorted(self._metrics.items())
+        ]
+        return {
+            "total_calls": sum(entry["calls"] for entry in entries),
+            "total_tokens": sum(entry["prompt_tokens"] + entry["completion_tokens"] for entry in entries),
+            "total_cost": round(sum(entry["cost"] for entry in entries), 6),
+            "by_call_site": entries,
+        }
+
+
+llm_metrics = LLMMetrics()
+
+
+def llm_run_config(call_site: str, prompt_version: Optional[str] = None) -> Dict[str, Any]:
+    """Config for chain.ainvoke/astream: attaches the metrics callback and the tags it groups by."""
+    return {
+        "callbacks": [llm_metrics],
+        "run_name": call_site,
+        "metadata": {"call_site": call_site, "prompt_version": prompt_version},
+    }
+
+
+class LLMUsageMiddleware:
+    """
+    Collects the LLM usage of each request, returns it in X-LLM-* headers (calls made before
+    the response started) and logs a summary when the response is finished, streams included.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        usage = RequestLLMUsage()
+        token = current_llm_usage.set(usage)
+
+        async def send_with_usage(message):
+            if message["type"] == "http.response.start" and usage.calls:
+                headers = list(message.get("headers", []))
+                headers += [
+                    (b"x-llm-calls", str(usage.calls).encode()),
+                    (b"x-llm-tokens", str(usage.prompt_tokens + usage.completion_tokens).encode()),
+                    (b"x-llm-cost", f"{usage.cost:.6f}".encode()),
+                ]
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_usage)
+        finally:
+            current_llm_usage.reset(token)
+            if usage.calls:
+                logging.info(f"[LLM USAGE] {scope['method']} {scope['path']}: {usage.summary()}")
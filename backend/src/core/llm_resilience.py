@@ -0,0 +1,315 @@
+import asyncio
+import logging
+import math
+import random
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, TypeVar
+import httpx
+import openai
+from fastapi import HTTPException
+from src.core.config import BackendConfig
+from src.core.llm_limiter import LLMLimiter, LLMOverloadedError, LLMPriority, llm_limiter as default_llm_limiter
+
+T = TypeVar("T")
+
+
+class LLMUnavailableError(HTTPException):
+    def __init__(self, retry_after: int):
+        super().__init__(
+            status_code=503,
+            detail="AI service is temporarily unavailable, please retry later",
+            headers={"Retry-After": str(retry_after)}
+        )
+
+
+# Errors after which callers degrade (local score, queue) instead of failing the request
+LLM_UNAVAILABLE_ERRORS = (LLMUnavailableError, LLMOverloadedError)
+
+
+class _DeadlineExceeded(Exception):
+    """The call's deadline passed while it waited for a limiter slot."""
+
+
+def is_transient(error: BaseException) -> bool:
+    """Provider-side failures worth retrying and counting against the circuit."""
+    if isinstance(error, HTTPException):
+        return False
+    if isinstance(error, (asyncio.TimeoutError, httpx.TimeoutException, httpx.TransportError,
+                          openai.APITimeoutError, openai.APIConnectionError)):
+        return True
+    status_code = getattr(error, "status_code", None)
+    return isinstance(status_code, int) and (status_code == 429 or status_code >= 500)
+
+
+class CircuitBreaker:
+    """
+    Opens after failure_threshold consecutive transient failures of a deployment; while open,
+    calls fail immediately. After reset_seconds a single probe call is let through (half-open):
+    its success closes the circuit, its failure opens it again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = BackendConfig.LLM_CIRCUIT_FAILURE_THRESHOLD,
+        reset_seconds: float = BackendConfig.LLM_CIRCUIT_RESET_SECONDS
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self.rejected = 0
+        self._probe_in_flight = False
+
+    def retry_after(self) -> int:
+        return max(1, math.ceil(self.opened_at + self.reset_seconds - time.monotonic()))
+
+    def is_open(self) -> bool:
+        return self.state == "open" and time.monotonic() < self.opened_at + self.reset_seconds
+
+    def acquire(self) -> bool:
+        """Raises LLMUnavailableError while open; returns True if this call is the half-open probe."""
+        if self.state == "closed":
+            return False
+        if self.is_open():
+            self.rejected += 1
+            raise LLMUnavailableError(self.retry_after())
+        if self._probe_in_flight:
+            self.rejected += 1
+            raise LLMUnavailableError(1)
+        self.state = "half_open"
+        self._probe_in_flight = True
+        logging.info(f"[LLM CIRCUIT] {self.name}: half-open, probing")
+        return True
+
+    def release(self, probe: bool):
+        """The call ended without telling anything about the provider (cancelled, rejected by the limiter)."""
+        if probe:
+            self._probe_in_flight = False
+
+    def record_success(self, probe: bool):
+        self.release(probe)
+        self.consecutive_failures = 0
+        if self.state != "closed":
+            self.state = "closed"
+            logging.info(f"[LLM CIRCUIT] {self.name}: closed")
+
+    def record_failure(self, probe: bool):
+        self.release(probe)
+        self.consecutive_failures += 1
+        if self.state == "half_open" or self.consecutive_failures >= self.failure_threshold:
+            if self.state != "open":
+                self.times_opened += 1
+            self.state = "open"
+            self.opened_at = time.monotonic()
+            logging.warning(
+                f"[LLM CIRCUIT] {self.name}: open after {self.consecutive_failures} failures, "
+                f"retrying in {self.reset_seconds}s"
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": "open" if self.is_open() else ("half_open" if self.state != "closed" else "closed"),
+            "consecutive_failures": self.consecutive_failures,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+            "retry_after": self.retry_after() if self.is_open() else 0,
+        }
+
+
+@dataclass
+class _CallerMetrics:
+    calls: int = 0
+    attempts: int = 0
+    retries: int = 0
+    transient_failures: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+    unavailable: int = 0
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self.__dict__)
+
+
+class LLMCaller:
+    """
+    Runs LLM calls through the limiter with a circuit breaker per deployment, a deadline for the
+    whole call, a timeout per attempt and retries with full-jitter exponential backoff that are
+    only made while they can still finish before the deadline. Latency-critical calls can be
+    hedged: if the first attempt has not answered after hedge_after_seconds a second one is sent
+    and the first answer wins.
+    """
+
+    def __init__(
+        self,
+        limiter: LLMLimiter = None,
+        deadline_seconds: float = BackendConfig.LLM_DEADLINE_SECONDS,
+        attempt_timeout_seconds: float = BackendConfig.LLM_ATTEMPT_TIMEOUT_SECONDS,
+        max_attempts: int = BackendConfig.LLM_MAX_ATTEMPTS,
+        retry_base_delay: float = BackendConfig.LLM_RETRY_BASE_DELAY_SECONDS,
+        retry_max_delay: float = BackendConfig.LLM_RETRY_MAX_DELAY_SECONDS,
+        hedge_after_seconds: float = BackendConfig.LLM_HEDGE_AFTER_SECONDS
+    ):
+        self.limiter = limiter or default_llm_limiter
+        self.deadline_seconds = deadline_seconds
+        self.attempt_timeout_seconds = attempt_timeout_seconds
+        self.max_attempts = max(1, max_attempts)
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.hedge_after_seconds = hedge_after_seconds
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._call_sites: Dict[str, _CallerMetrics] = {}
+
+    def breaker_for(self, llm=None) -> CircuitBreaker:
+        name = getattr(llm, "deployment_name", None) or BackendConfig.AZURE_OPENAI_DEPLOYMENT_NAME or "default"
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            breaker = self._breakers[name] = CircuitBreaker(name)
+        return breaker
+
+    def is_available(self, llm=None) -> bool:
+        return not self.breaker_for(llm).is_open()
+
+    def _metrics(self, call_site: str) -> _CallerMetrics:
+        metrics = self._call_sites.get(call_site)
+        if metrics is None:
+            metrics = self._call_sites[call_site] = _CallerMetrics()
+        return metrics
+
+    async def _attempt(self, call_site: str, make_call: Callable[[], Awaitable[T]], estimated_tokens: int,
+                       priority: Optional[LLMPriority], deadline: float) -> T:
+        async with self.limiter.limit(call_site, estimated_tokens, priority):
+            timeout = min(self.attempt_timeout_seconds, deadline - time.monotonic())
+            if timeout <= 0:
+                raise _DeadlineExceeded()
+            return await asyncio.wait_for(make_call(), timeout)
+
+    async def _hedged(self, attempt: Callable[[], Awaitable[T]], metrics: _CallerMetrics) -> T:
+        first = asyncio.create_task(attempt())
+        tasks = {first}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.hedge_after_seconds)
+            if not done:
+                metrics.hedged += 1
+                tasks.add(asyncio.create_task(attempt()))
+            error: Optional[BaseException] = None
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not first:
+                            metrics.hedge_wins += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def call(
+        self,
+        call_site: str,
+        make_call: Callable[[], Awaitable[T]],
+        estimated_tokens: int = 0,
+        priority: Optional[LLMPriority] = None,
+        llm=None,
+        hedge: bool = False
+    ) -> T:
+        """
+        make_call starts one attempt (e.g. lambda: chain.ainvoke(...)). Raises LLMUnavailableError
+        when the circuit is open or the call could not succeed before its deadline; other errors
+        (bad requests, parsing) are raised as they are and not retried.
+        """
+        breaker = self.breaker_for(llm)
+        metrics = self._metrics(call_site)
+        metrics.calls += 1
+        deadline = time.monotonic() + self.deadline_seconds
+        last_error: Optional[BaseException] = None
+
+        for attempt_number in range(1, self.max_attempts + 1):
+            try:
+                probe = breaker.acquire()
+            except LLMUnavailableError:
+                metrics.unavailable += 1
+                raise
+
+            def attempt():
+                return self._attempt(call_site, make_call, estimated_tokens, priority, deadline)
+
+            metrics.attempts += 1
+            try:
+                if hedge and self.hedge_after_seconds > 0 and not probe:
+                    result = await self._hedged(attempt, metrics)
+                else:
+                    result = await attempt()
+            except (LLMOverloadedError, _DeadlineExceeded) as e:
+                breaker.release(probe)
+                if isinstance(e, LLMOverloadedError):
+                    raise
+                last_error = e
+                break
+            except Exception as e:
+                if not is_transient(e):
+                    # The provider answered; the failure is in the request or in our parsing
+                    breaker.record_success(probe)
+                    raise
+                breaker.record_failure(probe)
+                metrics.transient_failures += 1
+                last_error = e
+
+                delay = random.uniform(0, min(self.retry_max_delay, self.retry_base_delay * 2 ** (attempt_number - 1)))
+                remaining = deadline - time.monotonic()
+                if attempt_number == self.max_attempts or breaker.is_open() or delay + 1 >= remaining:
+                    break
+                metrics.retries += 1
+                logging.warning(
+                    f"[LLM RETRY] {call_site} attempt {attempt_number} failed ({type(e).__name__}: {e}), "
+                    f"retrying in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                breaker.release(probe)
+                raise
+
+            breaker.record_success(probe)
+            return result
+
+        metrics.unavailable += 1
+        logging.error(f"[LLM UNAVAILABLE] {call_site} gave up: {type(last_error).__name__}: {last_error}")
+        raise LLMUnavailableError(breaker.retry_after() if breaker.is_open() else 1) from last_error
+
+    @asynccontextmanager
+    async def guard(self, llm=None) -> AsyncIterator[None]:
+        """Circuit breaker only, for calls that cannot be retried, such as streamed responses."""
+        breaker = self.breaker_for(llm)
+        probe = breaker.acquire()
+        try:
+            yield
+        except LLMOverloadedError:
+            breaker.release(probe)
+            raise
+        except Exception as e:
+            if is_transient(e):
+                breaker.record_failure(probe)
+            else:
+                breaker.record_success(probe)
+            raise
+        except BaseException:
+            breaker.release(probe)
+            raise
+        breaker.record_success(probe)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "breakers": {name: breaker.stats() for name, breaker in self._breakers.items()},
+            "call_sites": {name: metrics.stats() for name, metrics in self._call_sites.items()},
+        }
+
+
+llm_caller = LLMCaller()
@@ -0,0 +1,22 @@
+import base64
+import binascii
+import json
+from typing import Any, List
+from fastapi import HTTPException
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """Opaque keyset cursor: the sort key of the last item of a page, as URL-safe base64 JSON."""
+    payload = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """Values of a cursor made by encode_cursor; 400 if it was not made with `size` values."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        values = None
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
@@ -1,15 +1,52 @@
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from src.core.clients import close_clients, init_clients
+from src.core.llm_metrics import LLMUsageMiddleware
 from src.core.config import backend_config
 from src.router import routers
 from starlette.middleware.cors import CORSMiddleware
 from src.core.database import init_db, engine
+from src.modules.embedding.dependencies import embedding_index_sync
+from src.modules.ingestion.dependencies import resume_ingestion_worker
+from src.modules.rescoring.dependencies import application_rescoring_worker
+from src.modules.resume.pdf_extractor import pdf_extraction_pool
+from src.modules.exchange_rate.service import exchange_rate_service
 
-app = FastAPI(debug=backend_config.DEBUG)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    
+    backend_config.configure_logging()
+    logging.info("Starting application...")
+    logging.debug(f'Debug mode: {backend_config.DEBUG}')
+    # logging.info(f'Allowed hosts: {backend_config.ALLOWED_HOSTS}')
+    
+    await init_db()
+    clients = init_clients()
+    exchange_rate_service.use_http_client(clients.http_client)
+    await resume_ingestion_worker.start()
+    await application_rescoring_worker.start()
+    await embedding_index_sync.start()
+    exchange_rate_service.start_periodic_refresh()
+
+    yield
+
+    await resume_ingestion_worker.stop()
+    await application_rescoring_worker.stop()
+    await embedding_index_sync.stop()
+    pdf_extraction_pool.shutdown()
+    await exchange_rate_service.aclose()
+    await close_clients()
+    await engine.dispose()
+    logging.info("Database engine disposed.")
+
+app = FastAPI(debug=backend_config.DEBUG, lifespan=lifespan)
 
 app.include_router(routers)
 
+app.add_middleware(LLMUsageMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=backend_config.ALLOWED_HOSTS,  # List of allowed origins, use ["*"] to allow all
@@ -17,18 +54,3 @@ app.add_middleware(
     allow_methods=["*"],  # List of allowed HTTP methods, use ["*"] to allow all
     allow_headers=["*"],  # List of allowed headers, use ["*"] to allow all
 )
-
-@app.on_event("startup")
-async def startup_event():
-    
-    backend_config.configure_logging()
-    logging.info("Starting application...")
-    logging.debug(f'Debug mode: {backend_config.DEBUG}')
-    # logging.info(f'Allowed hosts: {backend_config.ALLOWED_HOSTS}')
-    
-    await init_db()
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    await engine.dispose()
-    logging.info("Database engine disposed.")
\ No newline at end of file
@@ -1,11 +1,11 @@
-from sqlalchemy import Column, Float, Integer, String, DECIMAL, Boolean, Text, ForeignKey, DateTime
+from sqlalchemy import Column, Computed, Float, Integer, SmallInteger, String, DECIMAL, Boolean, Text, ForeignKey, DateTime, LargeBinary, Index, text
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 from src.core.database import Base
 from datetime import datetime
 from sqlalchemy import Enum as SAEnum
 from enum import Enum
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.dialects.postgresql import ARRAY, JSON, JSONB, TSVECTOR
 
 class EmploymentTypeEnum(str, Enum):
     full = "Full-time"
@@ -40,12 +40,12 @@ class Resume(Base):
     email = Column(String(255), nullable=True)
     phone = Column(String(255), nullable=True)
     
-    experience_time = Column(Float, nullable=True)
+    experience_time = Column(Float, nullable=True, index=True)
     profession = Column(String(255), nullable=True)
     
-    languages = Column(JSON, nullable=True)
+    languages = Column(JSONB, nullable=True)
     education = Column(JSON, nullable=True)
-    skills = Column(JSON, nullable=True)
+    skills = Column(JSONB, nullable=True)
     awards = Column(JSON, nullable=True)
     projects = Column(JSON, nullable=True)
     courses = Column(JSON, nullable=True)
@@ -54,7 +54,7 @@ class Resume(Base):
     grade = Column(String(50), nullable=True)  # Junior, Middle, Senior
     
    # Salary in Tenge
-    min_salary = Column(Float, nullable=True)
+    min_salary = Column(Float, nullable=True, index=True)
     max_salary = Column(Float, nullable=True)
 
     # Original salary
@@ -64,12 +64,34 @@ class Resume(Base):
     
     resume_link = Column(Text, nullable=False)
 
+    # zlib-compressed normalized text that was sent to the LLM; deferred so listings do not load it
+    resume_text = deferred(Column(LargeBinary, nullable=True))
+    # Prompt version of the stored analysis, rows with an older version are re-analyzed
+    analysis_version = Column(String(50), nullable=True, index=True)
+    # float16 vector of the profile for semantic search, and the encoder that produced it
+    embedding = deferred(Column(LargeBinary, nullable=True))
+    embedding_model = Column(String(100), nullable=True)
+    embedded_at = Column(DateTime, nullable=True, index=True)
+
+    # Normalized skills, language names and profession words for the HR candidate search (modules/candidate)
+    skill_tags = Column(ARRAY(String), nullable=True)
+    language_tags = Column(ARRAY(String), nullable=True)
+    profession_tags = Column(ARRAY(String), nullable=True)
+    # GRADE_LEVELS value of `grade`, NULL when it is not recognized
+    grade_level = Column(SmallInteger, nullable=True, index=True)
+
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     
     applications = relationship("Application", back_populates="resume", cascade="all, delete-orphan") 
     user = relationship("User", back_populates="resumes")
 
+    __table_args__ = (
+        Index("ix_resumes_skill_tags", "skill_tags", postgresql_using="gin"),
+        Index("ix_resumes_language_tags", "language_tags", postgresql_using="gin"),
+        Index("ix_resumes_profession_tags", "profession_tags", postgresql_using="gin"),
+    )
+
 class User(Base):
     __tablename__ = "user"
 
@@ -102,6 +124,16 @@ class Admin(Base):
     email = Column(String(80), nullable=False, unique=True)
     password = Column(String(80), nullable=False)
 
+# Full-text search document of a vacancy. The russian configuration stems Russian words and, through
+# english_stem, Latin ones; a simple copy of the title and skills keeps
+# terms the stemmer drops as stop words, such as "IT"
+VACANCY_SEARCH_VECTOR = (
+    "setweight(to_tsvector('russian', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('russian', coalesce(position, '') || ' ' || coalesce(skills, '')), 'B') || "
+    "setweight(to_tsvector('russian', coalesce(description, '')), 'C') || "
+    "setweight(to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(skills, '')), 'D')"
+)
+
 class Vacancy(Base):
     __tablename__ = "vacancy"
 
@@ -120,6 +152,14 @@ class Vacancy(Base):
     status = Column(SAEnum(VacancyStatusEnum), nullable=False, default=VacancyStatusEnum.under_review)
 
     skills = Column(Text)
+    # Professions/grades suggested by the classifier when the vacancy was created
+    classification = Column(JSON, nullable=True)
+    # float16 vector of title, grade, skills and description for semantic search
+    embedding = deferred(Column(LargeBinary, nullable=True))
+    embedding_model = Column(String(100), nullable=True)
+    embedded_at = Column(DateTime, nullable=True)
+    # Maintained by PostgreSQL from VACANCY_SEARCH_VECTOR; deferred so listings do not load it
+    search_vector = deferred(Column(TSVECTOR, Computed(VACANCY_SEARCH_VECTOR, persisted=True)))
 
     telegram = Column(String(80), nullable=True)  
     whatsapp = Column(String(80), nullable=True) 
@@ -131,6 +171,10 @@ class Vacancy(Base):
     hr = relationship("HR", back_populates="vacancies")
     applications = relationship("Application", back_populates="vacancy", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index("ix_vacancy_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
 class ApplicationStatusEnum(str, Enum):
     pending = "Pending"
     accepted = "Accepted"
@@ -146,6 +190,7 @@ class Application(Base):
     resume_id = Column(Integer, ForeignKey("resumes.id"), nullable=True)
     status = Column(SAEnum(ApplicationStatusEnum), nullable=False, default=ApplicationStatusEnum.pending)
     matching_score = Column(Integer, nullable=False, default=0)  
+    matching_source = Column(String(20), nullable=True)  # "llm" or "local"
     resume_path = Column(String(255), nullable=True) 
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, onupdate=datetime.utcnow)
@@ -153,3 +198,113 @@ class Application(Base):
     user = relationship("User", back_populates="applications")
     vacancy = relationship("Vacancy", back_populates="applications")
     resume = relationship("Resume")
+
+
+class IngestionJobStatusEnum(str, Enum):
+    queued = "Queued"
+    processing = "Processing"
+    completed = "Completed"
+    failed = "Failed"
+
+
+class ResumeIngestionJob(Base):
+    __tablename__ = "resume_ingestion_jobs"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("user.id"), nullable=False)
+    filename = Column(String(255), nullable=True)
+    status = Column(SAEnum(IngestionJobStatusEnum), nullable=False, default=IngestionJobStatusEnum.queued, index=True)
+    stage = Column(String(50), nullable=True)
+    stages = Column(JSON, nullable=True)  # {"upload": "done", "extract": "running", ...}
+    attempts = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+
+    # Uploaded PDF, kept until the job completes so it survives restarts
+    payload = Column(LargeBinary, nullable=True)
+    # Intermediate results, so a retried job does not repeat finished stages
+    resume_link = Column(Text, nullable=True)
+    analysis = Column(JSON, nullable=True)
+    resume_text = Column(Text, nullable=True)
+
+    resume_id = Column(Integer, ForeignKey("resumes.id", ondelete="SET NULL"), nullable=True)
+    locked_until = Column(DateTime, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class RescoringJobStatusEnum(str, Enum):
+    queued = "Queued"
+    processing = "Processing"
+    completed = "Completed"
+    failed = "Failed"
+
+
+class ApplicationRescoringJob(Base):
+    """Re-scoring of the pending applications of a vacancy or resume whose matching fields changed."""
+    __tablename__ = "application_rescoring_jobs"
+    __table_args__ = (
+        Index("ix_application_rescoring_jobs_target", "target_type", "target_id"),
+        # At most one queued job per target: later edits push it back instead of adding jobs
+        Index(
+            "uq_application_rescoring_jobs_queued_target", "target_type", "target_id",
+            unique=True, postgresql_where=text("status = 'queued'")
+        ),
+    )
+
+    id = Column(Integer, primary_key=True)
+    target_type = Column(String(20), nullable=False)  # "vacancy" or "resume"
+    target_id = Column(Integer, nullable=False)
+    status = Column(SAEnum(RescoringJobStatusEnum), nullable=False, default=RescoringJobStatusEnum.queued, index=True)
+    changed_fields = Column(JSON, nullable=True)
+    edits = Column(Integer, nullable=False, default=1)  # edits coalesced into this job
+
+    total = Column(Integer, nullable=True)
+    processed = Column(Integer, nullable=False, default=0)
+    # Applications are processed in id order; a retried job continues after the last saved one
+    last_application_id = Column(Integer, nullable=False, default=0)
+    attempts = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+
+    run_after = Column(DateTime, nullable=False, default=datetime.utcnow)
+    locked_until = Column(DateTime, nullable=True)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class LLMResponseCacheEntry(Base):
+    """Shared tier of the LLM response caches, visible to every worker process."""
+    __tablename__ = "llm_response_cache"
+
+    cache_key = Column(String(255), primary_key=True)
+    namespace = Column(String(50), nullable=False, index=True)
+    value = Column(JSON, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+
+class Skill(Base):
+    """Canonical skill names (see modules/skill/dictionary.py) and skills outside the dictionary, as normalized."""
+    __tablename__ = "skill"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(100), nullable=False, unique=True)
+
+
+# Inverted skill index: the primary key (skill_id, owner id) is the posting list of a skill, in id order;
+# the second index finds the skills of one resume or vacancy when they are replaced
+class ResumeSkill(Base):
+    __tablename__ = "resume_skill"
+
+    skill_id = Column(Integer, ForeignKey("skill.id", ondelete="CASCADE"), primary_key=True)
+    resume_id = Column(Integer, ForeignKey("resumes.id", ondelete="CASCADE"), primary_key=True, index=True)
+
+
+class VacancySkill(Base):
+    __tablename__ = "vacancy_skill"
+
+    skill_id = Column(Integer, ForeignKey("skill.id", ondelete="CASCADE"), primary_key=True)
+    vacancy_id = Column(Integer, ForeignKey("vacancy.id", ondelete="CASCADE"), primary_key=True, index=True)
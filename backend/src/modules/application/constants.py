@@ -0,0 +1,3 @@
+# Bump whenever a matching prompt changes, so LLM usage and cost can be compared between prompt versions.
+MATCHING_PROMPT_VERSION = "matching-v1"
+BATCH_MATCHING_PROMPT_VERSION = "matching-batch-v1"
@@ -1,5 +1,6 @@
-from typing import Optional
+from typing import Dict, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func
 from sqlalchemy.future import select
 from src.models import Application, ApplicationStatusEnum, Resume, Vacancy
 from fastapi import HTTPException
@@ -28,13 +29,14 @@ class ApplicationDatabase():
         await db.refresh(application)
         return application
 
-    async def create_application(self, db: AsyncSession, user_id: int, vacancy_id: int, resume_id: int, matching_score: int, summary: str, resume_path: str):
+    async def create_application(self, db: AsyncSession, user_id: int, vacancy_id: int, resume_id: int, matching_score: int, summary: str, resume_path: str, matching_source: str = None):
         application = Application(
             user_id=user_id,
             vacancy_id=vacancy_id,
             resume_id=resume_id,
             status=ApplicationStatusEnum.pending,
             matching_score=matching_score,
+            matching_source=matching_source,
             summary=summary,
             resume_path=resume_path
         )
@@ -44,6 +46,78 @@ class ApplicationDatabase():
         await db.refresh(application)
         return application
 
+    async def create_applications(self, db: AsyncSession, applications: List[Application]) -> List[Application]:
+        db.add_all(applications)
+        try:
+            await db.commit()
+        except:
+            await db.rollback()
+            raise
+        for application in applications:
+            await db.refresh(application)
+        return applications
+
+    async def get_application_with_relations(self, db: AsyncSession, application_id: int) -> Optional[Application]:
+        result = await db.execute(
+            select(Application)
+            .where(Application.id == application_id)
+            .options(joinedload(Application.vacancy), joinedload(Application.resume))
+        )
+        return result.scalar_one_or_none()
+
+    async def update_application_matching(self, db: AsyncSession, application: Application, matching_score: int, summary: str, matching_source: str) -> Application:
+        application.matching_score = matching_score
+        application.summary = summary
+        application.matching_source = matching_source
+        await db.commit()
+        await db.refresh(application)
+        return application
+
+    def _pending_applications(self, vacancy_id: Optional[int], resume_id: Optional[int]):
+        query = select(Application).where(
+            Application.status == ApplicationStatusEnum.pending,
+            Application.resume_id.is_not(None)
+        )
+        if vacancy_id is not None:
+            query = query.where(Application.vacancy_id == vacancy_id)
+        if resume_id is not None:
+            query = query.where(Application.resume_id == resume_id)
+        return query
+
+    async def get_pending_applications(
+        self, db: AsyncSession, after_id: int, limit: int, vacancy_id: Optional[int] = None, resume_id: Optional[int] = None
+    ) -> List[Application]:
+        """Next pending applications with a resume in id order, with their vacancy and resume loaded."""
+        result = await db.execute(
+            self._pending_applications(vacancy_id, resume_id)
+            .where(Application.id > after_id)
+            .options(joinedload(Application.vacancy), joinedload(Application.resume))
+            .order_by(Application.id)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def count_pending_applications(
+        self, db: AsyncSession, after_id: int = 0, vacancy_id: Optional[int] = None, resume_id: Optional[int] = None
+    ) -> int:
+        query = self._pending_applications(vacancy_id, resume_id).where(Application.id > after_id)
+        result = await db.execute(select(func.count()).select_from(query.subquery()))
+        return result.scalar_one()
+
+    async def update_applications_matching(self, db: AsyncSession, applications: List[Application], matchings: Dict[int, dict]) -> None:
+        """Applies {application_id: {"score", "summary", "source"}} in one transaction."""
+        for application in applications:
+            matching = matchings.get(application.id)
+            if matching:
+                application.matching_score = matching["score"]
+                application.summary = matching["summary"]
+                application.matching_source = matching["source"]
+        try:
+            await db.commit()
+        except:
+            await db.rollback()
+            raise
+
     async def get_applications_by_user(self, db: AsyncSession, user_id: int):
         result = await db.execute(
             select(Application)
@@ -1,5 +1,6 @@
-from typing import Optional
-from pydantic import BaseModel
+from typing import List, Optional
+from pydantic import BaseModel, Field
+from src.core.config import BackendConfig
 
 class CandidateResponseSchema(BaseModel):
     application_id: int
@@ -9,8 +10,20 @@ class CandidateResponseSchema(BaseModel):
     resume_link: Optional[str]
     profession: str
     matching_score: Optional[float]
+    matching_source: Optional[str] = None
     status: str
     summary: str
 
     class Config:
         orm_mode = True
+
+class BatchApplicationCreate(BaseModel):
+    resume_id: int
+    vacancy_ids: List[int] = Field(..., min_length=1, max_length=BackendConfig.MAX_BATCH_APPLICATIONS)
+
+class BatchApplicationResult(BaseModel):
+    vacancy_id: int
+    status: str  # "created" or "skipped"
+    application_id: Optional[int] = None
+    matching_score: Optional[int] = None
+    detail: Optional[str] = None
@@ -0,0 +1,213 @@
+import math
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+import numpy as np
+from src.core.config import BackendConfig
+from src.models import ExperienceTimeEnum, Resume, Vacancy
+from src.modules.skill.matcher import skill_matcher
+
+# "/" is left to the skill matcher, which knows "CI/CD" from "Excel/Word"
+_SKILL_SPLIT_RE = re.compile(r"[,;\n|•·]+")
+
+# (min, max) years for each vacancy experience bucket
+EXPERIENCE_RANGES = {
+    ExperienceTimeEnum.no_experience: (0.0, 1.0),
+    ExperienceTimeEnum.one_to_three_years: (1.0, 3.0),
+    ExperienceTimeEnum.three_to_five_years: (3.0, 5.0),
+    ExperienceTimeEnum.more_than_five_years: (5.0, math.inf),
+}
+
+GRADE_LEVELS = {
+    "intern": 0, "стажер": 0, "стажёр": 0,
+    "junior": 1, "джуниор": 1,
+    "middle": 2, "мидл": 2,
+    "senior": 3, "сеньор": 3,
+    "lead": 4, "team lead": 4, "тимлид": 4,
+}
+
+WEIGHTS = np.array([0.55, 0.2, 0.15, 0.1], dtype=np.float32)  # skills, experience, grade, salary
+
+# Used when a side of a component is unknown, so missing data neither helps nor sinks a candidate
+NEUTRAL = 0.5
+
+
+def normalize_skill(skill: str) -> str:
+    return skill_matcher.normalize(skill)
+
+
+def parse_skills(skills: Any) -> Set[str]:
+    """
+    Canonical names of resume skills (a JSON list) or vacancy skills (free text separated by commas,
+    semicolons or new lines), so "Postgres" and "PostgreSQL" are the same skill.
+    """
+    if not skills:
+        return set()
+    items: Iterable[str] = skills if isinstance(skills, (list, tuple, set)) else _SKILL_SPLIT_RE.split(str(skills))
+    return set().union(*(skill_matcher.extract(str(item)) for item in items if item))
+
+
+def parse_grade(grade: Optional[str]) -> float:
+    if not grade:
+        return np.nan
+    grade = grade.strip().lower()
+    if grade in GRADE_LEVELS:
+        return GRADE_LEVELS[grade]
+    for name, level in GRADE_LEVELS.items():
+        if name in grade:
+            return level
+    return np.nan
+
+
+def _float(value: Any) -> float:
+    return float(value) if value is not None else np.nan
+
+
+def experience_bounds(vacancies: Sequence[Vacancy]) -> tuple[np.ndarray, np.ndarray]:
+    ranges = [EXPERIENCE_RANGES.get(v.experience_time, (np.nan, np.nan)) for v in vacancies]
+    return (
+        np.array([r[0] for r in ranges], dtype=np.float32),
+        np.array([r[1] for r in ranges], dtype=np.float32)
+    )
+
+
+def offered_salaries(vacancies: Sequence[Vacancy]) -> np.ndarray:
+    return np.array([_float(v.salary_max or v.salary_min) for v in vacancies], dtype=np.float32)
+
+
+# The *_fit functions take broadcastable arrays (resumes along one axis, vacancies along the other)
+
+def experience_fit(years: np.ndarray, low: np.ndarray, high: np.ndarray) -> np.ndarray:
+    """Full score inside the bucket, linear penalty below it, slight penalty far above it."""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        below = np.clip(1 - (low - years) / np.maximum(low, 1), 0, 1)
+        above = np.clip(1 - (years - high) / 10, 0.7, 1)
+    experience = np.where(years < low, below, np.where(years > high, above, 1.0))
+    return np.where(np.isnan(years) | np.isnan(low), NEUTRAL, experience)
+
+
+def grade_fit(resume_grade: np.ndarray, vacancy_grade: np.ndarray) -> np.ndarray:
+    """One level apart halves the score, two or more levels apart gives 0."""
+    grade = np.clip(1 - np.abs(resume_grade - vacancy_grade) / 2, 0, 1)
+    return np.where(np.isnan(grade), NEUTRAL, grade)
+
+
+def salary_fit(expected: np.ndarray, offered: np.ndarray) -> np.ndarray:
+    """The candidate's minimum against the vacancy's maximum (both in KZT)."""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        salary = np.where(expected <= offered, 1.0, np.clip(offered / expected, 0, 1))
+    return np.where(np.isnan(expected) | np.isnan(offered) | (expected <= 0), NEUTRAL, salary)
+
+
+@dataclass
+class LocalMatch:
+    score: int
+    skills: float
+    experience: float
+    grade: float
+    salary: float
+    matched_skills: List[str]
+    missing_skills: List[str]
+
+    def summary(self) -> str:
+        """Explanation in the same layout as the LLM answer."""
+        parts = [
+            f"Совпадающие навыки: {', '.join(self.matched_skills) or 'нет'}.",
+            f"Не хватает навыков: {', '.join(self.missing_skills) or 'нет'}.",
+            f"Соответствие опыта: {round(self.experience * 100)}%, грейда: {round(self.grade * 100)}%, "
+            f"зарплатных ожиданий: {round(self.salary * 100)}%.",
+        ]
+        return f"- Соответствие: {self.score}\n- Пояснение: Автоматическая оценка. {' '.join(parts)}"
+
+
+class LocalScorer:
+    """
+    Deterministic matching score from the structured resume and vacancy fields:
+    skill coverage, experience bucket fit, grade distance and salary compatibility.
+    score_matrix scores every resume against every vacancy with array operations only.
+    """
+
+    def __init__(self):
+        self.pairs_scored = 0
+        self.decided_locally = 0
+        self.sent_to_llm = 0
+        # Pairs that should have gone to the LLM but got the local score because it was unavailable
+        self.llm_fallbacks = 0
+
+    def _component_matrices(self, resumes: Sequence[Resume], vacancies: Sequence[Vacancy]):
+        resume_skills = [parse_skills(r.skills) for r in resumes]
+        vacancy_skills = [parse_skills(v.skills) for v in vacancies]
+        vocabulary = {skill: i for i, skill in enumerate(sorted(set().union(*resume_skills, *vacancy_skills)))}
+
+        resume_matrix = np.zeros((len(resumes), max(len(vocabulary), 1)), dtype=np.float32)
+        vacancy_matrix = np.zeros((len(vacancies), max(len(vocabulary), 1)), dtype=np.float32)
+        for row, skills in enumerate(resume_skills):
+            resume_matrix[row, [vocabulary[s] for s in skills]] = 1.0
+        for row, skills in enumerate(vacancy_skills):
+            vacancy_matrix[row, [vocabulary[s] for s in skills]] = 1.0
+
+        # Share of the vacancy's skills the candidate has
+        required = vacancy_matrix.sum(axis=1)
+        overlap = resume_matrix @ vacancy_matrix.T
+        skills = np.where(required > 0, overlap / np.maximum(required, 1), NEUTRAL)
+
+        years = np.array([_float(r.experience_time) for r in resumes], dtype=np.float32)[:, None]
+        low, high = experience_bounds(vacancies)
+        experience = experience_fit(years, low[None, :], high[None, :])
+
+        resume_grade = np.array([parse_grade(r.grade) for r in resumes], dtype=np.float32)[:, None]
+        vacancy_grade = np.array([parse_grade(v.position) for v in vacancies], dtype=np.float32)[None, :]
+        grade = grade_fit(resume_grade, vacancy_grade)
+
+        expected = np.array([_float(r.min_salary) for r in resumes], dtype=np.float32)[:, None]
+        salary = salary_fit(expected, offered_salaries(vacancies)[None, :])
+
+        return (
+            np.stack([skills, experience, grade, salary], axis=-1).astype(np.float32),
+            resume_skills,
+            vacancy_skills
+        )
+
+    def score_matrix(self, resumes: Sequence[Resume], vacancies: Sequence[Vacancy]) -> np.ndarray:
+        """(len(resumes), len(vacancies)) matrix of integer scores from 0 to 100."""
+        if not resumes or not vacancies:
+            return np.zeros((len(resumes), len(vacancies)), dtype=np.int32)
+        components, _, _ = self._component_matrices(resumes, vacancies)
+        self.pairs_scored += len(resumes) * len(vacancies)
+        return np.rint(components @ WEIGHTS * 100).astype(np.int32)
+
+    def match(self, resume: Resume, vacancy: Vacancy) -> LocalMatch:
+        components, resume_skills, vacancy_skills = self._component_matrices([resume], [vacancy])
+        self.pairs_scored += 1
+        skills, experience, grade, salary = (float(c) for c in components[0, 0])
+        return LocalMatch(
+            score=int(round(float(components[0, 0] @ WEIGHTS) * 100)),
+            skills=skills,
+            experience=experience,
+            grade=grade,
+            salary=salary,
+            matched_skills=sorted(resume_skills[0] & vacancy_skills[0]),
+            missing_skills=sorted(vacancy_skills[0] - resume_skills[0])
+        )
+
+    @staticmethod
+    def is_borderline(
+        score: int,
+        low: int = BackendConfig.MATCHING_BORDERLINE_MIN,
+        high: int = BackendConfig.MATCHING_BORDERLINE_MAX
+    ) -> bool:
+        return low <= score <= high
+
+    def stats(self) -> Dict[str, Any]:
+        decided = self.decided_locally + self.sent_to_llm
+        return {
+            "mode": BackendConfig.MATCHING_MODE,
+            "pairs_scored": self.pairs_scored,
+            "decided_locally": self.decided_locally,
+            "sent_to_llm": self.sent_to_llm,
+            "llm_fallbacks": self.llm_fallbacks,
+            "local_ratio": round(self.decided_locally / decided, 4) if decided else 0.0,
+        }
+
+
+local_scorer = LocalScorer()
@@ -1,30 +1,104 @@
+import asyncio
 import logging
 import json
+import time
+from typing import AsyncIterator, Dict, List, Optional
 from fastapi import HTTPException
 from langchain_openai import AzureChatOpenAI
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.models import Resume, Vacancy, ApplicationStatusEnum
+from src.core.config import BackendConfig
+from src.core.database import SessionLocal
+from src.models import Application, Resume, Vacancy, ApplicationStatusEnum
 from .crud import ApplicationDatabase
 from src.modules.vacancy.service import VacancyService
 from src.modules.resume.service import ResumeService
 import re
 from langchain_core.prompts import PromptTemplate
 from langchain_core.runnables import RunnableLambda
+from src.core.llm_limiter import estimate_tokens
+from src.core.llm_resilience import LLM_UNAVAILABLE_ERRORS, LLMCaller, llm_caller as default_llm_caller
+from src.core.llm_metrics import llm_run_config, response_for_log
+from .constants import BATCH_MATCHING_PROMPT_VERSION, MATCHING_PROMPT_VERSION
+from .schemas import BatchApplicationResult
+from .scoring import LocalScorer, local_scorer as default_local_scorer
+from .streaming import MatchingStreamRequest, ScoreStreamParser, sse_event
 
 logging.basicConfig(level=logging.INFO)
 
+# Streams keep running after the client disconnects so the finished answer is still saved
+_stream_tasks: set = set()
+
+BATCH_MATCHING_INSTRUCTIONS = (
+    "Оцени соответствие по шкале от 0 до 100, а также укажи, какие навыки отсутствуют и как их можно развить. "
+    "Оценивай каждую пару независимо от остальных, справедливо и кратко (не более 5-7 предложений).\n\n"
+    "Отвечай ТОЛЬКО JSON, без Markdown и пояснений, по одному элементу на каждый id:\n"
+    "{{\"results\": [{{\"id\": 1, \"score\": 75, \"analysis\": \"...\"}}]}}\n"
+)
+
+MATCHING_PROMPT = PromptTemplate(
+    input_variables=["first_name", "last_name", "experience_time", "profession", "resume_skills", "vacancy_title",
+                    "vacancy_description", "vacancy_experience_time", "vacancy_skills", "score", "analysis"],
+    template=(
+        "Ты AI, анализирующий соответствие резюме и вакансий. "
+        "Оценивай справедливо и будь кратким (не более 5-7 предложений).\n\n"
+        "Кандидат:\n"
+        "- Имя: {first_name} {last_name}\n"
+        "- Опыт: {experience_time} лет\n"
+        "- Навыки: {resume_skills}\n"
+        "- Профессия: {profession}\n\n"
+        "Вакансия:\n"
+        "- Должность: {vacancy_title}\n"
+        "- Описание: {vacancy_description}\n"
+        "- Требуемый опыт: {vacancy_experience_time}\n"
+        "- Навыки: {vacancy_skills}\n\n"
+        "Оцени соответствие резюме и вакансии по шкале от 0 до 100, а также укажи, "
+        "какие навыки отсутствуют и как их можно развить.\n\n"
+        "Ответь в формате:\n"
+        "- Соответствие: {score}\n"
+        "- Пояснение: {analysis}\n"
+    )
+)
+
 class ApplicationService:
     def __init__(
         self,
         application_database = ApplicationDatabase,
         vacancy_service = VacancyService,
         resume_service = ResumeService,
-        llm = AzureChatOpenAI
+        llm = AzureChatOpenAI,
+        llm_caller: LLMCaller = None,
+        local_scorer: LocalScorer = None,
+        matching_mode: str = BackendConfig.MATCHING_MODE
     ):
         self.application_database = application_database
         self.vacancy_service = vacancy_service
         self.resume_service = resume_service
         self.llm = llm
+        self.llm_caller = llm_caller or default_llm_caller
+        self.local_scorer = local_scorer or default_local_scorer
+        self.matching_mode = matching_mode
+
+    def _matching_inputs(self, resume: Resume, vacancy: Vacancy) -> tuple[dict, int]:
+        if isinstance(resume.skills, list):
+            resume_skills = ", ".join(resume.skills)
+        else:
+            resume_skills = resume.skills
+
+        variables = {
+            "first_name": resume.first_name,
+            "last_name": resume.last_name,
+            "experience_time": resume.experience_time,
+            "profession": resume.profession if resume.profession else 'Не указано',
+            "resume_skills": resume_skills,
+            "vacancy_title": vacancy.title,
+            "vacancy_description": vacancy.description,
+            "vacancy_experience_time": vacancy.experience_time,
+            "vacancy_skills": vacancy.skills,
+            "score": '',
+            "analysis": ''
+        }
+        estimated_tokens = estimate_tokens(f"{MATCHING_PROMPT.template}{resume_skills}{vacancy.description}{vacancy.skills}", 400)
+        return variables, estimated_tokens
 
     async def analyze_matching(self, resume: Resume, vacancy: Vacancy) -> dict:
         logging.info(f"[MATCHING RESUME AND VACANCY] Analyzing match for resume {resume.id} and vacancy {vacancy.id}")
@@ -33,57 +107,20 @@ class ApplicationService:
             logging.error("[MATCHING ERROR] LLM not configured")
             raise ValueError("LLM dependency is not configured")
 
-        if isinstance(resume.skills, list):
-            resume_skills = ", ".join(resume.skills)
-        else:
-            resume_skills = resume.skills
-
-        vacancy_skills = vacancy.skills
-
-        profession = resume.profession if resume.profession else 'Не указано'
-
-        prompt = PromptTemplate(
-            input_variables=["first_name", "last_name", "experience_time", "profession", "resume_skills", "vacancy_title",
-                            "vacancy_description", "vacancy_experience_time", "vacancy_skills", "score", "analysis"],
-            template=(
-                "Ты AI, анализирующий соответствие резюме и вакансий. "
-                "Оценивай справедливо и будь кратким (не более 5-7 предложений).\n\n"
-                "Кандидат:\n"
-                "- Имя: {first_name} {last_name}\n"
-                "- Опыт: {experience_time} лет\n"
-                "- Навыки: {resume_skills}\n"
-                "- Профессия: {profession}\n\n"
-                "Вакансия:\n"
-                "- Должность: {vacancy_title}\n"
-                "- Описание: {vacancy_description}\n"
-                "- Требуемый опыт: {vacancy_experience_time}\n"
-                "- Навыки: {vacancy_skills}\n\n"
-                "Оцени соответствие резюме и вакансии по шкале от 0 до 100, а также укажи, "
-                "какие навыки отсутствуют и как их можно развить.\n\n"
-                "Ответь в формате:\n"
-                "- Соответствие: {score}\n"
-                "- Пояснение: {analysis}\n"
-            )
-        )
-
-        chain = prompt | self.llm | RunnableLambda(lambda x: x.content.strip() if hasattr(x, "content") else str(x).strip())
+        chain = MATCHING_PROMPT | self.llm | RunnableLambda(lambda x: x.content.strip() if hasattr(x, "content") else str(x).strip())
+        variables, estimated_tokens = self._matching_inputs(resume, vacancy)
 
         try:
-            response = await chain.ainvoke({
-                "first_name": resume.first_name,
-                "last_name": resume.last_name,
-                "experience_time": resume.experience_time,
-                "profession": profession,
-                "resume_skills": resume_skills,
-                "vacancy_title": vacancy.title,
-                "vacancy_description": vacancy.description,
-                "vacancy_experience_time": vacancy.experience_time,
-                "vacancy_skills": vacancy_skills,
-                "score": '',
-                "analysis": ''
-            })
+            # The applicant is waiting on the answer: hedged when LLM_HEDGE_AFTER_SECONDS is set
+            response = await self.llm_caller.call(
+                "analyze_matching",
+                lambda: chain.ainvoke(variables, config=llm_run_config("analyze_matching", MATCHING_PROMPT_VERSION)),
+                estimated_tokens,
+                llm=self.llm,
+                hedge=True
+            )
 
-            logging.info(f"[MATCHING SUCCESS] Response from Langchain: {response}")
+            logging.info(f"[MATCHING SUCCESS] Response from Langchain: {response_for_log(response)}")
 
             score = self.extract_score(response)
             logging.info(f"[MATCHING SUCCESS] Resume {resume.id} matched with vacancy {vacancy.id} (Score: {score})")
@@ -95,10 +132,346 @@ class ApplicationService:
                 }
             }
 
+        except HTTPException:
+            raise
         except Exception as e:
             logging.error(f"[MATCHING ERROR] Error analyzing resume {resume.id} and vacancy {vacancy.id}: {e}", exc_info=True)
             raise HTTPException(status_code=500, detail="Error processing matching with Langchain")
 
+    def _candidate_block(self, resume: Resume) -> str:
+        resume_skills = ", ".join(resume.skills) if isinstance(resume.skills, list) else resume.skills
+        return (
+            f"- Имя: {resume.first_name} {resume.last_name}\n"
+            f"- Опыт: {resume.experience_time} лет\n"
+            f"- Навыки: {resume_skills}\n"
+            f"- Профессия: {resume.profession or 'Не указано'}\n"
+        )
+
+    def _vacancy_block(self, vacancy: Vacancy) -> str:
+        return (
+            f"- Должность: {vacancy.title}\n"
+            f"- Описание: {vacancy.description}\n"
+            f"- Требуемый опыт: {vacancy.experience_time}\n"
+            f"- Навыки: {vacancy.skills}\n"
+        )
+
+    def parse_batch_response(self, response: str, expected_ids: List[int]) -> Dict[int, dict]:
+        """
+        Parses {"results": [{"id", "score", "analysis"}]} into {id: matching}, in the same shape as analyze_matching.
+        Entries with unknown ids or invalid scores are dropped, so their pairs get re-scored individually.
+        """
+        text = response.strip()
+        if text.startswith("```"):
+            text = text.strip("`").removeprefix("json").strip()
+
+        parsed = json.loads(text)
+        results = parsed.get("results", []) if isinstance(parsed, dict) else parsed
+
+        matchings = {}
+        for item in results:
+            try:
+                item_id = int(item["id"])
+                score = int(item["score"])
+            except (KeyError, TypeError, ValueError):
+                logging.warning(f"[BATCH MATCHING] Skipping malformed entry: {item}")
+                continue
+            if item_id not in expected_ids or not 0 <= score <= 100:
+                logging.warning(f"[BATCH MATCHING] Skipping invalid entry: {item}")
+                continue
+            analysis = str(item.get("analysis") or "").strip()
+            matchings[item_id] = {
+                "score": score,
+                # Same layout as the per-pair answer, so stored summaries look alike
+                "summary": f"- Соответствие: {score}\n- Пояснение: {analysis}"
+            }
+        return matchings
+
+    async def _run_batch(self, template: str, variables: dict, expected_ids: List[int], call_site: str) -> Dict[int, dict]:
+        prompt = PromptTemplate(input_variables=list(variables), template=template)
+        chain = prompt | self.llm | RunnableLambda(lambda x: x.content.strip() if hasattr(x, "content") else str(x).strip())
+
+        estimated_tokens = estimate_tokens(template + "".join(variables.values()), 250 * len(expected_ids))
+        response = await self.llm_caller.call(
+            call_site,
+            lambda: chain.ainvoke(variables, config=llm_run_config(call_site, BATCH_MATCHING_PROMPT_VERSION)),
+            estimated_tokens,
+            llm=self.llm
+        )
+        logging.info(f"[BATCH MATCHING] Response from Langchain: {response_for_log(response)}")
+        return self.parse_batch_response(response, expected_ids)
+
+    async def match_resume_to_vacancies(
+        self,
+        resume: Resume,
+        vacancies: List[Vacancy],
+        batch_size: int = BackendConfig.MATCHING_BATCH_SIZE
+    ) -> Dict[int, dict]:
+        """
+        Scores one resume against many vacancies, sending the candidate block once per batch
+        of vacancies. Returns {vacancy_id: {"score", "summary"}}.
+        """
+        template = (
+            "Ты AI, анализирующий соответствие резюме и вакансий.\n\n"
+            "Кандидат:\n{candidate}\n"
+            "Вакансии:\n{vacancies}\n"
+            + BATCH_MATCHING_INSTRUCTIONS
+        )
+
+        async def score_batch(batch: List[Vacancy]) -> Dict[int, dict]:
+            variables = {
+                "candidate": self._candidate_block(resume),
+                "vacancies": "\n".join(f"[id={v.id}]\n{self._vacancy_block(v)}" for v in batch)
+            }
+            return await self._run_batch(template, variables, [v.id for v in batch], "analyze_matching_batch")
+
+        async def score_pair(vacancy: Vacancy) -> dict:
+            return (await self.analyze_matching(resume, vacancy))["matching"]
+
+        return await self._match_in_batches(vacancies, batch_size, score_batch, score_pair)
+
+    async def match_resumes_to_vacancy(
+        self,
+        resumes: List[Resume],
+        vacancy: Vacancy,
+        batch_size: int = BackendConfig.MATCHING_BATCH_SIZE
+    ) -> Dict[int, dict]:
+        """
+        Scores many resumes against one vacancy, sending the vacancy block once per batch
+        of candidates. Returns {resume_id: {"score", "summary"}}.
+        """
+        template = (
+            "Ты AI, анализирующий соответствие кандидатов вакансии.\n\n"
+            "Вакансия:\n{vacancy}\n"
+            "Кандидаты:\n{candidates}\n"
+            + BATCH_MATCHING_INSTRUCTIONS
+        )
+
+        async def score_batch(batch: List[Resume]) -> Dict[int, dict]:
+            variables = {
+                "vacancy": self._vacancy_block(vacancy),
+                "candidates": "\n".join(f"[id={r.id}]\n{self._candidate_block(r)}" for r in batch)
+            }
+            return await self._run_batch(template, variables, [r.id for r in batch], "analyze_matching_batch")
+
+        async def score_pair(resume: Resume) -> dict:
+            return (await self.analyze_matching(resume, vacancy))["matching"]
+
+        return await self._match_in_batches(resumes, batch_size, score_batch, score_pair)
+
+    async def _match_in_batches(self, items: list, batch_size: int, score_batch, score_pair) -> Dict[int, dict]:
+        """
+        Runs the batches concurrently; items a batch did not return a valid score for
+        (or all items of a failed batch) are scored with one call per pair. An item whose
+        per-pair call fails too maps to {"error": detail}, so one bad pair does not discard the rest.
+        """
+        batches = [items[i:i + batch_size] for i in range(0, len(items), max(batch_size, 1))]
+
+        async def pair(item) -> dict:
+            try:
+                return await score_pair(item)
+            except HTTPException as e:
+                if e.status_code == 503:
+                    raise
+                detail = e.detail
+            except Exception as e:
+                detail = str(e)
+            logging.error(f"[BATCH MATCHING] Per-pair matching failed for id {item.id}: {detail}")
+            return {"error": detail}
+
+        async def run(batch: list) -> Dict[int, dict]:
+            if len(batch) == 1:
+                return {batch[0].id: await pair(batch[0])}
+            try:
+                matchings = await score_batch(batch)
+            except HTTPException as e:
+                if e.status_code == 503:
+                    # Limiter backpressure or open circuit: per-pair calls would only add load
+                    raise
+                logging.error(f"[BATCH MATCHING] Batch of {len(batch)} failed, scoring pairs one by one: {e.detail}")
+                matchings = {}
+            except Exception as e:
+                logging.error(f"[BATCH MATCHING] Batch of {len(batch)} failed, scoring pairs one by one: {e}")
+                matchings = {}
+
+            missing = [item for item in batch if item.id not in matchings]
+            if missing:
+                logging.warning(f"[BATCH MATCHING] Falling back to per-pair matching for ids {[item.id for item in missing]}")
+                for item, matching in zip(missing, await asyncio.gather(*(pair(item) for item in missing))):
+                    matchings[item.id] = matching
+            return matchings
+
+        results: Dict[int, dict] = {}
+        for matchings in await asyncio.gather(*(run(batch) for batch in batches)):
+            results.update(matchings)
+        return results
+
+    def _needs_llm(self, local_score: int) -> bool:
+        if self.matching_mode == "local":
+            return False
+        if self.matching_mode == "hybrid":
+            return self.local_scorer.is_borderline(local_score)
+        return True
+
+    def _local_fallback(self, resume: Resume, vacancy: Vacancy) -> dict:
+        local = self.local_scorer.match(resume, vacancy)
+        self.local_scorer.llm_fallbacks += 1
+        return {"score": local.score, "summary": local.summary(), "source": "local"}
+
+    def _local_matching(self, resume: Resume, vacancy: Vacancy) -> Optional[dict]:
+        """The local result when MATCHING_MODE lets it stand, None when the LLM has to score the pair."""
+        if self.matching_mode == "llm":
+            return None
+        local = self.local_scorer.match(resume, vacancy)
+        if self._needs_llm(local.score):
+            self.local_scorer.sent_to_llm += 1
+            logging.info(f"[MATCHING LOCAL] Resume {resume.id} / vacancy {vacancy.id}: borderline local score {local.score}, asking LLM")
+            return None
+        self.local_scorer.decided_locally += 1
+        logging.info(f"[MATCHING LOCAL] Resume {resume.id} / vacancy {vacancy.id}: local score {local.score}")
+        return {"score": local.score, "summary": local.summary(), "source": "local"}
+
+    async def compute_matching(self, resume: Resume, vacancy: Vacancy) -> dict:
+        """
+        Score for a new application according to MATCHING_MODE. Returns {"score", "summary", "source"}.
+        In hybrid mode only candidates inside the borderline band wait for the LLM.
+        """
+        local = self._local_matching(resume, vacancy)
+        if local:
+            return local
+
+        try:
+            matching = (await self.analyze_matching(resume, vacancy))["matching"]
+        except LLM_UNAVAILABLE_ERRORS as e:
+            # Degrade instead of failing the application; HR can request the AI analysis later
+            logging.warning(f"[MATCHING FALLBACK] Resume {resume.id} / vacancy {vacancy.id}: AI unavailable ({e.detail}), using local score")
+            return self._local_fallback(resume, vacancy)
+        return {**matching, "source": "llm"}
+
+    async def compute_matchings_for_resume(
+        self, resume: Resume, vacancies: List[Vacancy], fallback_to_local: bool = True
+    ) -> Dict[int, dict]:
+        """
+        compute_matching for many vacancies: one vectorized local pass, then one batched LLM call
+        for the vacancies that still need it. Without fallback_to_local an unavailable AI is raised.
+        Vacancies whose LLM scoring failed map to {"error": detail}.
+        """
+        results: Dict[int, dict] = {}
+        to_llm = vacancies
+        if self.matching_mode != "llm":
+            scores = self.local_scorer.score_matrix([resume], vacancies)[0]
+            to_llm = []
+            for vacancy, score in zip(vacancies, scores):
+                if self._needs_llm(int(score)):
+                    to_llm.append(vacancy)
+                else:
+                    results[vacancy.id] = {
+                        "score": int(score),
+                        "summary": self.local_scorer.match(resume, vacancy).summary(),
+                        "source": "local"
+                    }
+            self.local_scorer.decided_locally += len(results)
+            self.local_scorer.sent_to_llm += len(to_llm)
+
+        if to_llm:
+            try:
+                llm_matchings = await self.match_resume_to_vacancies(resume, to_llm)
+            except LLM_UNAVAILABLE_ERRORS as e:
+                if not fallback_to_local:
+                    raise
+                logging.warning(f"[MATCHING FALLBACK] Resume {resume.id}: AI unavailable ({e.detail}), using local scores for {len(to_llm)} vacancies")
+                llm_matchings = {}
+            for vacancy in to_llm:
+                if "error" in llm_matchings.get(vacancy.id, {}):
+                    results[vacancy.id] = llm_matchings[vacancy.id]
+                elif vacancy.id in llm_matchings:
+                    results[vacancy.id] = {**llm_matchings[vacancy.id], "source": "llm"}
+                else:
+                    results[vacancy.id] = self._local_fallback(resume, vacancy)
+        return results
+
+    async def compute_matchings_for_vacancy(
+        self, vacancy: Vacancy, resumes: List[Resume], fallback_to_local: bool = True
+    ) -> Dict[int, dict]:
+        """compute_matchings_for_resume the other way round: many resumes against one vacancy, keyed by resume id."""
+        results: Dict[int, dict] = {}
+        to_llm = resumes
+        if self.matching_mode != "llm":
+            scores = self.local_scorer.score_matrix(resumes, [vacancy])[:, 0]
+            to_llm = []
+            for resume, score in zip(resumes, scores):
+                if self._needs_llm(int(score)):
+                    to_llm.append(resume)
+                else:
+                    results[resume.id] = {
+                        "score": int(score),
+                        "summary": self.local_scorer.match(resume, vacancy).summary(),
+                        "source": "local"
+                    }
+            self.local_scorer.decided_locally += len(results)
+            self.local_scorer.sent_to_llm += len(to_llm)
+
+        if to_llm:
+            try:
+                llm_matchings = await self.match_resumes_to_vacancy(to_llm, vacancy)
+            except LLM_UNAVAILABLE_ERRORS as e:
+                if not fallback_to_local:
+                    raise
+                logging.warning(f"[MATCHING FALLBACK] Vacancy {vacancy.id}: AI unavailable ({e.detail}), using local scores for {len(to_llm)} resumes")
+                llm_matchings = {}
+            for resume in to_llm:
+                if "error" in llm_matchings.get(resume.id, {}):
+                    results[resume.id] = llm_matchings[resume.id]
+                elif resume.id in llm_matchings:
+                    results[resume.id] = {**llm_matchings[resume.id], "source": "llm"}
+                else:
+                    results[resume.id] = self._local_fallback(resume, vacancy)
+        return results
+
+    def _rescoring_updates(self, applications: List[Application], matchings: Dict[int, dict], key: str) -> Dict[int, dict]:
+        """{application_id: matching} by the application's `key` id; applications whose pair failed keep their score."""
+        updates = {application.id: matchings[getattr(application, key)] for application in applications}
+        failed = [application_id for application_id, matching in updates.items() if "error" in matching]
+        if failed:
+            logging.warning(f"[RESCORING] Scoring failed for applications {failed}, keeping their previous scores")
+        return {application_id: matching for application_id, matching in updates.items() if "error" not in matching}
+
+    async def rescore_vacancy_applications(self, db: AsyncSession, vacancy: Vacancy, applications: List[Application]) -> None:
+        """
+        Re-scores pending applications after their vacancy changed, batching the candidates per LLM call.
+        An unavailable AI is raised rather than replacing AI summaries with local ones; the job retries later.
+        """
+        resumes = list({application.resume_id: application.resume for application in applications}.values())
+        matchings = await self.compute_matchings_for_vacancy(vacancy, resumes, fallback_to_local=False)
+        logging.info(f"[RESCORING] Vacancy {vacancy.id}: re-scored applications {[application.id for application in applications]}")
+        await self.application_database.update_applications_matching(
+            db, applications, self._rescoring_updates(applications, matchings, "resume_id")
+        )
+
+    async def rescore_resume_applications(self, db: AsyncSession, resume: Resume, applications: List[Application]) -> None:
+        """rescore_vacancy_applications after a resume changed: its vacancies are batched per LLM call."""
+        vacancies = list({application.vacancy_id: application.vacancy for application in applications}.values())
+        matchings = await self.compute_matchings_for_resume(resume, vacancies, fallback_to_local=False)
+        logging.info(f"[RESCORING] Resume {resume.id}: re-scored applications {[application.id for application in applications]}")
+        await self.application_database.update_applications_matching(
+            db, applications, self._rescoring_updates(applications, matchings, "vacancy_id")
+        )
+
+    async def request_llm_analysis(self, db: AsyncSession, application_id: int, hr) -> Application:
+        """
+        On-demand LLM analysis of an application that was scored locally; replaces its score and summary.
+        """
+        application = await self.application_database.get_application_with_relations(db, application_id)
+        if not application or application.vacancy.hr_id != hr.id:
+            raise HTTPException(status_code=404, detail="Application not found")
+        if not application.resume:
+            raise HTTPException(status_code=400, detail="Application has no resume to analyze")
+
+        logging.info(f"[MATCHING ON DEMAND] HR {hr.id} requested LLM analysis of application {application_id}")
+        matching = (await self.analyze_matching(application.resume, application.vacancy))["matching"]
+        return await self.application_database.update_application_matching(
+            db, application, matching["score"], matching["summary"], "llm"
+        )
+
     def extract_score(self, text: str) -> int:
         logging.info("[MATCHING SCORE] Extracting a number from 0 to 100 from text")
 
@@ -116,9 +489,7 @@ class ApplicationService:
             logging.error("[MATCHING SCORE ERROR] No match for 'Соответствие: <число>' found")
             return 50
 
-    async def create_application(self, db: AsyncSession, user_id: int, vacancy_id: int, resume_id: int):
-        logging.info(f"[APPLICATION] Creating application for user {user_id}, vacancy {vacancy_id}, resume {resume_id}")
-
+    async def _get_application_pair(self, db: AsyncSession, user_id: int, vacancy_id: int, resume_id: int) -> tuple[Resume, Vacancy]:
         if not self.vacancy_service or not self.resume_service:
             logging.error("[APPLICATION ERROR] VacancyService or ResumeService not configured")
             raise ValueError("VacancyService or ResumeService dependency is not configured")
@@ -140,18 +511,171 @@ class ApplicationService:
             logging.error(f"[APPLICATION ERROR] Resume {resume_id} or Vacancy {vacancy_id} not found for user {user_id}")
             raise ValueError("No resume or vacancy found")
 
-        matching_result = await self.analyze_matching(resume, vacancy)
+        return resume, vacancy
+
+    async def create_application(self, db: AsyncSession, user_id: int, vacancy_id: int, resume_id: int):
+        logging.info(f"[APPLICATION] Creating application for user {user_id}, vacancy {vacancy_id}, resume {resume_id}")
+
+        resume, vacancy = await self._get_application_pair(db, user_id, vacancy_id, resume_id)
+        matching = await self.compute_matching(resume, vacancy)
 
         application = await self.application_database.create_application(
             db, user_id, vacancy_id, resume_id,
-            matching_result["matching"]["score"],
-            matching_result["matching"]["summary"],
-            resume.resume_link
+            matching["score"],
+            matching["summary"],
+            resume.resume_link,
+            matching["source"]
         )
 
-        logging.info(f"[APPLICATION SUCCESS] User {user_id} applied to vacancy {vacancy_id} with matching score {matching_result['matching']['score']}")
+        logging.info(f"[APPLICATION SUCCESS] User {user_id} applied to vacancy {vacancy_id} with matching score {matching['score']} ({matching['source']})")
         return application
 
+    async def prepare_application_stream(self, db: AsyncSession, user_id: int, vacancy_id: int, resume_id: int) -> MatchingStreamRequest:
+        """
+        Runs the same checks as create_application before any bytes are streamed,
+        so validation errors are still regular HTTP errors.
+        """
+        logging.info(f"[APPLICATION STREAM] Preparing application for user {user_id}, vacancy {vacancy_id}, resume {resume_id}")
+
+        resume, vacancy = await self._get_application_pair(db, user_id, vacancy_id, resume_id)
+        if not self.llm:
+            logging.error("[MATCHING ERROR] LLM not configured")
+            raise ValueError("LLM dependency is not configured")
+
+        variables, estimated_tokens = self._matching_inputs(resume, vacancy)
+        local_matching = self._local_matching(resume, vacancy)
+        if local_matching is None and not self.llm_caller.is_available(self.llm):
+            logging.warning(f"[MATCHING FALLBACK] Resume {resume_id} / vacancy {vacancy_id}: circuit open, streaming local score")
+            local_matching = self._local_fallback(resume, vacancy)
+        return MatchingStreamRequest(
+            user_id=user_id,
+            vacancy_id=vacancy_id,
+            resume_id=resume_id,
+            resume_link=resume.resume_link,
+            variables=variables,
+            estimated_tokens=estimated_tokens,
+            local_matching=local_matching
+        )
+
+    async def _produce_application_stream(self, request: MatchingStreamRequest, queue: asyncio.Queue, session_factory):
+        try:
+            if request.local_matching:
+                score, summary, source = request.local_matching["score"], request.local_matching["summary"], "local"
+                queue.put_nowait(("score", {"score": score, "source": source}))
+                queue.put_nowait(("token", {"text": summary}))
+            else:
+                source = "llm"
+                parser = ScoreStreamParser()
+                chunks: List[str] = []
+                chain = MATCHING_PROMPT | self.llm
+                # Tokens already sent cannot be taken back, so streams are not retried; the breaker still sees the outcome
+                async with self.llm_caller.guard(self.llm), self.llm_caller.limiter.limit("stream_matching", request.estimated_tokens):
+                    started_at = time.monotonic()
+                    async for chunk in chain.astream(request.variables, config=llm_run_config("stream_matching", MATCHING_PROMPT_VERSION)):
+                        text = chunk.content if hasattr(chunk, "content") else str(chunk)
+                        if not text:
+                            continue
+                        if not chunks:
+                            logging.info(f"[MATCHING STREAM] First token for resume {request.resume_id} / vacancy {request.vacancy_id} after {time.monotonic() - started_at:.2f}s")
+                        chunks.append(text)
+                        queue.put_nowait(("token", {"text": text}))
+                        if parser.feed(text) is not None:
+                            queue.put_nowait(("score", {"score": parser.score, "source": source}))
+
+                summary = "".join(chunks).strip()
+                score = parser.score
+                if score is None:
+                    score = self.extract_score(summary)
+                    queue.put_nowait(("score", {"score": score, "source": source}))
+                logging.info(f"[MATCHING SUCCESS] Resume {request.resume_id} matched with vacancy {request.vacancy_id} (Score: {score})")
+
+            async with session_factory() as db:
+                application = await self.application_database.create_application(
+                    db, request.user_id, request.vacancy_id, request.resume_id,
+                    score, summary, request.resume_link, source
+                )
+            logging.info(f"[APPLICATION SUCCESS] User {request.user_id} applied to vacancy {request.vacancy_id} with matching score {score} ({source})")
+            queue.put_nowait(("done", {"application_id": application.id, "matching_score": score, "matching_source": source}))
+
+        except HTTPException as e:
+            queue.put_nowait(("error", {"status_code": e.status_code, "detail": e.detail}))
+        except Exception as e:
+            logging.error(f"[MATCHING STREAM ERROR] Resume {request.resume_id} / vacancy {request.vacancy_id}: {e}", exc_info=True)
+            queue.put_nowait(("error", {"status_code": 500, "detail": "Error processing matching with Langchain"}))
+        finally:
+            queue.put_nowait(None)
+
+    async def stream_application(self, request: MatchingStreamRequest, session_factory=SessionLocal) -> AsyncIterator[str]:
+        """
+        Server-Sent Events for one application: "score" as soon as it is parsed, "token" for each piece
+        of the explanation, then "done" with the application id once the row is saved, or "error".
+        The completion runs in its own task; if the client disconnects the row is still saved.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        task = asyncio.create_task(self._produce_application_stream(request, queue, session_factory))
+        _stream_tasks.add(task)
+        task.add_done_callback(_stream_tasks.discard)
+
+        yield sse_event("started", {"vacancy_id": request.vacancy_id, "resume_id": request.resume_id})
+        while (event := await queue.get()) is not None:
+            yield sse_event(*event)
+
+    async def create_applications(
+        self, db: AsyncSession, user_id: int, resume_id: int, vacancy_ids: List[int]
+    ) -> List[BatchApplicationResult]:
+        """
+        Applies with one resume to several vacancies, scoring all new pairs with the batched matcher.
+        Vacancies that are not accepted or already applied to, or whose pair could not be scored, are reported as skipped.
+        """
+        logging.info(f"[APPLICATION BATCH] User {user_id} applying to vacancies {vacancy_ids} with resume {resume_id}")
+
+        resume = await self.resume_service.get_resume_by_id(db, resume_id)
+        if not resume or resume.user_id != user_id:
+            raise ValueError("No resume found")
+
+        vacancy_ids = list(dict.fromkeys(vacancy_ids))
+        applied_vacancies = set(await self.vacancy_service.get_applied_vacancies(db, user_id))
+        accepted = {v.id: v for v in await self.vacancy_service.get_accepted_vacancies_by_ids(db, vacancy_ids)}
+
+        results: Dict[int, BatchApplicationResult] = {}
+        vacancies = []
+        for vacancy_id in vacancy_ids:
+            if vacancy_id in applied_vacancies:
+                results[vacancy_id] = BatchApplicationResult(vacancy_id=vacancy_id, status="skipped", detail="You have already applied for this vacancy")
+            elif vacancy_id not in accepted:
+                results[vacancy_id] = BatchApplicationResult(vacancy_id=vacancy_id, status="skipped", detail="This vacancy has not yet been approved. You cannot apply")
+            else:
+                vacancies.append(accepted[vacancy_id])
+
+        if vacancies:
+            matchings = await self.compute_matchings_for_resume(resume, vacancies)
+            for vacancy in [vacancy for vacancy in vacancies if "error" in matchings[vacancy.id]]:
+                results[vacancy.id] = BatchApplicationResult(vacancy_id=vacancy.id, status="skipped", detail="Could not score the application for this vacancy, please try again")
+            vacancies = [vacancy for vacancy in vacancies if vacancy.id not in results]
+            applications = [
+                Application(
+                    user_id=user_id,
+                    vacancy_id=vacancy.id,
+                    resume_id=resume.id,
+                    status=ApplicationStatusEnum.pending,
+                    matching_score=matchings[vacancy.id]["score"],
+                    matching_source=matchings[vacancy.id]["source"],
+                    summary=matchings[vacancy.id]["summary"],
+                    resume_path=resume.resume_link
+                )
+                for vacancy in vacancies
+            ]
+            for application in await self.application_database.create_applications(db, applications):
+                results[application.vacancy_id] = BatchApplicationResult(
+                    vacancy_id=application.vacancy_id,
+                    status="created",
+                    application_id=application.id,
+                    matching_score=application.matching_score
+                )
+
+        logging.info(f"[APPLICATION BATCH SUCCESS] User {user_id}: {len(vacancies)} applications created, {len(vacancy_ids) - len(vacancies)} skipped")
+        return [results[vacancy_id] for vacancy_id in vacancy_ids]
+
     async def accept_candidate(self, db: AsyncSession, application_id: int):
         logging.info(f"[APPLICATION] Accepting candidate for application {application_id}")
         application = await self.application_database.update_application_status(db, application_id, ApplicationStatusEnum.accepted)
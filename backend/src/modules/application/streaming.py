@@ -0,0 +1,47 @@
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, Optional
+
+# The number must be followed by another character, so "7" of a streamed "75" is not taken as the score
+_STREAMED_SCORE_RE = re.compile(r"Соответствие:\s*(\d{1,3})(?=\D)")
+
+
+class ScoreStreamParser:
+    """
+    Picks the score out of a streamed matching answer ("- Соответствие: N") as soon as the number
+    is complete, so the client gets it before the explanation finishes.
+    """
+
+    def __init__(self, max_prefix: int = 500):
+        # The score line comes first; stop scanning once it clearly is not there
+        self.max_prefix = max_prefix
+        self.score: Optional[int] = None
+        self._buffer = ""
+
+    def feed(self, text: str) -> Optional[int]:
+        """Returns the score once, on the chunk that completes it."""
+        if self.score is not None or len(self._buffer) > self.max_prefix:
+            return None
+        self._buffer += text
+        match = _STREAMED_SCORE_RE.search(self._buffer)
+        if match:
+            self.score = int(match.group(1))
+            return self.score
+        return None
+
+
+@dataclass
+class MatchingStreamRequest:
+    """Everything the stream needs, copied out of the ORM objects before the request session closes."""
+    user_id: int
+    vacancy_id: int
+    resume_id: int
+    resume_link: str
+    variables: dict
+    estimated_tokens: int
+    local_matching: Optional[dict] = None
+
+
+def sse_event(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
@@ -0,0 +1,2 @@
+# Relevance ordering runs up to one query per requested skill
+MAX_SEARCH_SKILLS = 10
@@ -0,0 +1,121 @@
+import operator
+from dataclasses import dataclass, field
+from functools import reduce
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import Integer, cast, literal, text, update
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from src.models import Resume
+
+
+@dataclass
+class CandidateFilters:
+    """Normalized search filters; empty lists and None are not applied."""
+    profession_tags: List[str] = field(default_factory=list)
+    grade_level: Optional[int] = None
+    skill_tags: List[str] = field(default_factory=list)
+    match_all_skills: bool = False
+    min_experience: Optional[float] = None
+    max_experience: Optional[float] = None
+    min_salary: Optional[float] = None
+    max_salary: Optional[float] = None
+    language_tags: List[str] = field(default_factory=list)
+
+    @property
+    def ranks_by_skills(self) -> bool:
+        """With several "any" skills the number of matched skills differs between resumes; otherwise it is the same for all."""
+        return len(self.skill_tags) > 1 and not self.match_all_skills
+
+
+SEARCH_COLUMNS = (
+    Resume.id, Resume.user_id, Resume.first_name, Resume.last_name, Resume.profession, Resume.grade,
+    Resume.experience_time, Resume.skills, Resume.languages, Resume.min_salary, Resume.max_salary,
+    Resume.resume_link, Resume.created_at, Resume.skill_tags,
+)
+
+
+class CandidateDatabase():
+    def relevance(self, filters: CandidateFilters):
+        """Number of the requested skills the resume has."""
+        if not filters.ranks_by_skills:
+            return literal(len(filters.skill_tags))
+        return reduce(operator.add, [cast(Resume.skill_tags.contains([tag]), Integer) for tag in filters.skill_tags])
+
+    def conditions(self, filters: CandidateFilters) -> list:
+        # Array filters use the GIN indexes (@> and &&), the ranges the B-tree indexes
+        conditions = []
+        if filters.profession_tags:
+            conditions.append(Resume.profession_tags.contains(filters.profession_tags))
+        if filters.grade_level is not None:
+            conditions.append(Resume.grade_level == filters.grade_level)
+        if filters.skill_tags:
+            conditions.append(
+                Resume.skill_tags.contains(filters.skill_tags) if filters.match_all_skills
+                else Resume.skill_tags.overlap(filters.skill_tags)
+            )
+        if filters.language_tags:
+            conditions.append(Resume.language_tags.contains(filters.language_tags))
+        if filters.min_experience is not None:
+            conditions.append(Resume.experience_time >= filters.min_experience)
+        if filters.max_experience is not None:
+            conditions.append(Resume.experience_time <= filters.max_experience)
+        if filters.min_salary is not None:
+            conditions.append(Resume.min_salary >= filters.min_salary)
+        if filters.max_salary is not None:
+            conditions.append(Resume.min_salary <= filters.max_salary)
+        return conditions
+
+    async def search_resumes(
+        self,
+        db: AsyncSession,
+        filters: CandidateFilters,
+        by_relevance: bool,
+        after: Optional[Tuple[int, int]],
+        limit: int
+    ) -> List[Row]:
+        """
+        One page of matching resumes, best relevance and then newest first when `by_relevance`, newest first otherwise.
+        `after` is the (relevance, id) of the last resume of the previous page: the page continues after it
+        without an OFFSET, so deep pages cost the same as the first one.
+        """
+        # asyncpg prepares statements, and after a few runs PostgreSQL may switch to a generic plan that ignores
+        # the values; how selective the skills or ranges are decides between the GIN indexes and the primary key
+        await db.execute(text("SET LOCAL plan_cache_mode = force_custom_plan"))
+
+        relevance = self.relevance(filters)
+        query = select(*SEARCH_COLUMNS, relevance.label("relevance")).where(*self.conditions(filters))
+
+        if not (by_relevance and filters.ranks_by_skills):
+            # Constant relevance: id order alone, which the primary key index provides
+            if after is not None:
+                query = query.where(Resume.id < after[1])
+            result = await db.execute(query.order_by(Resume.id.desc()).limit(limit))
+            return result.all()
+
+        # One id-ordered query per number of matched skills, most first: each stops after the rows it needs
+        # instead of sorting every resume that has one of the skills
+        most = len(filters.skill_tags)
+        rows: List[Row] = []
+        for level in range(after[0] if after is not None else most, 0, -1):
+            level_query = query.where(Resume.skill_tags.contains(filters.skill_tags) if level == most else relevance == level)
+            if after is not None and level == after[0]:
+                level_query = level_query.where(Resume.id < after[1])
+            result = await db.execute(level_query.order_by(Resume.id.desc()).limit(limit - len(rows)))
+            rows.extend(result.all())
+            if len(rows) >= limit:
+                break
+        return rows
+
+    async def get_resumes_for_tagging(self, db: AsyncSession, after_id: int, limit: int, only_missing: bool = True) -> List[Row]:
+        """Fields the search columns are derived from, in id order after `after_id`."""
+        query = select(Resume.id, Resume.skills, Resume.languages, Resume.profession, Resume.grade).where(Resume.id > after_id)
+        if only_missing:
+            query = query.where(Resume.skill_tags.is_(None))
+        result = await db.execute(query.order_by(Resume.id).limit(limit))
+        return result.all()
+
+    async def update_search_tags(self, db: AsyncSession, values: List[Dict[str, Any]]) -> None:
+        """`values` are dicts with the resume `id` and its search columns; one executemany UPDATE by primary key."""
+        await db.execute(update(Resume), values)
+        await db.commit()
@@ -0,0 +1,7 @@
+from .crud import CandidateDatabase
+from .service import CandidateService
+
+def get_candidate_service() -> CandidateService:
+    return CandidateService(
+        candidate_database=CandidateDatabase()
+    )
@@ -0,0 +1,43 @@
+from datetime import datetime
+from typing import Dict, List, Literal, Optional
+from pydantic import BaseModel
+
+class CandidateSearchQuery(BaseModel):
+    profession: Optional[str] = None
+    grade: Optional[str] = None
+    skills: List[str] = []
+    # "any": at least one of the skills, "all": every skill
+    skills_match: Literal["any", "all"] = "any"
+    min_experience: Optional[float] = None
+    max_experience: Optional[float] = None
+    # Expected salary of the candidate (the resume's minimum) in KZT
+    min_salary: Optional[float] = None
+    max_salary: Optional[float] = None
+    # Every language is required
+    languages: List[str] = []
+    sort: Literal["relevance", "newest"] = "relevance"
+    limit: int = 20
+    cursor: Optional[str] = None
+
+class CandidateSearchItem(BaseModel):
+    resume_id: int
+    user_id: int
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    profession: Optional[str] = None
+    grade: Optional[str] = None
+    experience_time: Optional[float] = None
+    skills: Optional[List[str]] = None
+    languages: Optional[Dict[str, str]] = None
+    min_salary: Optional[float] = None
+    max_salary: Optional[float] = None
+    resume_link: Optional[str] = None
+    created_at: Optional[datetime] = None
+    # Number of the requested skills the resume has
+    relevance: int = 0
+    matched_skills: List[str] = []
+
+class CandidateSearchPage(BaseModel):
+    items: List[CandidateSearchItem]
+    # Pass as `cursor` to get the next page; None on the last page
+    next_cursor: Optional[str] = None
@@ -0,0 +1,95 @@
+import logging
+import time
+from typing import Optional, Tuple
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.core.pagination import decode_cursor, encode_cursor
+from .constants import MAX_SEARCH_SKILLS
+from .crud import CandidateDatabase, CandidateFilters
+from .schemas import CandidateSearchItem, CandidateSearchPage, CandidateSearchQuery
+from .tags import grade_level, language_tags, profession_tags, skill_tags
+
+
+def decode_search_cursor(cursor: str, sort: str) -> Tuple[int, int]:
+    """(relevance, resume id) of a cursor from a search with the same `sort`."""
+    cursor_sort, relevance, resume_id = decode_cursor(cursor, 3)
+    if cursor_sort != sort or not isinstance(relevance, int) or not isinstance(resume_id, int):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return relevance, resume_id
+
+
+class CandidateService:
+    """Filtered search over every resume for HR users, with keyset pagination."""
+
+    def __init__(self, candidate_database=CandidateDatabase):
+        self.candidate_database = candidate_database
+
+    def build_filters(self, query: CandidateSearchQuery) -> CandidateFilters:
+        """Normalizes the query the same way the resume search columns are (see tags.py)."""
+        level = None
+        if query.grade:
+            level = grade_level(query.grade)
+            if level is None:
+                raise HTTPException(status_code=400, detail=f"Unknown grade: {query.grade}")
+        for low, high, name in (
+            (query.min_experience, query.max_experience, "experience"),
+            (query.min_salary, query.max_salary, "salary"),
+        ):
+            if low is not None and high is not None and low > high:
+                raise HTTPException(status_code=400, detail=f"min_{name} is greater than max_{name}")
+        skills = skill_tags(query.skills)
+        if len(skills) > MAX_SEARCH_SKILLS:
+            raise HTTPException(status_code=400, detail=f"At most {MAX_SEARCH_SKILLS} skills can be searched at once")
+
+        return CandidateFilters(
+            profession_tags=profession_tags(query.profession),
+            grade_level=level,
+            skill_tags=skills,
+            match_all_skills=query.skills_match == "all",
+            min_experience=query.min_experience,
+            max_experience=query.max_experience,
+            min_salary=query.min_salary,
+            max_salary=query.max_salary,
+            language_tags=language_tags(query.languages),
+        )
+
+    async def search(self, db: AsyncSession, query: CandidateSearchQuery) -> CandidateSearchPage:
+        filters = self.build_filters(query)
+        after: Optional[Tuple[int, int]] = decode_search_cursor(query.cursor, query.sort) if query.cursor else None
+
+        started = time.perf_counter()
+        # One extra row tells whether there is a next page
+        rows = await self.candidate_database.search_resumes(
+            db, filters, by_relevance=query.sort == "relevance", after=after, limit=query.limit + 1
+        )
+        logging.info(
+            f"[CANDIDATE SEARCH] {min(len(rows), query.limit)} resumes in {(time.perf_counter() - started) * 1000:.1f} ms"
+        )
+
+        requested = set(filters.skill_tags)
+        items = [
+            CandidateSearchItem(
+                resume_id=row.id,
+                user_id=row.user_id,
+                first_name=row.first_name,
+                last_name=row.last_name,
+                profession=row.profession,
+                grade=row.grade,
+                experience_time=row.experience_time,
+                skills=row.skills,
+                languages=row.languages,
+                min_salary=row.min_salary,
+                max_salary=row.max_salary,
+                resume_link=row.resume_link,
+                created_at=row.created_at,
+                relevance=row.relevance,
+                matched_skills=sorted(requested.intersection(row.skill_tags or [])),
+            )
+            for row in rows[:query.limit]
+        ]
+
+        next_cursor = None
+        if len(rows) > query.limit:
+            last = items[-1]
+            next_cursor = encode_cursor([query.sort, last.relevance, last.resume_id])
+        return CandidateSearchPage(items=items, next_cursor=next_cursor)
@@ -0,0 +1,57 @@
+import math
+from typing import Any, Dict, List, Optional
+from src.modules.application.scoring import normalize_skill, parse_grade, parse_skills
+from src.modules.recommendation.catalog import profession_tokens
+
+# Resumes name languages in Russian, English or Kazakh; searches use the Russian name
+LANGUAGE_ALIASES = {
+    "english": "английский",
+    "английский язык": "английский",
+    "ағылшын": "английский",
+    "russian": "русский",
+    "русский язык": "русский",
+    "орыс": "русский",
+    "kazakh": "казахский",
+    "казахский язык": "казахский",
+    "қазақ": "казахский",
+    "қазақ тілі": "казахский",
+    "german": "немецкий",
+    "french": "французский",
+    "chinese": "китайский",
+    "turkish": "турецкий",
+}
+
+
+def normalize_language(language: str) -> str:
+    language = normalize_skill(language)
+    return LANGUAGE_ALIASES.get(language, language)
+
+
+def skill_tags(skills: Any) -> List[str]:
+    return sorted(parse_skills(skills))
+
+
+def language_tags(languages: Any) -> List[str]:
+    """Resume languages are a {name: level} map, only the names are searchable; a search passes a list of names."""
+    if not isinstance(languages, (dict, list, tuple, set)):
+        return []
+    return sorted({normalize_language(name) for name in languages if name and normalize_language(name)})
+
+
+def profession_tags(profession: Optional[str]) -> List[str]:
+    return sorted(profession_tokens(profession))
+
+
+def grade_level(grade: Optional[str]) -> Optional[int]:
+    level = parse_grade(grade)
+    return None if math.isnan(level) else int(level)
+
+
+def search_tags(resume_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Values of the Resume search columns for parsed resume fields."""
+    return {
+        "skill_tags": skill_tags(resume_data.get("skills")),
+        "language_tags": language_tags(resume_data.get("languages")),
+        "profession_tags": profession_tags(resume_data.get("profession")),
+        "grade_level": grade_level(resume_data.get("grade")),
+    }
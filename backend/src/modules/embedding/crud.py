@@ -0,0 +1,93 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.orm import undefer
+from src.models import Application, Resume, Vacancy, VacancyStatusEnum
+
+
+class EmbeddingDatabase():
+    async def get_resume_embeddings(
+        self, db: AsyncSession, embedding_model: str, after_id: int, limit: int
+    ) -> List[Tuple[int, bytes]]:
+        """(id, embedding) of resumes embedded with `embedding_model`, in id order after `after_id`."""
+        result = await db.execute(
+            select(Resume.id, Resume.embedding)
+            .where(Resume.id > after_id, Resume.embedding_model == embedding_model)
+            .order_by(Resume.id)
+            .limit(limit)
+        )
+        return result.all()
+
+    async def get_resume_embeddings_since(
+        self, db: AsyncSession, embedding_model: str, since: datetime
+    ) -> List[Tuple[int, bytes, datetime]]:
+        """Resumes embedded after `since`, e.g. by another process; uses the embedded_at index."""
+        result = await db.execute(
+            select(Resume.id, Resume.embedding, Resume.embedded_at)
+            .where(Resume.embedded_at > since, Resume.embedding_model == embedding_model)
+            .order_by(Resume.embedded_at)
+        )
+        return result.all()
+
+    async def get_accepted_vacancy_embeddings(self, db: AsyncSession, embedding_model: str) -> List[Tuple[int, bytes]]:
+        result = await db.execute(
+            select(Vacancy.id, Vacancy.embedding)
+            .where(Vacancy.status == VacancyStatusEnum.accepted, Vacancy.embedding_model == embedding_model)
+        )
+        return result.all()
+
+    async def get_vacancy_with_embedding(self, db: AsyncSession, vacancy_id: int) -> Optional[Vacancy]:
+        result = await db.execute(
+            select(Vacancy)
+            .options(undefer(Vacancy.embedding))
+            .where(Vacancy.id == vacancy_id)
+            # The vacancy is usually already in the session with the column unloaded
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
+    async def save_vacancy(self, db: AsyncSession, vacancy: Vacancy) -> None:
+        try:
+            await db.commit()
+            await db.refresh(vacancy)
+        except:
+            await db.rollback()
+            raise
+
+    async def get_resumes_without_embedding(
+        self, db: AsyncSession, embedding_model: str, after_id: int, limit: int
+    ) -> List[Resume]:
+        result = await db.execute(
+            select(Resume)
+            .where(
+                Resume.id > after_id,
+                or_(Resume.embedding_model.is_(None), Resume.embedding_model != embedding_model)
+            )
+            .order_by(Resume.id)
+            .limit(limit)
+        )
+        return result.scalars().all()
+
+    async def get_vacancies_without_embedding(
+        self, db: AsyncSession, embedding_model: str, after_id: int, limit: int
+    ) -> List[Vacancy]:
+        result = await db.execute(
+            select(Vacancy)
+            .where(
+                Vacancy.id > after_id,
+                or_(Vacancy.embedding_model.is_(None), Vacancy.embedding_model != embedding_model)
+            )
+            .order_by(Vacancy.id)
+            .limit(limit)
+        )
+        return result.scalars().all()
+
+    async def get_resumes_by_ids(self, db: AsyncSession, resume_ids: List[int]) -> List[Resume]:
+        result = await db.execute(select(Resume).where(Resume.id.in_(resume_ids)))
+        return result.scalars().all()
+
+    async def get_applied_resume_ids(self, db: AsyncSession, vacancy_id: int) -> List[int]:
+        result = await db.execute(select(Application.resume_id).where(Application.vacancy_id == vacancy_id))
+        return list(result.scalars().all())
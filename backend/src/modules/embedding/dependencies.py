@@ -0,0 +1,27 @@
+from fastapi import Depends
+from src.core.clients import get_client_registry, get_embedding_encoder
+from .crud import EmbeddingDatabase
+from .index import VectorIndex
+from .service import EmbeddingService
+from .sync import EmbeddingIndexSync
+
+# Shared by every request in the process; filled and refreshed by embedding_index_sync
+resume_index = VectorIndex("resumes")
+# Accepted vacancies only
+vacancy_index = VectorIndex("vacancies")
+
+def get_embedding_service(encoder=Depends(get_embedding_encoder)) -> EmbeddingService:
+    return EmbeddingService(
+        encoder=encoder,
+        embedding_database=EmbeddingDatabase(),
+        resume_index=resume_index,
+        vacancy_index=vacancy_index
+    )
+
+def build_embedding_service() -> EmbeddingService:
+    """
+    Builds an EmbeddingService outside of a request, for the background workers and commands.
+    """
+    return get_embedding_service(encoder=get_client_registry().embedding_encoder)
+
+embedding_index_sync = EmbeddingIndexSync(embedding_service_factory=build_embedding_service)
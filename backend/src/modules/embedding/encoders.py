@@ -0,0 +1,116 @@
+import math
+import re
+import zlib
+from collections import Counter
+from typing import Any, Sequence
+import httpx
+import numpy as np
+from langchain_openai import AzureOpenAIEmbeddings
+from src.core.config import BackendConfig
+
+_TOKEN_RE = re.compile(r"[\w+#.]+", re.UNICODE)
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalizes each row, so cosine similarity is a dot product; zero rows stay zero."""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms > 0, norms, 1.0)
+
+
+def to_bytes(vector: np.ndarray) -> bytes:
+    return np.asarray(vector, dtype=np.float16).tobytes()
+
+
+def from_bytes(data: bytes) -> np.ndarray:
+    return np.frombuffer(data, dtype=np.float16).astype(np.float32)
+
+
+def _join(value: Any) -> str:
+    if isinstance(value, (list, tuple, set)):
+        return ", ".join(str(item) for item in value)
+    return str(value) if value is not None else ""
+
+
+def resume_embedding_text(resume: Any) -> str:
+    """What a resume is searched by; works on the ORM row and on ResumeCreate."""
+    parts = [
+        resume.profession,
+        resume.grade,
+        f"Навыки: {_join(resume.skills)}" if resume.skills else None,
+        f"Опыт: {resume.experience_time} лет" if resume.experience_time is not None else None,
+        resume.summary,
+    ]
+    return ". ".join(str(part) for part in parts if part)
+
+
+def vacancy_embedding_text(vacancy: Any) -> str:
+    parts = [
+        vacancy.title,
+        vacancy.position,
+        f"Навыки: {_join(vacancy.skills)}" if vacancy.skills else None,
+        vacancy.description,
+    ]
+    return ". ".join(str(part) for part in parts if part)
+
+
+class HashingEncoder:
+    """
+    Offline encoder: word unigrams and bigrams are hashed into `dimensions` signed buckets with
+    sublinear term frequency. Needs no model or network and is stable across processes (CRC32, not hash()).
+    """
+    deployment_name = "hashing"
+
+    def __init__(self, dimensions: int = BackendConfig.EMBEDDING_DIMENSIONS):
+        self.dimensions = dimensions
+        self.name = f"hashing-v1-{dimensions}"
+
+    def _features(self, text: str) -> Counter:
+        words = [word.strip(".") for word in _TOKEN_RE.findall(text.lower())]
+        words = [word for word in words if word]
+        return Counter(words + [f"{a} {b}" for a, b in zip(words, words[1:])])
+
+    def encode_one(self, text: str) -> np.ndarray:
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        for feature, count in self._features(text).items():
+            h = zlib.crc32(feature.encode("utf-8"))
+            vector[h % self.dimensions] += (1.0 + math.log(count)) * (1.0 if (h >> 31) & 1 else -1.0)
+        return vector
+
+    async def encode(self, texts: Sequence[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, self.dimensions), dtype=np.float32)
+        return normalize_rows(np.stack([self.encode_one(text) for text in texts]))
+
+
+class AzureEncoder:
+    """Azure OpenAI embeddings deployment (AZURE_OPENAI_EMBEDDING_DEPLOYMENT), shortened to `dimensions`."""
+
+    def __init__(self, http_client: httpx.AsyncClient = None, dimensions: int = BackendConfig.EMBEDDING_DIMENSIONS):
+        self.dimensions = dimensions
+        self.deployment_name = BackendConfig.AZURE_OPENAI_EMBEDDING_DEPLOYMENT
+        self.name = f"azure-{self.deployment_name}-{dimensions}"
+        self.embeddings = AzureOpenAIEmbeddings(
+            azure_endpoint=BackendConfig.AZURE_OPENAI_ENDPOINT,
+            api_key=BackendConfig.AZURE_OPENAI_API_KEY,
+            azure_deployment=self.deployment_name,
+            api_version=BackendConfig.AZURE_OPENAI_API_VERSION,
+            dimensions=dimensions,
+            timeout=BackendConfig.LLM_ATTEMPT_TIMEOUT_SECONDS,
+            max_retries=0,
+            http_async_client=http_client
+        )
+
+    async def encode(self, texts: Sequence[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, self.dimensions), dtype=np.float32)
+        return normalize_rows(np.array(await self.embeddings.aembed_documents(list(texts)), dtype=np.float32))
+
+
+def build_encoder(http_client: httpx.AsyncClient = None, backend: str = BackendConfig.EMBEDDING_BACKEND):
+    if backend == "hashing":
+        return HashingEncoder()
+    if backend == "azure":
+        return AzureEncoder(http_client)
+    raise ValueError(f"Unknown EMBEDDING_BACKEND: {backend}")
+
@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+class SimilarCandidate(BaseModel):
+    resume_id: int
+    user_id: int
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    profession: Optional[str] = None
+    grade: Optional[str] = None
+    experience_time: Optional[float] = None
+    skills: Optional[List[str]] = None
+    min_salary: Optional[float] = None
+    resume_link: Optional[str] = None
+    # Cosine similarity of the resume and vacancy embeddings, -1..1
+    similarity: float
+    # The candidate has already applied to the vacancy with this resume
+    already_applied: bool = False
@@ -0,0 +1,169 @@
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.core.llm_limiter import estimate_tokens
+from src.core.llm_resilience import LLMCaller, llm_caller as default_llm_caller
+from src.models import Vacancy, VacancyStatusEnum
+from .crud import EmbeddingDatabase
+from .encoders import HashingEncoder, from_bytes, resume_embedding_text, to_bytes, vacancy_embedding_text
+from .index import VectorIndex
+
+# Vacancy fields that make up its embedding text
+VACANCY_EMBEDDING_FIELDS = ("title", "position", "skills", "description")
+
+
+class EmbeddingService:
+    """
+    Keeps one embedding per resume and per vacancy, computed when the row is saved, and answers
+    "which resumes are closest to this vacancy" from the in-process indexes instead of scanning rows.
+    Embedding failures never fail the save: the row is stored without an embedding and
+    picked up later by `python -m src.commands.backfill_embeddings`.
+    """
+
+    def __init__(
+        self,
+        encoder,
+        embedding_database=EmbeddingDatabase,
+        resume_index: VectorIndex = None,
+        vacancy_index: VectorIndex = None,
+        llm_caller: LLMCaller = None
+    ):
+        self.encoder = encoder
+        self.embedding_database = embedding_database
+        self.resume_index = resume_index
+        self.vacancy_index = vacancy_index
+        self.llm_caller = llm_caller or default_llm_caller
+
+    @property
+    def model_name(self) -> str:
+        return self.encoder.name
+
+    async def encode(self, texts: Sequence[str], call_site: str) -> np.ndarray:
+        if isinstance(self.encoder, HashingEncoder):
+            return await self.encoder.encode(texts)
+        return await self.llm_caller.call(
+            call_site,
+            lambda: self.encoder.encode(texts),
+            estimate_tokens("".join(texts)),
+            llm=self.encoder
+        )
+
+    async def try_encode(self, texts: Sequence[str], call_site: str) -> Optional[np.ndarray]:
+        try:
+            return await self.encode(texts, call_site)
+        except Exception as e:
+            detail = getattr(e, "detail", None) or str(e)
+            logging.warning(f"[EMBEDDING] {call_site} failed for {len(texts)} texts, saving without embeddings: {detail}")
+            return None
+
+    async def embed_resume_schemas(self, resume_schemas: List[Any]) -> None:
+        """
+        Sets embedding, embedding_model and embedded_at on ResumeCreate schemas, one encoder call for all;
+        None when the encoder failed, so a re-analyzed resume does not keep the vector of its old text.
+        """
+        vectors = await self.try_encode([resume_embedding_text(schema) for schema in resume_schemas], "embed_resumes")
+        if vectors is None:
+            for schema in resume_schemas:
+                schema.embedding = None
+                schema.embedding_model = None
+                schema.embedded_at = None
+            return
+        embedded_at = datetime.utcnow()
+        for schema, vector in zip(resume_schemas, vectors):
+            schema.embedding = to_bytes(vector)
+            schema.embedding_model = self.model_name
+            schema.embedded_at = embedded_at
+
+    def index_resume(self, resume_id: int, resume_schema: Any) -> None:
+        """Called after the commit; a resume saved without an embedding leaves the index until it is backfilled."""
+        if self.resume_index is None:
+            return
+        if resume_schema.embedding and resume_schema.embedding_model == self.model_name:
+            self.resume_index.add(resume_id, from_bytes(resume_schema.embedding))
+        else:
+            self.resume_index.remove(resume_id)
+
+    async def embed_vacancy(self, vacancy: Vacancy) -> None:
+        """Sets the embedding columns on a vacancy before it is saved."""
+        vectors = await self.try_encode([vacancy_embedding_text(vacancy)], "embed_vacancy")
+        if vectors is None:
+            vacancy.embedding = None
+            vacancy.embedding_model = None
+            return
+        vacancy.embedding = to_bytes(vectors[0])
+        vacancy.embedding_model = self.model_name
+        vacancy.embedded_at = datetime.utcnow()
+
+    async def sync_vacancy(self, db: AsyncSession, vacancy_id: int) -> None:
+        """
+        Puts an accepted vacancy into the vacancy index and takes any other one out, e.g. after a status change.
+        Accepted vacancies saved without an embedding are embedded here.
+        """
+        if self.vacancy_index is None:
+            return
+        vacancy = await self.embedding_database.get_vacancy_with_embedding(db, vacancy_id)
+        if not vacancy or vacancy.status != VacancyStatusEnum.accepted:
+            self.vacancy_index.remove(vacancy_id)
+            return
+
+        if not vacancy.embedding or vacancy.embedding_model != self.model_name:
+            await self.embed_vacancy(vacancy)
+            if not vacancy.embedding:
+                self.vacancy_index.remove(vacancy_id)
+                return
+            embedding = vacancy.embedding
+            await self.embedding_database.save_vacancy(db, vacancy)
+        else:
+            embedding = vacancy.embedding
+        self.vacancy_index.add(vacancy_id, from_bytes(embedding))
+
+    def remove_vacancy(self, vacancy_id: int) -> None:
+        if self.vacancy_index is not None:
+            self.vacancy_index.remove(vacancy_id)
+
+    async def get_vacancy_vector(self, db: AsyncSession, vacancy: Vacancy) -> np.ndarray:
+        vector = self.vacancy_index.get(vacancy.id) if self.vacancy_index is not None else None
+        if vector is not None:
+            return vector
+
+        stored = await self.embedding_database.get_vacancy_with_embedding(db, vacancy.id)
+        if stored and stored.embedding and stored.embedding_model == self.model_name:
+            return from_bytes(stored.embedding)
+        # Not embedded yet (e.g. saved while the encoder was unavailable): encode on the fly
+        return (await self.encode([vacancy_embedding_text(vacancy)], "embed_vacancy"))[0]
+
+    async def find_candidates(self, db: AsyncSession, vacancy: Vacancy, limit: int) -> List[Dict[str, Any]]:
+        """Resumes most similar to the vacancy, best first, from the resume index."""
+        query = await self.get_vacancy_vector(db, vacancy)
+        hits = self.resume_index.search(query, limit)
+        if not hits:
+            return []
+
+        resumes = {resume.id: resume for resume in await self.embedding_database.get_resumes_by_ids(db, [resume_id for resume_id, _ in hits])}
+        applied = set(await self.embedding_database.get_applied_resume_ids(db, vacancy.id))
+
+        candidates = []
+        for resume_id, similarity in hits:
+            resume = resumes.get(resume_id)
+            if resume is None:
+                # Deleted since the index was loaded
+                self.resume_index.remove(resume_id)
+                continue
+            candidates.append({
+                "resume_id": resume.id,
+                "user_id": resume.user_id,
+                "first_name": resume.first_name,
+                "last_name": resume.last_name,
+                "profession": resume.profession,
+                "grade": resume.grade,
+                "experience_time": resume.experience_time,
+                "skills": resume.skills,
+                "min_salary": resume.min_salary,
+                "resume_link": resume.resume_link,
+                "similarity": round(min(similarity, 1.0), 4),
+                "already_applied": resume.id in applied
+            })
+        logging.info(f"[EMBEDDING] {len(candidates)} similar candidates for vacancy {vacancy.id}")
+        return candidates
@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional
+import numpy as np
+from src.core.config import BackendConfig
+from src.core.database import SessionLocal
+from .service import EmbeddingService
+
+# Rows are stamped with embedded_at before their transaction commits; refreshes look back this far so a slow commit is not missed
+COMMIT_LAG = timedelta(minutes=5)
+
+
+class EmbeddingIndexSync:
+    """
+    Fills the in-process indexes from the database at startup, then keeps them in step with rows
+    embedded by other processes (other app workers, ingestion, backfill): every refresh_interval it adds
+    resumes embedded since the last refresh and reloads the accepted vacancies, which are few.
+    The resume index is rebuilt from scratch once it has grown too much for its lists.
+    Changes made by this process are applied to the indexes directly by EmbeddingService.
+    """
+
+    def __init__(
+        self,
+        embedding_service_factory: Callable[[], EmbeddingService],
+        session_factory=SessionLocal,
+        batch_size: int = BackendConfig.EMBEDDING_LOAD_BATCH_SIZE,
+        refresh_interval: float = BackendConfig.EMBEDDING_INDEX_REFRESH_SECONDS
+    ):
+        self.embedding_service_factory = embedding_service_factory
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.refresh_interval = refresh_interval
+        self.watermark: Optional[datetime] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+
+    async def start(self):
+        if self._task or self.refresh_interval <= 0:
+            return
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._run())
+        logging.info("[EMBEDDING INDEX] Sync started")
+
+    async def stop(self):
+        self._stopping.set()
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        logging.info("[EMBEDDING INDEX] Sync stopped")
+
+    async def _run(self):
+        while not self._stopping.is_set():
+            try:
+                if self.watermark is None:
+                    await self.load()
+                else:
+                    await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.error(f"[EMBEDDING INDEX] Sync failed: {e}", exc_info=True)
+
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.refresh_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def _to_matrix(self, embeddings: List[bytes], dimensions: int) -> np.ndarray:
+        if not embeddings:
+            return np.zeros((0, dimensions), dtype=np.float16)
+        return np.frombuffer(b"".join(embeddings), dtype=np.float16).reshape(len(embeddings), dimensions)
+
+    async def load(self):
+        """Reads every resume embedding of the current model in id order, batch_size rows per query, and rebuilds both indexes."""
+        service = self.embedding_service_factory()
+        model_name = service.model_name
+        dimensions = service.resume_index.dimensions
+        started = time.perf_counter()
+        watermark = datetime.utcnow() - COMMIT_LAG
+
+        # Each batch becomes one float16 matrix right away, so the raw bytes of at most one batch are held at a time
+        id_batches: List[np.ndarray] = []
+        vector_batches: List[np.ndarray] = []
+        async with self.session_factory() as db:
+            after_id = 0
+            while True:
+                rows = await service.embedding_database.get_resume_embeddings(db, model_name, after_id, self.batch_size)
+                if not rows:
+                    break
+                rows_ok = [(resume_id, embedding) for resume_id, embedding in rows if embedding and len(embedding) == dimensions * 2]
+                id_batches.append(np.array([resume_id for resume_id, _ in rows_ok], dtype=np.int64))
+                vector_batches.append(self._to_matrix([embedding for _, embedding in rows_ok], dimensions))
+                after_id = rows[-1][0]
+
+        ids = np.concatenate(id_batches) if id_batches else np.zeros(0, dtype=np.int64)
+        vectors = np.concatenate(vector_batches) if vector_batches else self._to_matrix([], dimensions)
+        id_batches.clear()
+        vector_batches.clear()
+        await service.resume_index.rebuild(ids, vectors)
+        await self.reload_vacancies(service)
+        self.watermark = watermark
+        logging.info(
+            f"[EMBEDDING INDEX] Loaded {len(ids)} resumes and {len(service.vacancy_index)} vacancies "
+            f"embedded with {model_name} in {time.perf_counter() - started:.2f}s"
+        )
+
+    async def refresh(self):
+        service = self.embedding_service_factory()
+        if service.resume_index.needs_rebuild():
+            await self.load()
+            return
+        watermark = datetime.utcnow() - COMMIT_LAG
+        async with self.session_factory() as db:
+            rows = await service.embedding_database.get_resume_embeddings_since(db, service.model_name, self.watermark)
+        dimensions = service.resume_index.dimensions
+        for resume_id, embedding, _ in rows:
+            if embedding and len(embedding) == dimensions * 2:
+                service.resume_index.add(resume_id, self._to_matrix([embedding], dimensions)[0])
+        await self.reload_vacancies(service)
+        self.watermark = watermark
+        if rows:
+            logging.info(f"[EMBEDDING INDEX] Refreshed {len(rows)} resume embeddings")
+
+    async def reload_vacancies(self, service: EmbeddingService):
+        dimensions = service.vacancy_index.dimensions
+        async with self.session_factory() as db:
+            rows = await service.embedding_database.get_accepted_vacancy_embeddings(db, service.model_name)
+        rows = [(vacancy_id, embedding) for vacancy_id, embedding in rows if embedding and len(embedding) == dimensions * 2]
+        await service.vacancy_index.rebuild(
+            np.array([vacancy_id for vacancy_id, _ in rows], dtype=np.int64),
+            self._to_matrix([embedding for _, embedding in rows], dimensions)
+        )
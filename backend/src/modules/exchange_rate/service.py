@@ -0,0 +1,171 @@
+import asyncio
+import logging
+import time
+import xml.etree.ElementTree as ET
+from typing import Any, Dict, Optional
+import httpx
+from src.core.config import BackendConfig
+
+
+class ExchangeRateService:
+    """
+    KZT exchange rates from the National Bank RSS feed.
+    The whole feed is parsed into a {currency: rate} dict and cached for ttl_seconds.
+    Concurrent refreshes share a single request, and if the feed is unavailable the last
+    known rates are served for up to max_stale_seconds.
+    """
+
+    def __init__(
+        self,
+        feed_url: str = BackendConfig.NATIONAL_BANK_API_URL,
+        ttl_seconds: float = BackendConfig.EXCHANGE_RATE_TTL_SECONDS,
+        max_stale_seconds: float = BackendConfig.EXCHANGE_RATE_MAX_STALE_SECONDS,
+        timeout: float = BackendConfig.EXCHANGE_RATE_TIMEOUT_SECONDS,
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
+        self.feed_url = feed_url
+        self.ttl_seconds = ttl_seconds
+        self.max_stale_seconds = max_stale_seconds
+        self.timeout = timeout
+        self.http_client = http_client
+        self._owns_client = http_client is None
+
+        self._rates: Dict[str, float] = {}
+        self._fetched_at: Optional[float] = None
+        self._inflight: Optional[asyncio.Future] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+        self.fetches = 0
+        self.fetch_errors = 0
+        self.cache_hits = 0
+        self.stale_served = 0
+
+    async def get_rate(self, currency: str) -> Optional[float]:
+        currency = currency.upper()
+        if currency == "KZT":
+            return 1.0
+
+        rates = await self.get_rates()
+        rate = rates.get(currency)
+        if rate is None:
+            logging.warning(f"[EXCHANGE RATE] Exchange rate {currency} not found")
+        return rate
+
+    async def get_rates(self) -> Dict[str, float]:
+        if self._is_fresh():
+            self.cache_hits += 1
+            return self._rates
+
+        try:
+            return await self.refresh()
+        except Exception as e:
+            if self._rates and self._age() <= self.max_stale_seconds:
+                self.stale_served += 1
+                logging.warning(f"[EXCHANGE RATE] Feed unavailable, serving rates from {self._age():.0f}s ago: {e}")
+                return self._rates
+            logging.error(f"[EXCHANGE RATE ERROR] Error getting exchange rates: {e}", exc_info=True)
+            return {}
+
+    async def refresh(self) -> Dict[str, float]:
+        """Fetches the feed; callers arriving while a fetch is in flight wait for the same request."""
+        if self._inflight is None:
+            self._inflight = asyncio.ensure_future(self._fetch())
+            self._inflight.add_done_callback(self._clear_inflight)
+        return await asyncio.shield(self._inflight)
+
+    def _clear_inflight(self, future: asyncio.Future):
+        if self._inflight is future:
+            self._inflight = None
+
+    async def _fetch(self) -> Dict[str, float]:
+        self.fetches += 1
+        try:
+            client = self._get_client()
+            response = await client.get(self.feed_url, timeout=self.timeout)
+            logging.info(f"[EXCHANGE RATE] Response from National Bank: {response.status_code}")
+            response.raise_for_status()
+            rates = self.parse_feed(response.text)
+        except Exception:
+            self.fetch_errors += 1
+            raise
+
+        if not rates:
+            self.fetch_errors += 1
+            raise ValueError("National Bank feed contains no rates")
+
+        self._rates = rates
+        self._fetched_at = time.monotonic()
+        logging.info(f"[EXCHANGE RATE] Cached {len(rates)} exchange rates")
+        return rates
+
+    @staticmethod
+    def parse_feed(xml_text: str) -> Dict[str, float]:
+        rates = {}
+        root = ET.fromstring(xml_text)
+        for item in root.findall(".//item"):
+            title = item.findtext("title")
+            description = item.findtext("description")
+            if not title or not description:
+                continue
+            try:
+                rate = float(description.strip().replace(",", "."))
+                quant = float((item.findtext("quant") or "1").strip().replace(",", ".")) or 1.0
+            except ValueError:
+                continue
+            # Some currencies are quoted per 10 or 100 units
+            rates[title.strip().upper()] = rate / quant
+        return rates
+
+    def use_http_client(self, http_client: httpx.AsyncClient):
+        """Switches to a shared client owned (and closed) by the caller."""
+        self.http_client = http_client
+        self._owns_client = False
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self.http_client is None:
+            self.http_client = httpx.AsyncClient()
+            self._owns_client = True
+        return self.http_client
+
+    def _age(self) -> float:
+        return time.monotonic() - self._fetched_at if self._fetched_at is not None else float("inf")
+
+    def _is_fresh(self) -> bool:
+        return bool(self._rates) and self._age() < self.ttl_seconds
+
+    def start_periodic_refresh(self, interval_seconds: float = BackendConfig.EXCHANGE_RATE_REFRESH_INTERVAL_SECONDS):
+        if interval_seconds <= 0 or self._refresh_task is not None:
+            return
+
+        async def refresh_loop():
+            while True:
+                try:
+                    await self.refresh()
+                except Exception as e:
+                    logging.warning(f"[EXCHANGE RATE] Background refresh failed: {e}")
+                await asyncio.sleep(interval_seconds)
+
+        self._refresh_task = asyncio.create_task(refresh_loop())
+        logging.info(f"[EXCHANGE RATE] Background refresh every {interval_seconds}s")
+
+    async def aclose(self):
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            await asyncio.gather(self._refresh_task, return_exceptions=True)
+            self._refresh_task = None
+        if self.http_client is not None and self._owns_client:
+            await self.http_client.aclose()
+            self.http_client = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "currencies": len(self._rates),
+            "age_seconds": round(self._age(), 1) if self._fetched_at is not None else None,
+            "fetches": self.fetches,
+            "fetch_errors": self.fetch_errors,
+            "cache_hits": self.cache_hits,
+            "stale_served": self.stale_served,
+        }
+
+
+exchange_rate_service = ExchangeRateService()
@@ -0,0 +1,8 @@
+# Stages of the background resume pipeline, in execution order
+INGESTION_STAGES = ("upload", "extract", "analyze", "save")
+
+STAGE_PENDING = "pending"
+STAGE_RUNNING = "running"
+STAGE_DONE = "done"
+STAGE_CACHED = "cached"
+STAGE_FAILED = "failed"
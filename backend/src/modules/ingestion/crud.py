@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy import or_, and_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from src.models import ResumeIngestionJob, IngestionJobStatusEnum
+
+
+class IngestionJobDatabase():
+    async def create_job(self, db: AsyncSession, job: ResumeIngestionJob) -> ResumeIngestionJob:
+        db.add(job)
+        await db.commit()
+        await db.refresh(job)
+        return job
+
+    async def get_job_by_id(self, db: AsyncSession, job_id: int) -> Optional[ResumeIngestionJob]:
+        result = await db.execute(select(ResumeIngestionJob).where(ResumeIngestionJob.id == job_id))
+        return result.scalar_one_or_none()
+
+    async def get_user_job(self, db: AsyncSession, job_id: int, user_id: int) -> Optional[ResumeIngestionJob]:
+        result = await db.execute(
+            select(ResumeIngestionJob).where(
+                ResumeIngestionJob.id == job_id,
+                ResumeIngestionJob.user_id == user_id
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def claim_next_job(self, db: AsyncSession, lease_seconds: int, max_attempts: int) -> Optional[ResumeIngestionJob]:
+        """
+        Atomically picks the oldest runnable job and leases it to the caller.
+        Jobs left in 'processing' by a crashed or restarted worker become runnable again once their lease expires,
+        or fail if that was their last attempt. SKIP LOCKED lets several workers (and gunicorn processes) poll the
+        same table without blocking each other.
+        """
+        now = datetime.utcnow()
+        await self.fail_abandoned_jobs(db, now, max_attempts)
+        query = (
+            select(ResumeIngestionJob)
+            .where(
+                ResumeIngestionJob.attempts < max_attempts,
+                or_(
+                    and_(
+                        ResumeIngestionJob.status == IngestionJobStatusEnum.queued,
+                        or_(ResumeIngestionJob.locked_until.is_(None), ResumeIngestionJob.locked_until <= now)
+                    ),
+                    and_(
+                        ResumeIngestionJob.status == IngestionJobStatusEnum.processing,
+                        ResumeIngestionJob.locked_until <= now
+                    )
+                )
+            )
+            .order_by(ResumeIngestionJob.id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        result = await db.execute(query)
+        job = result.scalar_one_or_none()
+        if not job:
+            await db.commit()
+            return None
+
+        job.status = IngestionJobStatusEnum.processing
+        job.attempts = (job.attempts or 0) + 1
+        job.locked_until = now + timedelta(seconds=lease_seconds)
+        await db.commit()
+        await db.refresh(job)
+        return job
+
+    async def fail_abandoned_jobs(self, db: AsyncSession, now: datetime, max_attempts: int) -> None:
+        """Fails jobs whose last attempt died with its worker; without this they would stay 'processing' forever."""
+        await db.execute(
+            update(ResumeIngestionJob)
+            .where(
+                ResumeIngestionJob.status == IngestionJobStatusEnum.processing,
+                ResumeIngestionJob.locked_until <= now,
+                ResumeIngestionJob.attempts >= max_attempts
+            )
+            .values(
+                status=IngestionJobStatusEnum.failed,
+                error="The worker stopped during the last attempt",
+                payload=None,
+                resume_text=None,
+                locked_until=None
+            )
+        )
+
+    async def update_job(self, db: AsyncSession, job: ResumeIngestionJob) -> ResumeIngestionJob:
+        await db.commit()
+        await db.refresh(job)
+        return job
@@ -0,0 +1,21 @@
+from src.core.clients import get_client_registry
+from src.modules.embedding.dependencies import build_embedding_service
+from src.modules.resume.dependencies import get_resume_service
+from .crud import IngestionJobDatabase
+from .service import IngestionService
+from .worker import ResumeIngestionWorker
+
+def build_resume_service():
+    """
+    Builds a ResumeService outside of a request, for the background workers.
+    """
+    clients = get_client_registry()
+    return get_resume_service(llm=clients.analysis_llm, storage=clients.storage, embedding_service=build_embedding_service())
+
+resume_ingestion_worker = ResumeIngestionWorker(resume_service_factory=build_resume_service)
+
+def get_ingestion_service():
+    return IngestionService(
+        job_database=IngestionJobDatabase(),
+        worker=resume_ingestion_worker
+    )
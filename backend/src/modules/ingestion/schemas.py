@@ -0,0 +1,24 @@
+from pydantic import BaseModel
+from typing import Dict, Optional
+from datetime import datetime
+from src.models import IngestionJobStatusEnum
+
+class IngestionJobAccepted(BaseModel):
+    message: str
+    job_id: int
+    status: IngestionJobStatusEnum
+
+class IngestionJobResponse(BaseModel):
+    id: int
+    filename: Optional[str] = None
+    status: IngestionJobStatusEnum
+    stage: Optional[str] = None
+    stages: Optional[Dict[str, str]] = None
+    attempts: int
+    error: Optional[str] = None
+    resume_id: Optional[int] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
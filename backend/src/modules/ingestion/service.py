@@ -0,0 +1,48 @@
+import logging
+from fastapi import HTTPException, UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.core.config import BackendConfig
+from src.models import ResumeIngestionJob, IngestionJobStatusEnum
+from .constants import INGESTION_STAGES, STAGE_PENDING
+from .crud import IngestionJobDatabase
+
+
+class IngestionService:
+    def __init__(self, job_database=IngestionJobDatabase, worker=None):
+        self.job_database = job_database
+        self.worker = worker
+
+    async def enqueue_resume(self, db: AsyncSession, file: UploadFile, user_id: int) -> ResumeIngestionJob:
+        logging.info(f"[RESUME INGESTION] Queueing resume {file.filename} for user {user_id}")
+
+        file_bytes = await file.read(BackendConfig.MAX_RESUME_UPLOAD_BYTES + 1)
+        if len(file_bytes) > BackendConfig.MAX_RESUME_UPLOAD_BYTES:
+            logging.warning(f"[RESUME INGESTION] File {file.filename} exceeds the upload size limit")
+            raise HTTPException(status_code=413, detail="Uploaded file is too large")
+        if not file_bytes:
+            logging.warning(f"[RESUME INGESTION] Empty file received from user {user_id}")
+            raise HTTPException(status_code=400, detail="Uploaded file is empty")
+
+        job = ResumeIngestionJob(
+            user_id=user_id,
+            filename=file.filename,
+            payload=file_bytes,
+            status=IngestionJobStatusEnum.queued,
+            stages={stage: STAGE_PENDING for stage in INGESTION_STAGES},
+            attempts=0
+        )
+        job = await self.job_database.create_job(db, job)
+
+        if self.worker:
+            self.worker.notify()
+
+        logging.info(f"[RESUME INGESTION] Job {job.id} queued for user {user_id}")
+        return job
+
+    async def get_job_status(self, db: AsyncSession, job_id: int, user_id: int) -> ResumeIngestionJob:
+        logging.info(f"[RESUME INGESTION] Fetching job {job_id} for user {user_id}")
+        job = await self.job_database.get_user_job(db, job_id, user_id)
+        if not job:
+            logging.warning(f"❗ [RESUME INGESTION] Job {job_id} not found for user {user_id}")
+            raise HTTPException(status_code=404, detail="Ingestion job not found")
+        return job
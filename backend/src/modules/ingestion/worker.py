@@ -0,0 +1,193 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Callable, List
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.core.config import BackendConfig
+from src.core.database import SessionLocal
+from src.core.llm_limiter import LLMPriority, llm_priority
+from src.core.llm_resilience import llm_caller
+from src.models import ResumeIngestionJob, IngestionJobStatusEnum
+from src.modules.resume.cache import hash_pdf_bytes
+from src.modules.resume.service import ResumeService
+from .constants import STAGE_RUNNING, STAGE_DONE, STAGE_CACHED, STAGE_FAILED
+from .crud import IngestionJobDatabase
+
+
+class ResumeIngestionWorker:
+    """
+    Pool of asyncio workers draining the resume_ingestion_jobs table.
+    Concurrency is bounded by the number of worker tasks; the queue itself lives in the
+    database, so queued and interrupted jobs are picked up again after a restart.
+    """
+
+    def __init__(
+        self,
+        resume_service_factory: Callable[[], ResumeService],
+        session_factory=SessionLocal,
+        job_database: IngestionJobDatabase = None,
+        concurrency: int = BackendConfig.INGESTION_WORKERS,
+        poll_interval: float = BackendConfig.INGESTION_POLL_INTERVAL_SECONDS,
+        lease_seconds: int = BackendConfig.INGESTION_LEASE_SECONDS,
+        max_attempts: int = BackendConfig.INGESTION_MAX_ATTEMPTS
+    ):
+        self.resume_service_factory = resume_service_factory
+        self.session_factory = session_factory
+        self.job_database = job_database or IngestionJobDatabase()
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._tasks: List[asyncio.Task] = []
+        self._stopping = asyncio.Event()
+        self._wakeup = asyncio.Event()
+
+    async def start(self):
+        if self._tasks or self.concurrency <= 0:
+            return
+        self._stopping.clear()
+        self._tasks = [asyncio.create_task(self._run(worker_id)) for worker_id in range(self.concurrency)]
+        logging.info(f"[INGESTION WORKER] Started {self.concurrency} workers")
+
+    async def stop(self):
+        self._stopping.set()
+        self._wakeup.set()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logging.info("[INGESTION WORKER] Workers stopped")
+
+    def notify(self):
+        """Wakes idle workers in this process right away instead of waiting for the next poll."""
+        self._wakeup.set()
+
+    async def _run(self, worker_id: int):
+        # Queued uploads are not awaited by anyone, so interactive LLM calls go first
+        llm_priority.set(LLMPriority.bulk)
+        while not self._stopping.is_set():
+            breaker = llm_caller.breaker_for()
+            if breaker.is_open():
+                # Jobs would only burn attempts while the AI service is down; wait for the half-open probe
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=breaker.retry_after())
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            try:
+                processed = await self.process_next()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.error(f"[INGESTION WORKER {worker_id}] Unexpected error: {e}", exc_info=True)
+                processed = False
+
+            if not processed:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+
+    async def process_next(self) -> bool:
+        async with self.session_factory() as db:
+            job = await self.job_database.claim_next_job(db, self.lease_seconds, self.max_attempts)
+            if not job:
+                return False
+
+            logging.info(f"[INGESTION WORKER] Processing job {job.id} (attempt {job.attempts})")
+            try:
+                await self.process_job(db, job)
+            except Exception as e:
+                await self._handle_failure(db, job, e)
+            return True
+
+    async def process_job(self, db: AsyncSession, job: ResumeIngestionJob):
+        resume_service = self.resume_service_factory()
+        pdf_bytes = job.payload
+
+        if not job.resume_link:
+            await self._set_stage(db, job, "upload", STAGE_RUNNING)
+            job.resume_link = await resume_service.save_resume(pdf_bytes)
+            await self._set_stage(db, job, "upload", STAGE_DONE)
+
+        if job.analysis is None:
+            content_hash = hash_pdf_bytes(pdf_bytes)
+            cached = resume_service.get_cached_analysis(content_hash)
+            if cached:
+                resume_text, resume_data = cached
+                await self._set_stage(db, job, "extract", STAGE_CACHED)
+                job.resume_text = resume_text
+                job.analysis = resume_data
+                await self._set_stage(db, job, "analyze", STAGE_CACHED)
+            else:
+                await self._set_stage(db, job, "extract", STAGE_RUNNING)
+                raw_text = await resume_service.extract_text_from_pdf(pdf_bytes)
+                job.resume_text = resume_service.prepare_resume_text(raw_text)
+                await self._set_stage(db, job, "extract", STAGE_DONE)
+
+                await self._set_stage(db, job, "analyze", STAGE_RUNNING)
+                resume_data = await resume_service.analyze_resume(job.resume_text)
+                resume_service.cache_analysis(content_hash, job.resume_text, resume_data)
+                job.analysis = resume_data
+                await self._set_stage(db, job, "analyze", STAGE_DONE)
+
+        await self._set_stage(db, job, "save", STAGE_RUNNING)
+        # The resume and the job are saved in separate commits: an attempt that died between them
+        # already created the resume of this upload, so it is not inserted twice
+        resume = await resume_service.get_resume_by_link(db, job.user_id, job.resume_link)
+        if resume:
+            logging.warning(f"[INGESTION WORKER] Job {job.id} already saved resume {resume.id}, completing the job")
+        else:
+            resume = await resume_service.save_resume_to_db(
+                db, job.analysis, job.resume_link, job.user_id, resume_text=job.resume_text
+            )
+        resume_id = resume.id
+        await db.refresh(job)
+
+        job.resume_id = resume_id
+        job.status = IngestionJobStatusEnum.completed
+        job.payload = None
+        job.resume_text = None
+        job.error = None
+        job.locked_until = None
+        await self._set_stage(db, job, "save", STAGE_DONE)
+        logging.info(f"✅ [INGESTION WORKER] Job {job.id} completed, resume {resume_id} created")
+
+    async def _set_stage(self, db: AsyncSession, job: ResumeIngestionJob, stage: str, state: str):
+        stages = dict(job.stages or {})
+        stages[stage] = state
+        job.stages = stages
+        job.stage = stage
+        if state == STAGE_RUNNING:
+            # Heartbeat: each stage gets a full lease, so a slow extraction or LLM call is not taken over mid-job
+            job.locked_until = datetime.utcnow() + timedelta(seconds=self.lease_seconds)
+        await self.job_database.update_job(db, job)
+
+    async def _handle_failure(self, db: AsyncSession, job: ResumeIngestionJob, error: Exception):
+        await db.rollback()
+        await db.refresh(job)
+
+        permanent = isinstance(error, HTTPException) and error.status_code < 500
+        detail = error.detail if isinstance(error, HTTPException) else str(error)
+
+        stages = dict(job.stages or {})
+        if job.stage:
+            stages[job.stage] = STAGE_FAILED
+        job.stages = stages
+        job.error = str(detail)
+
+        if permanent or job.attempts >= self.max_attempts:
+            job.status = IngestionJobStatusEnum.failed
+            job.payload = None
+            job.resume_text = None
+            job.locked_until = None
+            logging.error(f"[INGESTION WORKER] Job {job.id} failed permanently at stage {job.stage}: {detail}")
+        else:
+            backoff = min(self.lease_seconds, 10 * 2 ** (job.attempts - 1))
+            job.status = IngestionJobStatusEnum.queued
+            job.locked_until = datetime.utcnow() + timedelta(seconds=backoff)
+            logging.warning(f"[INGESTION WORKER] Job {job.id} failed at stage {job.stage}, retrying in {backoff}s: {detail}")
+
+        await self.job_database.update_job(db, job)
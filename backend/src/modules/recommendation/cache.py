@@ -0,0 +1,25 @@
+from typing import Optional
+from src.core.cache import TTLCache
+from src.core.config import BackendConfig
+from src.models import JobFormatEnum
+from .catalog import vacancy_catalog
+
+# Ranked vacancies per user and job format; entries also carry the catalog generation they were ranked against
+recommendation_cache: TTLCache[dict] = TTLCache(
+    name="recommendations",
+    max_size=BackendConfig.RECOMMENDATION_CACHE_MAX_SIZE,
+    ttl_seconds=BackendConfig.RECOMMENDATION_CACHE_TTL_SECONDS,
+)
+
+def build_recommendation_cache_key(user_id: int, job_format: Optional[JobFormatEnum]) -> tuple:
+    return (user_id, job_format.value if job_format else None)
+
+def invalidate_user_recommendations(user_id: int) -> None:
+    """After the user saved a resume: recommendations follow the latest one."""
+    for job_format in (None, *JobFormatEnum):
+        recommendation_cache.invalidate(build_recommendation_cache_key(user_id, job_format))
+
+def invalidate_all_recommendations() -> None:
+    """After a vacancy was accepted or withdrawn: every ranking may change."""
+    vacancy_catalog.invalidate()
+    recommendation_cache.clear()
@@ -0,0 +1,186 @@
+import asyncio
+import logging
+import re
+import time
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.core.config import BackendConfig
+from src.models import JobFormatEnum, Vacancy
+from src.modules.application.scoring import (
+    GRADE_LEVELS, NEUTRAL, experience_bounds, experience_fit, grade_fit, offered_salaries, parse_grade, salary_fit
+)
+from src.modules.vacancy.schemas import VacancyPublic
+from .constants import RECOMMENDATION_COMPONENTS
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+JOB_FORMAT_CODES = {job_format: code for code, job_format in enumerate(JobFormatEnum)}
+
+PAYLOAD_FIELDS = (*VacancyPublic.model_fields, "company")
+
+
+def profession_tokens(*texts: Optional[str]) -> Set[str]:
+    """Words of a profession or vacancy title; grade words are scored separately and left out."""
+    words = {word for text in texts if text for word in _WORD_RE.findall(text.lower())}
+    return {word for word in words if len(word) > 1 and word not in GRADE_LEVELS}
+
+
+def _postings(item_sets: Iterable[Set[str]]) -> Dict[str, np.ndarray]:
+    """Inverted index: item -> rows that contain it."""
+    rows: Dict[str, List[int]] = defaultdict(list)
+    for row, items in enumerate(item_sets):
+        for item in items:
+            rows[item].append(row)
+    return {item: np.array(item_rows, dtype=np.int64) for item, item_rows in rows.items()}
+
+
+def _count_hits(postings: Dict[str, np.ndarray], items: Iterable[str], size: int) -> np.ndarray:
+    hits = np.zeros(size, dtype=np.float32)
+    for item in items:
+        rows = postings.get(item)
+        if rows is not None:
+            hits[rows] += 1
+    return hits
+
+
+class CatalogState:
+    """
+    Accepted vacancies in id order, with every feature the ranking needs as an array or inverted index.
+    `vacancy_skills` are the vacancy_skill posting lists of the skill index, by vacancy id.
+    """
+
+    def __init__(self, vacancies: List[Vacancy], vacancy_skills: Dict[int, Set[str]]):
+        vacancies = sorted(vacancies, key=lambda vacancy: vacancy.id)
+        self.ids = np.array([vacancy.id for vacancy in vacancies], dtype=np.int64)
+        self.payloads = [{field: getattr(vacancy, field) for field in PAYLOAD_FIELDS} for vacancy in vacancies]
+
+        self.skills = [vacancy_skills.get(vacancy.id, set()) for vacancy in vacancies]
+        self.required_skills = np.array([len(skills) for skills in self.skills], dtype=np.float32)
+        self.skill_postings = _postings(self.skills)
+        self.profession_postings = _postings(
+            profession_tokens(vacancy.title, *(p.get("profession") for p in vacancy.classification or []))
+            for vacancy in vacancies
+        )
+        self.experience_low, self.experience_high = experience_bounds(vacancies)
+        self.grades = np.array([parse_grade(vacancy.position) for vacancy in vacancies], dtype=np.float32)
+        self.salaries = offered_salaries(vacancies)
+        self.job_formats = np.array([JOB_FORMAT_CODES.get(vacancy.job_format, -1) for vacancy in vacancies], dtype=np.int8)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def rows_of(self, vacancy_ids: np.ndarray) -> np.ndarray:
+        """Rows of the given ids, -1 for ids not in the catalog."""
+        rows = np.searchsorted(self.ids, vacancy_ids)
+        rows = np.minimum(rows, max(len(self.ids) - 1, 0))
+        found = (self.ids[rows] == vacancy_ids) if len(self.ids) else np.zeros(len(vacancy_ids), dtype=bool)
+        return np.where(found, rows, -1)
+
+    def components(
+        self, resume: Any, resume_skills: Set[str], job_format: Optional[JobFormatEnum], semantic: Optional[np.ndarray]
+    ) -> np.ndarray:
+        """(len(self), len(RECOMMENDATION_COMPONENTS)) scores from 0 to 1 of every vacancy for one resume."""
+        size = len(self)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            skills = np.where(
+                self.required_skills > 0,
+                _count_hits(self.skill_postings, resume_skills, size) / np.maximum(self.required_skills, 1),
+                NEUTRAL
+            )
+
+        tokens = profession_tokens(resume.profession)
+        if tokens:
+            profession = _count_hits(self.profession_postings, tokens, size) / len(tokens)
+        else:
+            profession = np.full(size, NEUTRAL, dtype=np.float32)
+
+        years = np.float32(resume.experience_time if resume.experience_time is not None else np.nan)
+        experience = experience_fit(years, self.experience_low, self.experience_high)
+        grade = grade_fit(np.float32(parse_grade(resume.grade)), self.grades)
+        expected = np.float32(resume.min_salary if resume.min_salary is not None else np.nan)
+        salary = salary_fit(expected, self.salaries)
+
+        if job_format is None:
+            job_formats = np.full(size, NEUTRAL, dtype=np.float32)
+        else:
+            wanted = JOB_FORMAT_CODES[job_format]
+            hybrid = JOB_FORMAT_CODES[JobFormatEnum.hybrid]
+            # Hybrid is halfway between office and remote
+            partial = (self.job_formats == hybrid) | (wanted == hybrid)
+            job_formats = np.where(self.job_formats == wanted, 1.0, np.where(partial, 0.5, 0.0))
+
+        if semantic is None:
+            semantic = np.full(size, NEUTRAL, dtype=np.float32)
+
+        columns = {
+            "skills": skills, "profession": profession, "semantic": semantic, "experience": experience,
+            "grade": grade, "salary": salary, "job_format": job_formats,
+        }
+        return np.stack(
+            [np.broadcast_to(columns[name], (size,)) for name in RECOMMENDATION_COMPONENTS], axis=-1
+        ).astype(np.float32)
+
+
+class VacancyCatalog:
+    """
+    Process-wide CatalogState, loaded on first use and again after invalidate() (a vacancy was accepted
+    or withdrawn here) or once it is older than max_age_seconds (changes made by other processes).
+    `generation` changes on every invalidation, so results computed from an older catalog can be recognized.
+    """
+
+    def __init__(self, max_age_seconds: float = BackendConfig.RECOMMENDATION_CATALOG_MAX_AGE_SECONDS):
+        self.max_age_seconds = max_age_seconds
+        self.generation = 0
+        self.loads = 0
+        self.last_load_ms = 0.0
+        self._state: Optional[CatalogState] = None
+        self._loaded_at = 0.0
+        self._loaded_generation = -1
+        self._lock = asyncio.Lock()
+
+    def invalidate(self) -> None:
+        self.generation += 1
+
+    def _needs_load(self) -> bool:
+        return (
+            self._state is None
+            or self._loaded_generation != self.generation
+            or time.monotonic() - self._loaded_at > self.max_age_seconds
+        )
+
+    async def get(
+        self,
+        db: AsyncSession,
+        load_vacancies: Callable[[AsyncSession], Awaitable[List[Vacancy]]],
+        load_vacancy_skills: Callable[[AsyncSession], Awaitable[Dict[int, Set[str]]]]
+    ) -> CatalogState:
+        if self._needs_load():
+            async with self._lock:
+                if self._needs_load():
+                    started = time.perf_counter()
+                    generation = self.generation
+                    state = CatalogState(await load_vacancies(db), await load_vacancy_skills(db))
+                    if generation == self._loaded_generation and not np.array_equal(state.ids, self._state.ids):
+                        # Reloaded for age and another process accepted or withdrew vacancies: cached rankings are outdated too
+                        self.generation += 1
+                        generation = self.generation
+                    self._state = state
+                    self._loaded_at = time.monotonic()
+                    self._loaded_generation = generation
+                    self.loads += 1
+                    self.last_load_ms = (time.perf_counter() - started) * 1000
+                    logging.info(f"[RECOMMENDATIONS] Loaded {len(state)} accepted vacancies in {self.last_load_ms:.1f} ms")
+        return self._state
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "vacancies": len(self._state) if self._state is not None else 0,
+            "generation": self.generation,
+            "loads": self.loads,
+            "last_load_ms": round(self.last_load_ms, 2),
+        }
+
+
+vacancy_catalog = VacancyCatalog()
@@ -0,0 +1,6 @@
+import numpy as np
+
+RECOMMENDATION_COMPONENTS = ("skills", "profession", "semantic", "experience", "grade", "salary", "job_format")
+
+# Same order as RECOMMENDATION_COMPONENTS
+RECOMMENDATION_WEIGHTS = np.array([0.35, 0.2, 0.1, 0.1, 0.1, 0.1, 0.05], dtype=np.float32)
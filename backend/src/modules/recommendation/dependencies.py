@@ -0,0 +1,18 @@
+from src.modules.embedding.dependencies import resume_index, vacancy_index
+from src.modules.resume.crud import ResumeDatabase
+from src.modules.skill.crud import SkillIndexDatabase
+from src.modules.vacancy.crud import VacancyDatabase
+from .cache import recommendation_cache
+from .catalog import vacancy_catalog
+from .service import RecommendationService
+
+def get_recommendation_service() -> RecommendationService:
+    return RecommendationService(
+        resume_database=ResumeDatabase(),
+        vacancy_database=VacancyDatabase(),
+        skill_index_database=SkillIndexDatabase(),
+        catalog=vacancy_catalog,
+        cache=recommendation_cache,
+        resume_index=resume_index,
+        vacancy_index=vacancy_index
+    )
@@ -0,0 +1,8 @@
+from typing import List
+from src.modules.vacancy.schemas import VacancyPublic
+
+class RecommendedVacancy(VacancyPublic):
+    company: str
+    # 0-100, higher is a better fit for the user's latest resume
+    score: int
+    matched_skills: List[str] = []
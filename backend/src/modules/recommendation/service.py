@@ -0,0 +1,127 @@
+import logging
+import time
+from typing import Any, Dict, List, Optional, Set
+import numpy as np
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.core.cache import TTLCache
+from src.core.config import BackendConfig
+from src.models import JobFormatEnum, VacancyStatusEnum
+from src.modules.application.scoring import NEUTRAL
+from src.modules.embedding.index import VectorIndex
+from src.modules.resume.crud import ResumeDatabase
+from src.modules.skill.crud import SkillIndexDatabase
+from src.modules.vacancy.crud import VacancyDatabase
+from .cache import build_recommendation_cache_key, recommendation_cache
+from .catalog import CatalogState, VacancyCatalog, vacancy_catalog
+from .constants import RECOMMENDATION_WEIGHTS
+
+
+class RecommendationService:
+    """
+    Ranks accepted vacancies for the user's latest resume. Every vacancy is scored at once with array
+    operations over the in-memory catalog, so no LLM call or per-vacancy query is on the request path;
+    the ranking is cached per user until the user saves a resume or the set of accepted vacancies changes.
+    """
+
+    def __init__(
+        self,
+        resume_database=ResumeDatabase,
+        vacancy_database=VacancyDatabase,
+        skill_index_database=SkillIndexDatabase,
+        catalog: VacancyCatalog = None,
+        cache: TTLCache = None,
+        resume_index: Optional[VectorIndex] = None,
+        vacancy_index: Optional[VectorIndex] = None,
+        cache_depth: int = BackendConfig.RECOMMENDATION_CACHE_DEPTH
+    ):
+        self.resume_database = resume_database
+        self.vacancy_database = vacancy_database
+        self.skill_index_database = skill_index_database
+        self.catalog = catalog or vacancy_catalog
+        self.cache = cache or recommendation_cache
+        self.resume_index = resume_index
+        self.vacancy_index = vacancy_index
+        self.cache_depth = cache_depth
+
+    async def get_recommendations(
+        self, db: AsyncSession, user_id: int, limit: int, job_format: Optional[JobFormatEnum] = None
+    ) -> List[Dict[str, Any]]:
+        applied = set(await self.vacancy_database.get_applied_vacancies(db, user_id))
+
+        cache_key = build_recommendation_cache_key(user_id, job_format)
+        ranking = self.cache.get(cache_key)
+        if ranking is None or ranking["generation"] != self.catalog.generation:
+            ranking = await self.rank_for_user(db, user_id, job_format, applied)
+            self.cache.set(cache_key, ranking)
+
+        # Applications made since the ranking was cached are dropped here
+        return [item for item in ranking["items"] if item["id"] not in applied][:limit]
+
+    async def rank_for_user(
+        self, db: AsyncSession, user_id: int, job_format: Optional[JobFormatEnum], applied: Set[int]
+    ) -> Dict[str, Any]:
+        generation = self.catalog.generation
+        resume = await self.resume_database.get_latest_resume_by_user_id(db, user_id)
+        if not resume:
+            raise HTTPException(status_code=404, detail="Upload a resume to get recommendations")
+
+        state = await self.catalog.get(
+            db,
+            lambda session: self.vacancy_database.get_vacancies_by_status(session, VacancyStatusEnum.accepted),
+            lambda session: self.skill_index_database.get_vacancy_skills_by_status(session, VacancyStatusEnum.accepted)
+        )
+        resume_skills = await self.skill_index_database.get_resume_skills(db, resume.id)
+        started = time.perf_counter()
+        items = self.rank(state, resume, resume_skills, job_format, applied)
+        logging.info(
+            f"[RECOMMENDATIONS] Ranked {len(state)} vacancies for user {user_id} (resume {resume.id}) "
+            f"in {(time.perf_counter() - started) * 1000:.1f} ms"
+        )
+        return {"generation": generation, "resume_id": resume.id, "items": items}
+
+    def semantic_scores(self, state: CatalogState, resume_id: int) -> Optional[np.ndarray]:
+        """Embedding similarity rescaled to 0..1 across vacancies; neutral for vacancies without an embedding."""
+        if self.resume_index is None or self.vacancy_index is None or not len(self.vacancy_index):
+            return None
+        query = self.resume_index.get(resume_id)
+        if query is None:
+            return None
+
+        hits = self.vacancy_index.search(query, len(self.vacancy_index))
+        scores = np.full(len(state), NEUTRAL, dtype=np.float32)
+        if not hits:
+            return scores
+        # Vacancies in the index that a partial (IVF) search did not reach are the least similar
+        scores[[row for row, vacancy_id in enumerate(state.ids.tolist()) if vacancy_id in self.vacancy_index]] = 0.0
+
+        hit_ids = np.array([vacancy_id for vacancy_id, _ in hits], dtype=np.int64)
+        similarities = np.array([similarity for _, similarity in hits], dtype=np.float32)
+        low, high = similarities.min(), similarities.max()
+        scaled = (similarities - low) / (high - low) if high > low else np.ones_like(similarities)
+        rows = state.rows_of(hit_ids)
+        scores[rows[rows >= 0]] = scaled[rows >= 0]
+        return scores
+
+    def rank(
+        self, state: CatalogState, resume, resume_skills: Set[str], job_format: Optional[JobFormatEnum], applied: Set[int]
+    ) -> List[Dict[str, Any]]:
+        if not len(state):
+            return []
+        components = state.components(resume, resume_skills, job_format, self.semantic_scores(state, resume.id))
+        scores = components @ RECOMMENDATION_WEIGHTS
+        if applied:
+            scores[np.isin(state.ids, np.fromiter(applied, dtype=np.int64, count=len(applied)))] = -1
+
+        # Best score first, newer vacancies first among equal scores
+        order = np.lexsort((-state.ids, -scores))
+        order = order[scores[order] >= 0][:self.cache_depth]
+
+        return [
+            {
+                **state.payloads[row],
+                "score": int(round(float(scores[row]) * 100)),
+                "matched_skills": sorted(resume_skills & state.skills[row]),
+            }
+            for row in order
+        ]
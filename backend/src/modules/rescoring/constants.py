@@ -0,0 +1,6 @@
+RESCORING_TARGET_VACANCY = "vacancy"
+RESCORING_TARGET_RESUME = "resume"
+
+# Fields that go into the matching prompt or the local score; edits to other fields keep scores valid
+VACANCY_MATCHING_FIELDS = ("title", "description", "skills", "experience_time", "position", "salary_min", "salary_max")
+RESUME_MATCHING_FIELDS = ("skills", "experience_time", "profession", "grade", "min_salary")
@@ -0,0 +1,157 @@
+from datetime import datetime, timedelta
+from typing import List, Optional
+from sqlalchemy import and_, exists, func, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.orm import aliased
+from src.models import Application, ApplicationRescoringJob, ApplicationStatusEnum, RescoringJobStatusEnum
+from .constants import RESCORING_TARGET_RESUME
+
+
+class RescoringJobDatabase():
+    async def schedule_job(
+        self, db: AsyncSession, target_type: str, target_id: int, changed_fields: List[str], run_after: datetime
+    ) -> ApplicationRescoringJob:
+        """
+        Adds the job to the caller's transaction without committing, so it is saved together with the edit.
+        If the target already has a queued job the edit is coalesced into it and its start is pushed back;
+        the partial unique index on queued jobs turns a concurrent insert for the same target into an update.
+        """
+        for _ in range(3):
+            job = await self.get_queued_job(db, target_type, target_id, for_update=True)
+            if job:
+                job.changed_fields = sorted(set(job.changed_fields or []) | set(changed_fields))
+                job.edits = (job.edits or 0) + 1
+                job.run_after = max(job.run_after, run_after)
+                await db.flush()
+                return job
+
+            job = ApplicationRescoringJob(
+                target_type=target_type,
+                target_id=target_id,
+                status=RescoringJobStatusEnum.queued,
+                changed_fields=sorted(set(changed_fields)),
+                edits=1,
+                processed=0,
+                last_application_id=0,
+                attempts=0,
+                run_after=run_after
+            )
+            try:
+                async with db.begin_nested():
+                    db.add(job)
+            except IntegrityError:
+                continue
+            return job
+        raise RuntimeError(f"Could not schedule re-scoring of {target_type} {target_id}")
+
+    async def get_queued_job(
+        self, db: AsyncSession, target_type: str, target_id: int, for_update: bool = False
+    ) -> Optional[ApplicationRescoringJob]:
+        query = select(ApplicationRescoringJob).where(
+            ApplicationRescoringJob.target_type == target_type,
+            ApplicationRescoringJob.target_id == target_id,
+            ApplicationRescoringJob.status == RescoringJobStatusEnum.queued
+        )
+        if for_update:
+            query = query.with_for_update()
+        result = await db.execute(query)
+        return result.scalar_one_or_none()
+
+    async def claim_next_job(self, db: AsyncSession, lease_seconds: int, max_attempts: int) -> Optional[ApplicationRescoringJob]:
+        """
+        Leases the oldest job whose coalescing window has passed, like IngestionJobDatabase.claim_next_job.
+        Jobs of a target that is still being processed wait, so two passes over the same applications never overlap.
+        """
+        now = datetime.utcnow()
+        await self.fail_abandoned_jobs(db, now, max_attempts)
+        running = aliased(ApplicationRescoringJob)
+        query = (
+            select(ApplicationRescoringJob)
+            .where(
+                ApplicationRescoringJob.attempts < max_attempts,
+                or_(
+                    and_(
+                        ApplicationRescoringJob.status == RescoringJobStatusEnum.queued,
+                        ApplicationRescoringJob.run_after <= now,
+                        or_(ApplicationRescoringJob.locked_until.is_(None), ApplicationRescoringJob.locked_until <= now),
+                        ~exists().where(
+                            running.target_type == ApplicationRescoringJob.target_type,
+                            running.target_id == ApplicationRescoringJob.target_id,
+                            running.status == RescoringJobStatusEnum.processing,
+                            running.locked_until > now
+                        )
+                    ),
+                    and_(
+                        ApplicationRescoringJob.status == RescoringJobStatusEnum.processing,
+                        ApplicationRescoringJob.locked_until <= now
+                    )
+                )
+            )
+            .order_by(ApplicationRescoringJob.run_after, ApplicationRescoringJob.id)
+            .limit(1)
+            .with_for_update(skip_locked=True, of=ApplicationRescoringJob)
+        )
+        result = await db.execute(query)
+        job = result.scalar_one_or_none()
+        if not job:
+            await db.commit()
+            return None
+
+        job.status = RescoringJobStatusEnum.processing
+        job.attempts = (job.attempts or 0) + 1
+        job.locked_until = now + timedelta(seconds=lease_seconds)
+        job.started_at = job.started_at or now
+        await db.commit()
+        await db.refresh(job)
+        return job
+
+    async def fail_abandoned_jobs(self, db: AsyncSession, now: datetime, max_attempts: int) -> None:
+        """
+        Fails jobs whose last attempt died with its worker, like IngestionJobDatabase.fail_abandoned_jobs;
+        the queued job of the same target can then run.
+        """
+        await db.execute(
+            update(ApplicationRescoringJob)
+            .where(
+                ApplicationRescoringJob.status == RescoringJobStatusEnum.processing,
+                ApplicationRescoringJob.locked_until <= now,
+                ApplicationRescoringJob.attempts >= max_attempts
+            )
+            .values(
+                status=RescoringJobStatusEnum.failed,
+                error="The worker stopped during the last attempt",
+                locked_until=None,
+                finished_at=now
+            )
+        )
+
+    async def update_job(self, db: AsyncSession, job: ApplicationRescoringJob) -> ApplicationRescoringJob:
+        await db.commit()
+        await db.refresh(job)
+        return job
+
+    async def get_latest_job(self, db: AsyncSession, target_type: str, target_id: int) -> Optional[ApplicationRescoringJob]:
+        result = await db.execute(
+            select(ApplicationRescoringJob)
+            .where(ApplicationRescoringJob.target_type == target_type, ApplicationRescoringJob.target_id == target_id)
+            .order_by(ApplicationRescoringJob.id.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    async def count_active_resume_jobs_for_vacancy(self, db: AsyncSession, vacancy_id: int) -> int:
+        """Queued or running jobs of resumes with a pending application to the vacancy."""
+        resume_ids = select(Application.resume_id).where(
+            Application.vacancy_id == vacancy_id,
+            Application.status == ApplicationStatusEnum.pending
+        )
+        result = await db.execute(
+            select(func.count(ApplicationRescoringJob.id)).where(
+                ApplicationRescoringJob.target_type == RESCORING_TARGET_RESUME,
+                ApplicationRescoringJob.target_id.in_(resume_ids),
+                ApplicationRescoringJob.status.in_([RescoringJobStatusEnum.queued, RescoringJobStatusEnum.processing])
+            )
+        )
+        return result.scalar_one()
@@ -0,0 +1,24 @@
+from src.core.clients import get_client_registry
+from src.modules.application.crud import ApplicationDatabase
+from src.modules.application.service import ApplicationService
+from .crud import RescoringJobDatabase
+from .service import RescoringService
+from .worker import ApplicationRescoringWorker
+
+def build_application_service():
+    """
+    Builds an ApplicationService outside of a request, for the re-scoring workers.
+    Re-scoring only matches stored resumes and vacancies, so no vacancy or resume service is needed.
+    """
+    clients = get_client_registry()
+    return ApplicationService(
+        application_database=ApplicationDatabase(),
+        vacancy_service=None,
+        resume_service=None,
+        llm=clients.matching_llm
+    )
+
+application_rescoring_worker = ApplicationRescoringWorker(application_service_factory=build_application_service)
+
+def get_rescoring_service():
+    return RescoringService(job_database=RescoringJobDatabase())
@@ -0,0 +1,31 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import datetime
+from src.models import RescoringJobStatusEnum
+
+class RescoringJobResponse(BaseModel):
+    id: int
+    target_type: str
+    target_id: int
+    status: RescoringJobStatusEnum
+    changed_fields: Optional[List[str]] = None
+    edits: int
+    total: Optional[int] = None
+    processed: int
+    attempts: int
+    error: Optional[str] = None
+    run_after: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class VacancyRescoringStatus(BaseModel):
+    vacancy_id: int
+    # Latest re-scoring after an edit of the vacancy, None if it was never edited
+    job: Optional[RescoringJobResponse] = None
+    # Edited resumes of pending candidates whose applications are still waiting to be re-scored
+    pending_resume_jobs: int
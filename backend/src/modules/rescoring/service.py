@@ -0,0 +1,41 @@
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.core.config import BackendConfig
+from src.models import ApplicationRescoringJob
+from .constants import RESCORING_TARGET_VACANCY
+from .crud import RescoringJobDatabase
+
+
+def changed_matching_fields(current: Any, update: Dict[str, Any], fields: Iterable[str]) -> List[str]:
+    """Matching fields whose value in `update` differs from the one stored on `current`."""
+    return [field for field in fields if field in update and update[field] != getattr(current, field, None)]
+
+
+class RescoringService:
+    def __init__(
+        self,
+        job_database=RescoringJobDatabase,
+        debounce_seconds: float = BackendConfig.RESCORING_DEBOUNCE_SECONDS
+    ):
+        self.job_database = job_database
+        self.debounce_seconds = debounce_seconds
+
+    async def schedule(self, db: AsyncSession, target_type: str, target_id: int, changed_fields: List[str]) -> ApplicationRescoringJob:
+        """
+        Queues re-scoring of the target's pending applications in the caller's transaction; the edit request
+        only pays for one row. The job starts debounce_seconds after the last edit, so a burst of edits is one pass.
+        """
+        run_after = datetime.utcnow() + timedelta(seconds=self.debounce_seconds)
+        job = await self.job_database.schedule_job(db, target_type, target_id, changed_fields, run_after)
+        logging.info(
+            f"[RESCORING] Scheduled re-scoring of {target_type} {target_id} after changes to {changed_fields} "
+            f"(job {job.id}, {job.edits} edits coalesced)"
+        )
+        return job
+
+    async def get_vacancy_progress(self, db: AsyncSession, vacancy_id: int) -> Dict[str, Any]:
+        job: Optional[ApplicationRescoringJob] = await self.job_database.get_latest_job(db, RESCORING_TARGET_VACANCY, vacancy_id)
+        resume_jobs = await self.job_database.count_active_resume_jobs_for_vacancy(db, vacancy_id)
+        return {"vacancy_id": vacancy_id, "job": job, "pending_resume_jobs": resume_jobs}
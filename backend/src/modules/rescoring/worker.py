@@ -0,0 +1,172 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Callable, List
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.core.config import BackendConfig
+from src.core.database import SessionLocal
+from src.core.llm_limiter import LLMPriority, llm_priority
+from src.core.llm_resilience import LLM_UNAVAILABLE_ERRORS, llm_caller
+from src.models import ApplicationRescoringJob, RescoringJobStatusEnum
+from src.modules.application.service import ApplicationService
+from .constants import RESCORING_TARGET_VACANCY
+from .crud import RescoringJobDatabase
+
+
+class ApplicationRescoringWorker:
+    """
+    Pool of asyncio workers draining the application_rescoring_jobs table, like ResumeIngestionWorker.
+    Each job walks the target's pending applications in chunks of chunk_size, saving its cursor after
+    every chunk, so a restarted or retried job does not re-score what it already saved.
+    """
+
+    def __init__(
+        self,
+        application_service_factory: Callable[[], ApplicationService],
+        session_factory=SessionLocal,
+        job_database: RescoringJobDatabase = None,
+        concurrency: int = BackendConfig.RESCORING_WORKERS,
+        poll_interval: float = BackendConfig.RESCORING_POLL_INTERVAL_SECONDS,
+        chunk_size: int = BackendConfig.RESCORING_CHUNK_SIZE,
+        lease_seconds: int = BackendConfig.RESCORING_LEASE_SECONDS,
+        max_attempts: int = BackendConfig.RESCORING_MAX_ATTEMPTS
+    ):
+        self.application_service_factory = application_service_factory
+        self.session_factory = session_factory
+        self.job_database = job_database or RescoringJobDatabase()
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.chunk_size = chunk_size
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._tasks: List[asyncio.Task] = []
+        self._stopping = asyncio.Event()
+
+    async def start(self):
+        if self._tasks or self.concurrency <= 0:
+            return
+        self._stopping.clear()
+        self._tasks = [asyncio.create_task(self._run(worker_id)) for worker_id in range(self.concurrency)]
+        logging.info(f"[RESCORING WORKER] Started {self.concurrency} workers")
+
+    async def stop(self):
+        self._stopping.set()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logging.info("[RESCORING WORKER] Workers stopped")
+
+    async def _wait(self, seconds: float):
+        try:
+            await asyncio.wait_for(self._stopping.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _run(self, worker_id: int):
+        # Nobody waits on re-scoring, so applicants and HR users go first
+        llm_priority.set(LLMPriority.bulk)
+        while not self._stopping.is_set():
+            breaker = llm_caller.breaker_for()
+            if breaker.is_open():
+                await self._wait(breaker.retry_after())
+                continue
+            try:
+                processed = await self.process_next()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.error(f"[RESCORING WORKER {worker_id}] Unexpected error: {e}", exc_info=True)
+                processed = False
+
+            if not processed:
+                # Jobs become runnable only after their coalescing window, so there is nothing to wake up early for
+                await self._wait(self.poll_interval)
+
+    async def process_next(self) -> bool:
+        async with self.session_factory() as db:
+            job = await self.job_database.claim_next_job(db, self.lease_seconds, self.max_attempts)
+            if not job:
+                return False
+
+            logging.info(f"[RESCORING WORKER] Processing job {job.id}: {job.target_type} {job.target_id} (attempt {job.attempts})")
+            try:
+                await self.process_job(db, job)
+            except Exception as e:
+                await self._handle_failure(db, job, e)
+            return True
+
+    async def process_job(self, db: AsyncSession, job: ApplicationRescoringJob):
+        application_service = self.application_service_factory()
+        application_database = application_service.application_database
+        target = {f"{job.target_type}_id": job.target_id}
+
+        job.total = job.processed + await application_database.count_pending_applications(
+            db, after_id=job.last_application_id, **target
+        )
+        await self.job_database.update_job(db, job)
+
+        while True:
+            applications = await application_database.get_pending_applications(
+                db, job.last_application_id, self.chunk_size, **target
+            )
+            if not applications:
+                break
+
+            # Read before the commit below expires the loaded rows
+            last_application_id = applications[-1].id
+            count = len(applications)
+            if job.target_type == RESCORING_TARGET_VACANCY:
+                await application_service.rescore_vacancy_applications(db, applications[0].vacancy, applications)
+            else:
+                await application_service.rescore_resume_applications(db, applications[0].resume, applications)
+
+            await db.refresh(job)
+            job.processed += count
+            job.last_application_id = last_application_id
+            job.total = max(job.total or 0, job.processed)
+            job.locked_until = datetime.utcnow() + timedelta(seconds=self.lease_seconds)
+            await self.job_database.update_job(db, job)
+
+        job.status = RescoringJobStatusEnum.completed
+        job.error = None
+        job.locked_until = None
+        job.finished_at = datetime.utcnow()
+        await self.job_database.update_job(db, job)
+        logging.info(f"✅ [RESCORING WORKER] Job {job.id} completed, {job.processed} applications re-scored")
+
+    async def _handle_failure(self, db: AsyncSession, job: ApplicationRescoringJob, error: Exception):
+        await db.rollback()
+        await db.refresh(job)
+
+        detail = error.detail if isinstance(error, HTTPException) else str(error)
+        job.error = str(detail)
+
+        newer_job = await self.job_database.get_queued_job(db, job.target_type, job.target_id)
+        if newer_job:
+            # A later edit queued a full pass over the same applications; it replaces the rest of this one
+            job.status = RescoringJobStatusEnum.failed
+            job.error = f"Superseded by job {newer_job.id}: {detail}"
+            job.locked_until = None
+            job.finished_at = datetime.utcnow()
+            logging.warning(f"[RESCORING WORKER] Job {job.id} failed and was superseded by job {newer_job.id}: {detail}")
+        elif isinstance(error, LLM_UNAVAILABLE_ERRORS):
+            # Not the job's fault: wait for the AI service without using up an attempt
+            retry_after = int(error.headers.get("Retry-After", 1)) if getattr(error, "headers", None) else 1
+            job.attempts -= 1
+            job.status = RescoringJobStatusEnum.queued
+            job.locked_until = datetime.utcnow() + timedelta(seconds=max(retry_after, self.poll_interval))
+            logging.warning(f"[RESCORING WORKER] Job {job.id} paused at application {job.last_application_id}, AI unavailable: {detail}")
+        elif job.attempts >= self.max_attempts:
+            job.status = RescoringJobStatusEnum.failed
+            job.locked_until = None
+            job.finished_at = datetime.utcnow()
+            logging.error(f"[RESCORING WORKER] Job {job.id} failed permanently after {job.processed} applications: {detail}")
+        else:
+            backoff = min(self.lease_seconds, 10 * 2 ** (job.attempts - 1))
+            job.status = RescoringJobStatusEnum.queued
+            job.locked_until = datetime.utcnow() + timedelta(seconds=backoff)
+            logging.warning(f"[RESCORING WORKER] Job {job.id} failed, retrying in {backoff}s: {detail}")
+
+        await self.job_database.update_job(db, job)
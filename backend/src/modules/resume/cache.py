@@ -0,0 +1,20 @@
+import hashlib
+from src.core.cache import TTLCache
+from src.core.config import BackendConfig
+from .constants import RESUME_PROMPT_VERSION
+
+# Shared across requests: the service itself is rebuilt per request
+resume_analysis_cache: TTLCache[dict] = TTLCache(
+    name="resume_analysis",
+    max_size=BackendConfig.RESUME_CACHE_MAX_SIZE,
+    ttl_seconds=BackendConfig.RESUME_CACHE_TTL_SECONDS,
+)
+
+def build_resume_cache_key(content_hash: str) -> str:
+    """
+    Cache key for a resume analysis: PDF content hash + prompt version + model deployment.
+    """
+    return f"{content_hash}:{RESUME_PROMPT_VERSION}:{BackendConfig.AZURE_OPENAI_DEPLOYMENT_NAME}"
+
+def hash_pdf_bytes(pdf_bytes: bytes) -> str:
+    return hashlib.sha256(pdf_bytes).hexdigest()
@@ -0,0 +1,5 @@
+# Bump whenever the analysis prompt, the expected JSON schema or the preprocessing of the resume text changes,
+# so cached and stored analyses produced by the old prompt are not reused.
+RESUME_PROMPT_VERSION = "resume-analysis-v2"
+
+ZIP_CONTENT_TYPES = {"application/zip", "application/x-zip-compressed", "multipart/x-zip"}
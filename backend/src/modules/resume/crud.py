@@ -1,17 +1,41 @@
-from src.models import Resume
+from src.models import Application, Resume, Vacancy
+from sqlalchemy import exists, or_
 from sqlalchemy.future import select
+from sqlalchemy.orm import undefer
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from src.modules.skill.crud import SkillIndexDatabase
 from .schemas import ResumeCreate
 
 class ResumeDatabase():
+    def __init__(self, skill_index_database: Optional[SkillIndexDatabase] = None):
+        self.skill_index_database = skill_index_database or SkillIndexDatabase()
+
     async def get_resume_by_id(self, db: AsyncSession, resume_id: int):
         result = await db.execute(select(Resume).where(Resume.id == resume_id))
         return result.scalar_one_or_none()
 
+    async def get_user_resume_by_link(self, db: AsyncSession, user_id: int, resume_link: str):
+        result = await db.execute(select(Resume).where(Resume.user_id == user_id, Resume.resume_link == resume_link))
+        return result.scalars().first()
+
+    async def hr_has_application_for_resume(self, db: AsyncSession, hr_id: int, resume_id: int) -> bool:
+        """Whether the resume was sent with an application to one of the HR's vacancies."""
+        result = await db.execute(
+            select(exists().where(
+                Application.resume_id == resume_id,
+                Application.vacancy_id == Vacancy.id,
+                Vacancy.hr_id == hr_id
+            ))
+        )
+        return result.scalar()
+
     async def create_resume(self, db: AsyncSession, resume_data: ResumeCreate) -> Resume:
         resume = Resume(**resume_data.model_dump())  
         db.add(resume)
         try:
+            await db.flush()
+            await self.skill_index_database.replace_resume_skills(db, {resume.id: resume.skill_tags})
             await db.commit()
             await db.refresh(resume)
         except:
@@ -19,6 +43,60 @@ class ResumeDatabase():
             raise
         return resume
 
+    async def create_resumes(self, db: AsyncSession, resumes_data: List[ResumeCreate]) -> List[int]:
+        resumes = [Resume(**resume_data.model_dump()) for resume_data in resumes_data]
+        db.add_all(resumes)
+        try:
+            await db.flush()
+            resume_ids = [resume.id for resume in resumes]
+            await self.skill_index_database.replace_resume_skills(db, {resume.id: resume.skill_tags for resume in resumes})
+            await db.commit()
+        except:
+            await db.rollback()
+            raise
+        return resume_ids
+
+    async def get_resume_with_text(self, db: AsyncSession, resume_id: int):
+        result = await db.execute(select(Resume).options(undefer(Resume.resume_text)).where(Resume.id == resume_id))
+        return result.scalar_one_or_none()
+
+    async def get_stale_resumes(self, db: AsyncSession, analysis_version: str, after_id: int, limit: int) -> List[Resume]:
+        """
+        Resumes analyzed with a prompt version other than `analysis_version`, in id order after `after_id`.
+        """
+        result = await db.execute(
+            select(Resume)
+            .options(undefer(Resume.resume_text))
+            .where(
+                Resume.id > after_id,
+                or_(Resume.analysis_version.is_(None), Resume.analysis_version != analysis_version)
+            )
+            .order_by(Resume.id)
+            .limit(limit)
+        )
+        return result.scalars().all()
+
+    async def update_resume(self, db: AsyncSession, resume: Resume, resume_data: ResumeCreate) -> Resume:
+        # Ownership and upload time stay; the embedding columns only change when the schema was re-embedded
+        exclude = {"user_id", "resume_link", "created_at"}
+        if "embedding" not in resume_data.model_fields_set:
+            exclude |= {"embedding", "embedding_model", "embedded_at"}
+        for key, value in resume_data.model_dump(exclude=exclude).items():
+            setattr(resume, key, value)
+        try:
+            await self.skill_index_database.replace_resume_skills(db, {resume.id: resume.skill_tags})
+            await db.commit()
+            await db.refresh(resume)
+        except:
+            await db.rollback()
+            raise
+        return resume
+
+    async def get_latest_resume_by_user_id(self, db: AsyncSession, user_id: int):
+        result = await db.execute(
+            select(Resume).where(Resume.user_id == user_id).order_by(Resume.id.desc()).limit(1)
+        )
+        return result.scalar_one_or_none()
 
     async def get_resumes_by_user_id(self, db: AsyncSession, user_id: int):
         result = await db.execute(select(Resume).where(Resume.user_id == user_id))
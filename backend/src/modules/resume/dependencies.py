@@ -1,34 +1,30 @@
-from azure.storage.blob.aio import BlobServiceClient
 from fastapi import Depends
-from langchain_openai import AzureChatOpenAI
-from src.core.config import BackendConfig
+from src.core.clients import get_analysis_llm, get_resume_storage
+from src.modules.embedding.dependencies import get_embedding_service
+from src.modules.embedding.service import EmbeddingService
+from src.modules.resume.cache import resume_analysis_cache
 from src.modules.resume.crud import ResumeDatabase
+from src.modules.resume.pdf_extractor import pdf_extraction_pool
+from src.modules.exchange_rate.service import exchange_rate_service
+from src.modules.rescoring.crud import RescoringJobDatabase
+from src.modules.rescoring.service import RescoringService
 from src.modules.resume.service import ResumeService
+from src.modules.storage.base import ResumeStorage
 from src.modules.vacancy.crud import VacancyDatabase
 from src.modules.vacancy.service import VacancyService
 
-def get_llm():
-    """
-    Provides an instance of AzureChatOpenAI configured with environment variables.
-    """
-    return AzureChatOpenAI(
-        azure_endpoint=BackendConfig.AZURE_OPENAI_ENDPOINT,
-        openai_api_key=BackendConfig.AZURE_OPENAI_API_KEY,
-        deployment_name=BackendConfig.AZURE_OPENAI_DEPLOYMENT_NAME,
-        api_version=BackendConfig.AZURE_OPENAI_API_VERSION,
-        temperature=0.2  
-    )
-
-def get_blob_service_client():
-    return BlobServiceClient.from_connection_string(BackendConfig.AZURE_STORAGE_CONNECTION_STRING)
-
 def get_resume_service(
-    llm=Depends(get_llm),
-    blob_service_client=Depends(get_blob_service_client)
+    llm=Depends(get_analysis_llm),
+    storage: ResumeStorage = Depends(get_resume_storage),
+    embedding_service: EmbeddingService = Depends(get_embedding_service)
 ):
     return ResumeService(
         resume_database=ResumeDatabase(),
         llm=llm,
-        blob_service_client=blob_service_client,
-        container_name=BackendConfig.AZURE_STORAGE_CONTAINER_NAME
+        storage=storage,
+        analysis_cache=resume_analysis_cache,
+        pdf_extractor=pdf_extraction_pool,
+        exchange_rate_service=exchange_rate_service,
+        rescoring_service=RescoringService(job_database=RescoringJobDatabase()),
+        embedding_service=embedding_service
     )
\ No newline at end of file
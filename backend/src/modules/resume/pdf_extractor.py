@@ -0,0 +1,209 @@
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+import fitz
+from src.core.config import BackendConfig
+
+
+@dataclass
+class PdfExtractionResult:
+    text: str
+    pages_parsed: int
+    page_count: int
+    truncated: bool
+    parse_seconds: float
+
+
+def _extract_pdf_text(source: Union[bytes, str], max_pages: int, time_limit: float) -> PdfExtractionResult:
+    """
+    Runs inside a pool process. Accepts raw bytes or a path to a spooled upload; a path is opened
+    directly by MuPDF, which reads it on demand instead of copying the whole file into the worker.
+    Stops early once the page or time limit is reached, so a huge scanned document returns
+    a partial text instead of occupying a worker indefinitely.
+    """
+    started = time.monotonic()
+    if isinstance(source, str):
+        doc = fitz.open(source, filetype="pdf")
+    else:
+        doc = fitz.open(stream=source, filetype="pdf")
+    try:
+        pages = []
+        truncated = False
+        for index, page in enumerate(doc):
+            if index >= max_pages or time.monotonic() - started > time_limit:
+                truncated = True
+                break
+            pages.append(page.get_text("text"))
+
+        return PdfExtractionResult(
+            # Form feed between pages lets preprocessing find per-page headers and footers
+            text="\f".join(pages),
+            pages_parsed=len(pages),
+            page_count=doc.page_count,
+            truncated=truncated,
+            parse_seconds=time.monotonic() - started
+        )
+    finally:
+        doc.close()
+
+
+class PdfExtractionPool:
+    """
+    Runs PyMuPDF text extraction in a ProcessPoolExecutor so CPU-bound parsing never blocks the event loop.
+    With max_workers=0 extraction falls back to a thread, e.g. where subprocesses are not allowed.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = BackendConfig.PDF_EXTRACTION_WORKERS,
+        max_pages: int = BackendConfig.PDF_MAX_PAGES,
+        time_limit: float = BackendConfig.PDF_EXTRACTION_TIMEOUT_SECONDS,
+        max_tasks_per_child: int = BackendConfig.PDF_EXTRACTION_MAX_TASKS_PER_CHILD
+    ):
+        self.max_workers = max_workers
+        self.max_pages = max_pages
+        self.time_limit = time_limit
+        self.max_tasks_per_child = max_tasks_per_child
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+        self.in_flight = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.timed_out = 0
+        self.retried = 0
+        self.truncated = 0
+        self.pages_parsed = 0
+        self.total_parse_seconds = 0.0
+        self.max_parse_seconds = 0.0
+        self.total_wait_seconds = 0.0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: forking a process that already runs an event loop and client threads is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                max_tasks_per_child=self.max_tasks_per_child or None
+            )
+            logging.info(f"[PDF EXTRACTION] Started process pool with {self.max_workers} workers")
+        return self._executor
+
+    def _discard_broken_executor(self):
+        if self._executor is not None and self._executor._broken:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def _run(self, source: Union[bytes, str]) -> PdfExtractionResult:
+        if self.max_workers > 0:
+            future = asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), _extract_pdf_text, source, self.max_pages, self.time_limit
+            )
+        else:
+            future = asyncio.to_thread(_extract_pdf_text, source, self.max_pages, self.time_limit)
+
+        # The in-worker limit is checked between pages, so a single page that hangs only stops here
+        return await asyncio.wait_for(future, timeout=self.time_limit * 2)
+
+    async def extract(self, source: Union[bytes, str]) -> PdfExtractionResult:
+        self.submitted += 1
+        self.in_flight += 1
+        queued_at = time.monotonic()
+
+        try:
+            try:
+                result = await self._run(source)
+            except BrokenProcessPool:
+                # The pool was recycled after another document hung, or a worker died: retry once in a fresh pool
+                self.retried += 1
+                logging.warning("[PDF EXTRACTION] Process pool broke during extraction, retrying once")
+                self._discard_broken_executor()
+                result = await self._run(source)
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            logging.error(f"[PDF EXTRACTION] Extraction exceeded {self.time_limit * 2}s")
+            self._recycle_executor()
+            raise
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.in_flight -= 1
+
+        self.completed += 1
+        self.pages_parsed += result.pages_parsed
+        self.total_parse_seconds += result.parse_seconds
+        self.max_parse_seconds = max(self.max_parse_seconds, result.parse_seconds)
+        self.total_wait_seconds += max(0.0, time.monotonic() - queued_at - result.parse_seconds)
+        if result.truncated:
+            self.truncated += 1
+            logging.warning(
+                f"[PDF EXTRACTION] Parsed {result.pages_parsed} of {result.page_count} pages "
+                f"(limits: {self.max_pages} pages, {self.time_limit}s)"
+            )
+        return result
+
+    async def extract_many(
+        self, documents: List[Union[bytes, str]]
+    ) -> AsyncIterator[Tuple[int, Union[PdfExtractionResult, Exception]]]:
+        """
+        Yields (index, result or exception) for each document as soon as its extraction finishes.
+        """
+        async def run(index: int, source: Union[bytes, str]):
+            try:
+                return index, await self.extract(source)
+            except Exception as e:
+                return index, e
+
+        for next_done in asyncio.as_completed([run(i, doc) for i, doc in enumerate(documents)]):
+            yield await next_done
+
+    def _recycle_executor(self):
+        """
+        Giving up on the future does not stop the worker stuck on the page, which would keep its slot for good.
+        Which process runs a task is not known, so the whole pool is replaced: later extractions start a fresh
+        one, and the other extractions still running in the old pool fail with BrokenProcessPool and are retried
+        once there by extract().
+        A thread (max_workers=0) cannot be stopped and keeps running until the page is done.
+        """
+        executor, self._executor = self._executor, None
+        if executor is None:
+            return
+        processes = list((executor._processes or {}).values())
+        executor.shutdown(wait=False, cancel_futures=True)
+        # ProcessPoolExecutor has no public way to stop running tasks
+        for process in processes:
+            process.terminate()
+        logging.warning("[PDF EXTRACTION] Process pool recycled after a timeout")
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            logging.info("[PDF EXTRACTION] Process pool shut down")
+
+    def stats(self) -> Dict[str, Any]:
+        workers = self.max_workers or 1
+        return {
+            "max_workers": self.max_workers,
+            "in_flight": self.in_flight,
+            "queue_depth": max(0, self.in_flight - workers),
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timed_out": self.timed_out,
+            "retried": self.retried,
+            "truncated": self.truncated,
+            "pages_parsed": self.pages_parsed,
+            "avg_parse_seconds": round(self.total_parse_seconds / self.completed, 4) if self.completed else 0.0,
+            "max_parse_seconds": round(self.max_parse_seconds, 4),
+            "avg_wait_seconds": round(self.total_wait_seconds / self.completed, 4) if self.completed else 0.0,
+        }
+
+
+pdf_extraction_pool = PdfExtractionPool()
@@ -0,0 +1,220 @@
+import logging
+import re
+import zlib
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+from src.core.config import BackendConfig
+
+# Pages are separated by a form feed in the extracted text
+PAGE_SEPARATOR = "\f"
+
+SECTION_KEYWORDS = {
+    "contacts": ["контакты", "контактная информация", "contacts", "contact information", "contact"],
+    "summary": ["о себе", "обо мне", "summary", "profile", "about me", "цель", "objective", "профиль"],
+    "experience": ["опыт работы", "опыт", "work experience", "experience", "employment history", "трудовая деятельность"],
+    "education": ["образование", "education"],
+    "skills": ["навыки", "ключевые навыки", "профессиональные навыки", "skills", "technical skills", "hard skills", "технологии", "стек"],
+    "projects": ["проекты", "projects"],
+    "courses": ["курсы", "сертификаты", "courses", "certifications", "certificates", "повышение квалификации"],
+    "awards": ["награды", "достижения", "awards", "achievements"],
+    "languages": ["языки", "знание языков", "languages"],
+}
+
+# Sections kept first when the text has to be truncated; "header" is the text before the first heading
+SECTION_PRIORITY = ["header", "contacts", "experience", "skills", "education", "languages",
+                    "summary", "projects", "courses", "awards"]
+
+_HEADING_LOOKUP = {keyword: name for name, keywords in SECTION_KEYWORDS.items() for keyword in keywords}
+# Only explicit page markers ("Page 2", "стр. 2", "2 из 3"): a line of bare digits may be a year or a salary
+_PAGE_NUMBER_RE = re.compile(
+    r"^(?:(?:page|стр\.?|страница)\s*(\d+)(?:\s*(?:of|из|/)\s*(\d+))?|(\d+)\s*(?:of|из|/)\s*(\d+))$", re.IGNORECASE
+)
+# Lines at each edge of a page that can be a running header or footer
+HEADER_FOOTER_LINES = 2
+_HYPHENATION_RE = re.compile(r"(\w)[-\u00ad]\n(\w)")
+_INLINE_SPACE_RE = re.compile(r"[ \t\u00a0\u2009\u202f]+")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+
+@dataclass
+class PreprocessedResume:
+    text: str
+    original_tokens: int
+    tokens: int
+    truncated: bool
+    removed_lines: int
+    sections: List[str] = field(default_factory=list)
+
+
+class PreprocessingMetrics:
+    def __init__(self):
+        self.documents = 0
+        self.truncated = 0
+        self.original_tokens = 0
+        self.prompt_tokens = 0
+        self.removed_lines = 0
+
+    def record(self, result: PreprocessedResume):
+        self.documents += 1
+        self.truncated += int(result.truncated)
+        self.original_tokens += result.original_tokens
+        self.prompt_tokens += result.tokens
+        self.removed_lines += result.removed_lines
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "documents": self.documents,
+            "truncated": self.truncated,
+            "avg_original_tokens": round(self.original_tokens / self.documents, 1) if self.documents else 0.0,
+            "avg_prompt_tokens": round(self.prompt_tokens / self.documents, 1) if self.documents else 0.0,
+            "removed_lines": self.removed_lines,
+        }
+
+
+preprocessing_metrics = PreprocessingMetrics()
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    try:
+        import tiktoken
+        return tiktoken.get_encoding(BackendConfig.RESUME_TOKENIZER_ENCODING)
+    except Exception as e:
+        logging.warning(f"[RESUME PREPROCESS] tiktoken unavailable, using a character-based estimate: {e}")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return (len(text) + 3) // 4
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    if max_tokens <= 0:
+        return ""
+    encoding = _get_encoding()
+    if encoding is not None:
+        tokens = encoding.encode(text, disallowed_special=())
+        return text if len(tokens) <= max_tokens else encoding.decode(tokens[:max_tokens])
+    return text[:max_tokens * 4]
+
+
+def normalize_text(text: str) -> str:
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    text = _HYPHENATION_RE.sub(r"\1\2", text)
+    lines = [_INLINE_SPACE_RE.sub(" ", line).strip() for line in text.split("\n")]
+    text = "\n".join(lines)
+    return _BLANK_LINES_RE.sub("\n\n", text).strip()
+
+
+def is_page_number(line: str, page_count: int) -> bool:
+    match = _PAGE_NUMBER_RE.match(line)
+    if not match:
+        return False
+    number, total = int(match.group(1) or match.group(3)), match.group(2) or match.group(4)
+    # "2019 / 2021" is a period, not page 2019 of 2021
+    return 1 <= number <= page_count and (total is None or int(total) == page_count)
+
+
+def _edge_rows(lines: List[str]) -> Tuple[List[int], List[int]]:
+    """Rows of the first and of the last non-empty lines of a page, where running headers and footers sit."""
+    rows = [row for row, line in enumerate(lines) if line]
+    return rows[:HEADER_FOOTER_LINES], rows[-HEADER_FOOTER_LINES:]
+
+
+def remove_repeated_lines(pages: List[str]) -> Tuple[List[str], int]:
+    """
+    Drops page numbers everywhere, and headers/footers (a line among the first lines of every page, or among
+    the last lines of every page) from all pages but the first, so e.g. a name in the header is still kept once.
+    """
+    page_lines = [page.split("\n") for page in pages]
+    edges = [_edge_rows(lines) for lines in page_lines]
+    running_rows: List[set] = [set() for _ in pages]
+    if len(pages) > 1:
+        for side in (0, 1):
+            repeated = set.intersection(*({lines[row] for row in rows[side]} for lines, rows in zip(page_lines, edges)))
+            for index in range(1, len(pages)):
+                running_rows[index].update(row for row in edges[index][side] if page_lines[index][row] in repeated)
+
+    removed = 0
+    cleaned_pages = []
+    for index, lines in enumerate(page_lines):
+        kept = []
+        for row, line in enumerate(lines):
+            if is_page_number(line, len(pages)) or row in running_rows[index]:
+                removed += 1
+                continue
+            kept.append(line)
+        cleaned_pages.append("\n".join(kept))
+    return cleaned_pages, removed
+
+
+def _heading_name(line: str) -> Optional[str]:
+    if not line or len(line) > 40:
+        return None
+    return _HEADING_LOOKUP.get(line.rstrip(":").strip().lower())
+
+
+def detect_sections(text: str) -> List[Tuple[str, str]]:
+    """Splits the text into (section name, section text) pairs in document order."""
+    sections: List[Tuple[str, List[str]]] = [("header", [])]
+    for line in text.split("\n"):
+        name = _heading_name(line)
+        if name:
+            sections.append((name, [line]))
+        else:
+            sections[-1][1].append(line)
+    return [(name, "\n".join(lines).strip()) for name, lines in sections if "\n".join(lines).strip()]
+
+
+def _fit_sections(sections: List[Tuple[str, str]], token_budget: int) -> List[str]:
+    """Keeps sections by priority until the budget is spent, cutting the first one that does not fit."""
+    priority = {name: index for index, name in enumerate(SECTION_PRIORITY)}
+    order = sorted(range(len(sections)), key=lambda i: (priority.get(sections[i][0], len(priority)), i))
+
+    kept: Dict[int, str] = {}
+    remaining = token_budget
+    for index in order:
+        if remaining <= 0:
+            break
+        body = sections[index][1]
+        tokens = count_tokens(body)
+        if tokens <= remaining:
+            kept[index] = body
+            remaining -= tokens
+        else:
+            kept[index] = truncate_to_tokens(body, remaining)
+            remaining = 0
+    return [kept[index] for index in sorted(kept)]
+
+
+def preprocess_resume_text(raw_text: str, token_budget: int = BackendConfig.RESUME_TOKEN_BUDGET) -> PreprocessedResume:
+    pages = [normalize_text(page) for page in raw_text.split(PAGE_SEPARATOR)]
+    pages, removed_lines = remove_repeated_lines(pages)
+    text = normalize_text("\n\n".join(page for page in pages if page))
+
+    sections = detect_sections(text)
+    original_tokens = count_tokens(text)
+    truncated = original_tokens > token_budget
+    if truncated:
+        text = "\n\n".join(_fit_sections(sections, token_budget))
+
+    return PreprocessedResume(
+        text=text,
+        original_tokens=original_tokens,
+        tokens=count_tokens(text) if truncated else original_tokens,
+        truncated=truncated,
+        removed_lines=removed_lines,
+        sections=[name for name, _ in sections]
+    )
+
+
+def compress_text(text: str) -> bytes:
+    return zlib.compress(text.encode("utf-8"), 6)
+
+
+def decompress_text(data: bytes) -> str:
+    return zlib.decompress(data).decode("utf-8")
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 from typing import List, Optional, Dict, Union
 from datetime import datetime
 
@@ -24,10 +24,27 @@ class ResumeCreate(BaseModel):
     original_currency: Optional[str]
     grade: Optional[str]
     resume_link: Optional[str]
+    resume_text: Optional[bytes] = None
+    analysis_version: Optional[str] = None
+    # float16 vector of the resume, see modules/embedding
+    embedding: Optional[bytes] = None
+    embedding_model: Optional[str] = None
+    embedded_at: Optional[datetime] = None
+    # Normalized search columns, see modules/candidate/tags.py
+    skill_tags: Optional[List[str]] = None
+    language_tags: Optional[List[str]] = None
+    profession_tags: Optional[List[str]] = None
+    grade_level: Optional[int] = None
 
 class ResumeResponse(ResumeCreate):
     id: int
     resume_link: str
+    resume_text: Optional[bytes] = Field(default=None, exclude=True)
+    embedding: Optional[bytes] = Field(default=None, exclude=True)
+    skill_tags: Optional[List[str]] = Field(default=None, exclude=True)
+    language_tags: Optional[List[str]] = Field(default=None, exclude=True)
+    profession_tags: Optional[List[str]] = Field(default=None, exclude=True)
+    grade_level: Optional[int] = Field(default=None, exclude=True)
     created_at: datetime
 
     class Config:
@@ -1,19 +1,33 @@
-from typing import Union
+from typing import AsyncIterator, List, Optional, Union
+import asyncio
 import uuid
 import json
 import logging
 from datetime import datetime
-import httpx
-from azure.storage.blob.aio import BlobServiceClient
 from langchain_openai import AzureChatOpenAI
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, UploadFile
+from src.core.cache import TTLCache
 from src.core.config import BackendConfig
-import fitz
+from src.core.llm_metrics import llm_run_config, response_for_log
+from src.core.llm_limiter import LLMPriority, estimate_tokens, use_llm_priority
+from src.core.llm_resilience import LLMCaller, llm_caller as default_llm_caller
+from src.core.database import SessionLocal
+from src.models import HR, User
+from src.modules.candidate.tags import search_tags
+from src.modules.embedding.service import EmbeddingService
+from src.modules.exchange_rate.service import ExchangeRateService, exchange_rate_service as default_exchange_rate_service
+from src.modules.recommendation.cache import invalidate_user_recommendations
+from src.modules.rescoring.constants import RESCORING_TARGET_RESUME, RESUME_MATCHING_FIELDS
+from src.modules.rescoring.service import RescoringService, changed_matching_fields
+from src.modules.storage.base import ResumeStorage, StoredObject
+from .cache import build_resume_cache_key, hash_pdf_bytes
 from .crud import ResumeDatabase
+from .pdf_extractor import PdfExtractionPool
+from .preprocessing import compress_text, decompress_text, preprocess_resume_text, preprocessing_metrics
 from .schemas import ResumeCreate
-import xml.etree.ElementTree as ET
-from io import BytesIO
+from .constants import RESUME_PROMPT_VERSION, ZIP_CONTENT_TYPES
+from .upload import SpooledUpload, extract_zip_pdfs, spool_upload
 from langchain_core.prompts import PromptTemplate
 from langchain_core.runnables import RunnableLambda
 
@@ -24,36 +38,41 @@ class ResumeService:
         self,
         resume_database=ResumeDatabase,
         llm=AzureChatOpenAI,
-        blob_service_client: BlobServiceClient = None,
-        container_name: str = None
+        storage: ResumeStorage = None,
+        analysis_cache: TTLCache = None,
+        pdf_extractor: PdfExtractionPool = None,
+        exchange_rate_service: ExchangeRateService = None,
+        llm_caller: LLMCaller = None,
+        rescoring_service: Optional[RescoringService] = None,
+        embedding_service: Optional[EmbeddingService] = None
     ):
         self.resume_database = resume_database
         self.llm = llm
-        self.blob_service_client = blob_service_client
-        self.container_name = container_name
+        self.storage = storage
+        self.analysis_cache = analysis_cache
+        self.pdf_extractor = pdf_extractor or PdfExtractionPool(max_workers=0)
+        self.exchange_rate_service = exchange_rate_service or default_exchange_rate_service
+        self.llm_caller = llm_caller or default_llm_caller
+        self.rescoring_service = rescoring_service
+        self.embedding_service = embedding_service
 
-    async def save_resume(self, file: Union[UploadFile, bytes]) -> str:
-        logging.info("[RESUME UPLOAD] Uploading resume into Azure Blob Storage")
-        if not self.blob_service_client or not self.container_name:
-            logging.error("[RESUME UPLOAD] BlobServiceClient or container_name not configured")
-            raise ValueError("BlobServiceClient or container_name not configured")
+    async def save_resume(self, file: Union[UploadFile, SpooledUpload, bytes]) -> str:
+        logging.info("[RESUME UPLOAD] Uploading resume into storage")
+        if not self.storage:
+            logging.error("[RESUME UPLOAD] Resume storage not configured")
+            raise ValueError("Resume storage not configured")
 
+        filename = f"{uuid.uuid4()}.pdf"
         try:
-            if isinstance(file, UploadFile):
-                file_bytes = await file.read()
-                filename = file.filename
+            if isinstance(file, SpooledUpload):
+                logging.info(f"[RESUME UPLOAD] Uploading file: {filename} ({file.size} bytes, streamed)")
+                resume_url = await self.storage.save_file(filename, file.path, file.size)
             else:
-                file_bytes = file
-                filename = f"{uuid.uuid4()}.pdf"
+                file_bytes = await file.read() if isinstance(file, UploadFile) else file
+                logging.info(f"[RESUME UPLOAD] Uploading file: {filename}")
+                resume_url = await self.storage.save_bytes(filename, file_bytes)
 
-            logging.info(f"[RESUME UPLOAD] Uploading file: {filename}")
-
-            blob_client = self.blob_service_client.get_blob_client(container=self.container_name, blob=filename)
-            file_stream = BytesIO(file_bytes)
-            await blob_client.upload_blob(file_stream, overwrite=True)
-
-            resume_url = f"https://{self.blob_service_client.account_name}.blob.core.windows.net/{self.container_name}/{filename}"
-            logging.info(f"[RESUME UPLOAD] File uploaded successfully: {resume_url}")
+            logging.info(f"[RESUME UPLOAD] File uploaded successfully to {self.storage.name} storage: {resume_url}")
             return resume_url
         except Exception as e:
             logging.error(f"[RESUME UPLOAD ERROR] Failed to upload file: {str(e)}", exc_info=True)
@@ -120,8 +139,13 @@ class ResumeService:
         chain = prompt | self.llm | RunnableLambda(lambda x: x.content.strip() if hasattr(x, "content") else str(x).strip())
 
         try:
-            response = await chain.ainvoke({"resume_text": resume_text})
-            logging.info(f"[RESUME ANALYSIS] Response from Langchain: {response}")
+            response = await self.llm_caller.call(
+                "analyze_resume",
+                lambda: chain.ainvoke({"resume_text": resume_text}, config=llm_run_config("analyze_resume", RESUME_PROMPT_VERSION)),
+                estimate_tokens(prompt.template + resume_text, 800),
+                llm=self.llm
+            )
+            logging.info(f"[RESUME ANALYSIS] Response from Langchain: {response_for_log(response)}")
 
             parsed_json = json.loads(response)
 
@@ -132,46 +156,91 @@ class ResumeService:
                 raise ValueError(f"Response is missing keys: {missing_keys}")
 
             return parsed_json
+        except HTTPException:
+            raise
         except json.JSONDecodeError as e:
-            logging.error(f"[RESUME ANALYSIS] Invalid JSON response: {response}", exc_info=True)
+            logging.error(f"[RESUME ANALYSIS] Invalid JSON response: {response_for_log(response)}", exc_info=True)
             raise HTTPException(status_code=500, detail="Error parsing resume JSON")
         except Exception as e:
             logging.error(f"[RESUME ANALYSIS ERROR] Error analyzing resume: {e}", exc_info=True)
             raise HTTPException(status_code=500, detail="Error processing resume with Langchain")
 
-    async def extract_text_from_pdf(self, pdf_bytes: bytes) -> str:
+    async def extract_text_from_pdf(self, pdf_source: Union[bytes, str]) -> str:
+        """
+        Extracts text from PDF bytes or from the path of a spooled upload.
+        """
         try:
             logging.info("[RESUME TEXT EXTRACTION] Extracting text from pdf")
-            doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-            text = "\n".join([page.get_text("text") for page in doc])
-            logging.info(f"[RESUME TEXT EXTRACTION] {len(text)} symbols were extracted")
-            return text
+            result = await self.pdf_extractor.extract(pdf_source)
+            logging.info(
+                f"[RESUME TEXT EXTRACTION] {len(result.text)} symbols were extracted from "
+                f"{result.pages_parsed}/{result.page_count} pages in {result.parse_seconds:.2f}s"
+            )
+            return result.text
+        except asyncio.TimeoutError:
+            logging.error("[RESUME TEXT EXTRACTION] PDF parsing timed out")
+            raise HTTPException(status_code=422, detail="PDF is too complex to process")
         except Exception as e:
             logging.error(f"[RESUME TEXT EXTRACTION] Error extracting text from pdf: {e}", exc_info=True)
             raise
 
-    async def get_exchange_rate(self, currency: str) -> float:
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(BackendConfig.NATIONAL_BANK_API_URL, timeout=10.0)
-                logging.info(f"[EXCHANGE RATE] Response from National Bank: {response.status_code}")
-
-                if response.status_code == 200:
-                    root = ET.fromstring(response.text)
-                    for item in root.findall(".//item"):
-                        title = item.find("title").text.strip()
-                        description = item.find("description").text.strip()
-                        if title == currency.upper():
-                            rate = float(description.replace(",", "."))
-                            logging.info(f"[EXCHANGE RATE] Exchange rate {currency} -> KZT: {rate}")
-                            return rate
-
-                logging.warning(f"[EXCHANGE RATE] Exchange rate {currency} not found")
-                return None
-        except Exception as e:
-            logging.error(f"[EXCHANGE RATE ERROR] Error getting exchange rate: {e}", exc_info=True)
+    def prepare_resume_text(self, raw_text: str) -> str:
+        """
+        Normalizes extracted text, strips repeated headers/footers and fits it into the prompt token budget.
+        """
+        result = preprocess_resume_text(raw_text)
+        preprocessing_metrics.record(result)
+        logging.info(
+            f"[RESUME PREPROCESS] Prompt tokens: {result.tokens} (raw {result.original_tokens}), "
+            f"removed lines: {result.removed_lines}, sections: {result.sections}"
+        )
+        if result.truncated:
+            logging.warning(f"[RESUME PREPROCESS] Resume text truncated from {result.original_tokens} to {result.tokens} tokens")
+        return result.text
+
+    def get_cached_analysis(self, content_hash: str) -> Optional[tuple[str, dict]]:
+        if not self.analysis_cache:
+            return None
+
+        cache_key = build_resume_cache_key(content_hash)
+        cached = self.analysis_cache.get(cache_key)
+        if cached is None:
+            logging.info(f"[RESUME CACHE] Cache miss for {cache_key}")
             return None
 
+        logging.info(f"[RESUME CACHE] Cache hit for {cache_key}")
+        return cached["text"], dict(cached["data"])
+
+    def cache_analysis(self, content_hash: str, resume_text: str, resume_data: dict) -> None:
+        if self.analysis_cache:
+            cache_key = build_resume_cache_key(content_hash)
+            self.analysis_cache.set(cache_key, {"text": resume_text, "data": dict(resume_data)})
+
+    async def get_resume_analysis(self, pdf_source: Union[bytes, str], content_hash: str = None) -> tuple[str, dict]:
+        """
+        Returns (extracted text, parsed analysis) for a PDF, reusing a cached result
+        for identical files so re-uploads skip both PDF parsing and the LLM call.
+        """
+        if content_hash is None and isinstance(pdf_source, bytes):
+            content_hash = hash_pdf_bytes(pdf_source)
+
+        cached = self.get_cached_analysis(content_hash) if content_hash else None
+        if cached:
+            return cached
+
+        raw_text = await self.extract_text_from_pdf(pdf_source)
+        resume_text = self.prepare_resume_text(raw_text)
+        resume_data = await self.analyze_resume(resume_text)
+        if content_hash:
+            self.cache_analysis(content_hash, resume_text, resume_data)
+        return resume_text, resume_data
+
+    async def get_exchange_rate(self, currency: str) -> float:
+        rate = await self.exchange_rate_service.get_rate(currency)
+        if rate is not None:
+            logging.info(f"[EXCHANGE RATE] Exchange rate {currency} -> KZT: {rate}")
+        return rate
+
     async def convert_salary_to_kzt(self, min_salary: float, max_salary: float, currency: str) -> tuple[float, float]:
         try:
             logging.info(f"[SALARY CONVERSION] Converting {min_salary}-{max_salary} {currency} into KZT")
@@ -193,67 +262,339 @@ class ResumeService:
             logging.error(f"[SALARY CONVERSION ERROR] Error converting salary: {e}", exc_info=True)
             return None, None
 
-    async def save_resume_to_db(self, db: AsyncSession, resume_data: dict, resume_link: str, user_id: int):
+    async def convert_resume_salary(self, resume_data: dict) -> tuple[float, float]:
+        return await self.convert_salary_to_kzt(
+            resume_data.get("min_salary"), resume_data.get("max_salary"), resume_data.get("currency") or "KZT"
+        )
+
+    def build_resume_schema(
+        self,
+        resume_data: dict,
+        resume_link: str,
+        user_id: int,
+        salaries_kzt: tuple[float, float],
+        resume_text: Optional[str] = None
+    ) -> ResumeCreate:
+        candidate_info = resume_data
+        min_salary_kzt, max_salary_kzt = salaries_kzt
+        return ResumeCreate(
+            user_id=user_id,
+            first_name=candidate_info.get("first_name"),
+            last_name=candidate_info.get("last_name"),
+            email=candidate_info.get("email"),
+            phone=candidate_info.get("phone"),
+            experience_time=candidate_info.get("experience_time", 0),
+            profession=candidate_info.get("profession"),
+            education=candidate_info.get("education"),
+            skills=candidate_info.get("skills"),
+            languages=candidate_info.get("languages"),
+            awards=candidate_info.get("awards"),
+            projects=candidate_info.get("projects"),
+            courses=candidate_info.get("courses"),
+            summary=candidate_info.get("summary"),
+            resume_link=resume_link,
+            min_salary=min_salary_kzt,
+            max_salary=max_salary_kzt,
+            original_min_salary=candidate_info.get("min_salary"),
+            original_max_salary=candidate_info.get("max_salary"),
+            original_currency=candidate_info.get("currency"),
+            grade=candidate_info.get("grade"),
+            resume_text=compress_text(resume_text) if resume_text else None,
+            analysis_version=RESUME_PROMPT_VERSION,
+            created_at=datetime.utcnow(),
+            **search_tags(candidate_info)
+        )
+
+    async def save_resume_to_db(
+        self,
+        db: AsyncSession,
+        resume_data: dict,
+        resume_link: str,
+        user_id: int,
+        salaries_kzt: Optional[tuple[float, float]] = None,
+        resume_text: Optional[str] = None
+    ):
         try:
             logging.info(f"[RESUME DB SAVE] Saving resume for user {user_id}")
 
-            candidate_info = resume_data
-            min_salary_kzt, max_salary_kzt = await self.convert_salary_to_kzt(
-                candidate_info.get("min_salary"), candidate_info.get("max_salary"), candidate_info.get("currency") or "KZT"
-            )
+            if salaries_kzt is None:
+                salaries_kzt = await self.convert_resume_salary(resume_data)
 
-            resume_schema = ResumeCreate(
-                user_id=user_id,
-                first_name=candidate_info.get("first_name"),
-                last_name=candidate_info.get("last_name"),
-                email=candidate_info.get("email"),
-                phone=candidate_info.get("phone"),
-                experience_time=candidate_info.get("experience_time", 0),
-                profession=candidate_info.get("profession"),
-                education=candidate_info.get("education"),
-                skills=candidate_info.get("skills"),
-                languages=candidate_info.get("languages"),
-                awards=candidate_info.get("awards"),
-                projects=candidate_info.get("projects"),
-                courses=candidate_info.get("courses"),
-                summary=candidate_info.get("summary"),
-                resume_link=resume_link,
-                min_salary=min_salary_kzt,
-                max_salary=max_salary_kzt,
-                original_min_salary=candidate_info.get("min_salary"),
-                original_max_salary=candidate_info.get("max_salary"),
-                original_currency=candidate_info.get("currency"),
-                grade=candidate_info.get("grade"),
-                created_at=datetime.utcnow()
-            )
+            resume_schema = self.build_resume_schema(resume_data, resume_link, user_id, salaries_kzt, resume_text)
             logging.info(f"[RESUME DB SAVE] Generated resume URL: {resume_link}")
+            if self.embedding_service:
+                await self.embedding_service.embed_resume_schemas([resume_schema])
 
             resume = await self.resume_database.create_resume(db, resume_schema)
             logging.info(f"[RESUME DB SAVE] Resume has been successfully saved to the database: {resume.id}")
+            if self.embedding_service:
+                self.embedding_service.index_resume(resume.id, resume_schema)
+            invalidate_user_recommendations(user_id)
             return resume
         except Exception as e:
             logging.error(f"[RESUME DB SAVE ERROR] Error saving to DB: {e}", exc_info=True)
             raise
 
+    async def delete_resume_file(self, resume_link: str) -> None:
+        """
+        Removes an uploaded file, e.g. when resume creation fails after the upload finished.
+        Never raises: a leftover file is logged rather than masking the original error.
+        """
+        filename = self.storage.key_for(resume_link)
+        try:
+            await self.storage.delete(filename)
+            logging.info(f"[RESUME CLEANUP] Deleted orphaned file {filename}")
+        except Exception as e:
+            logging.error(f"[RESUME CLEANUP ERROR] Failed to delete file {filename}: {e}", exc_info=True)
+
+    async def analyze_resume_file(
+        self, pdf_source: Union[bytes, str], content_hash: str = None
+    ) -> tuple[str, dict, tuple[float, float]]:
+        """
+        Extract -> analyze -> salary conversion branch of resume creation.
+        The exchange rate is requested as soon as the analysis reveals the currency.
+        """
+        resume_text, resume_data = await self.get_resume_analysis(pdf_source, content_hash)
+        salaries_kzt = await self.convert_resume_salary(resume_data)
+        return resume_text, resume_data, salaries_kzt
+
+    async def process_upload(self, upload: SpooledUpload) -> tuple[str, str, dict, tuple[float, float]]:
+        """
+        Runs the storage upload and the analysis branch concurrently
+        and returns (resume_link, resume_text, resume_data, salaries_kzt).
+        TaskGroup cancels the other branch as soon as one of them fails; an already uploaded file is removed.
+        """
+        upload_task = None
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                upload_task = task_group.create_task(self.save_resume(upload))
+                analysis_task = task_group.create_task(self.analyze_resume_file(upload.path, upload.sha256))
+        except BaseExceptionGroup as group:
+            if upload_task is not None and upload_task.done() and not upload_task.cancelled() \
+                    and upload_task.exception() is None:
+                await self.delete_resume_file(upload_task.result())
+            raise group.exceptions[0]
+
+        resume_text, resume_data, salaries_kzt = analysis_task.result()
+        return upload_task.result(), resume_text, resume_data, salaries_kzt
+
     async def create_resume(self, file: UploadFile, user_id: int, db: AsyncSession):
         try:
             logging.info(f"[RESUME CREATION] Start processing resume for user {user_id}")
-            file_bytes = await file.read()
-            resume_link = await self.save_resume(file_bytes)
-            resume_text = await self.extract_text_from_pdf(file_bytes)
-            resume_data = await self.analyze_resume(resume_text)
-            resume = await self.save_resume_to_db(db, resume_data, resume_link, user_id)
+            upload = await spool_upload(file)
+            try:
+                resume_link, resume_text, resume_data, salaries_kzt = await self.process_upload(upload)
+                try:
+                    resume = await self.save_resume_to_db(db, resume_data, resume_link, user_id, salaries_kzt, resume_text)
+                except Exception:
+                    await self.delete_resume_file(resume_link)
+                    raise
+            finally:
+                upload.cleanup()
             logging.info(f"[RESUME CREATION] Resume for user {user_id} is successfully processed")
             return resume
+        except HTTPException:
+            raise
         except Exception as e:
             logging.error(f"[RESUME CREATION ERROR] Error creating resume: {e}", exc_info=True)
             raise HTTPException(status_code=500, detail=f"Error processing resume: {str(e)}")
 
+    async def prepare_bulk_uploads(self, files: List[UploadFile]) -> tuple[List[SpooledUpload], List[dict]]:
+        """
+        Spools every uploaded PDF (and every PDF inside uploaded ZIP archives) to disk.
+        Returns the accepted uploads and a result entry for each rejected file.
+        """
+        uploads: List[SpooledUpload] = []
+        rejected: List[dict] = []
+        try:
+            for file in files:
+                filename = file.filename or ""
+                if file.content_type in ZIP_CONTENT_TYPES or filename.lower().endswith(".zip"):
+                    archive = await spool_upload(file, max_bytes=BackendConfig.BULK_MAX_UPLOAD_BYTES)
+                    try:
+                        uploads.extend(await asyncio.to_thread(extract_zip_pdfs, archive))
+                    finally:
+                        archive.cleanup()
+                elif file.content_type == "application/pdf" or filename.lower().endswith(".pdf"):
+                    try:
+                        uploads.append(await spool_upload(file))
+                    except HTTPException as e:
+                        rejected.append({"filename": filename, "status": "failed", "error": e.detail})
+                else:
+                    rejected.append({"filename": filename, "status": "failed", "error": "Только PDF-файлы поддерживаются"})
+
+                if len(uploads) > BackendConfig.BULK_MAX_FILES:
+                    raise HTTPException(status_code=413, detail=f"More than {BackendConfig.BULK_MAX_FILES} files in one import")
+        except BaseException:
+            for upload in uploads:
+                upload.cleanup()
+            raise
+
+        logging.info(f"[RESUME BULK] Prepared {len(uploads)} files, rejected {len(rejected)}")
+        return uploads, rejected
+
+    async def bulk_import(
+        self,
+        uploads: List[SpooledUpload],
+        rejected: List[dict],
+        user_id: int,
+        session_factory=SessionLocal,
+        concurrency: int = BackendConfig.BULK_IMPORT_CONCURRENCY,
+        batch_size: int = BackendConfig.BULK_IMPORT_DB_BATCH_SIZE
+    ) -> AsyncIterator[str]:
+        """
+        Processes uploads with at most `concurrency` files in the upload/parse/LLM stages at once,
+        inserts the resulting rows in batches and yields one NDJSON line per file as its row is committed,
+        followed by a summary line.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        counters = {"processed": 0, "failed": len(rejected)}
+
+        async def process(upload: SpooledUpload):
+            async with semaphore:
+                try:
+                    return upload, await self.process_upload(upload), None
+                except Exception as e:
+                    detail = e.detail if isinstance(e, HTTPException) else str(e)
+                    logging.error(f"[RESUME BULK] Failed to process {upload.filename}: {detail}")
+                    return upload, None, detail
+                finally:
+                    upload.cleanup()
+
+        def line(payload: dict) -> str:
+            return json.dumps(payload, ensure_ascii=False, default=str) + "\n"
+
+        for result in rejected:
+            yield line(result)
+
+        # Tasks inherit the priority: imports queue behind interactive LLM calls
+        with use_llm_priority(LLMPriority.bulk):
+            tasks = [asyncio.create_task(process(upload)) for upload in uploads]
+        batch: List[tuple[str, str, ResumeCreate]] = []
+
+        async def flush():
+            rows = list(batch)
+            batch.clear()
+            if self.embedding_service:
+                # One encoder call for the whole batch
+                await self.embedding_service.embed_resume_schemas([schema for _, _, schema in rows])
+            try:
+                async with session_factory() as db:
+                    resume_ids = await self.resume_database.create_resumes(db, [schema for _, _, schema in rows])
+            except Exception as e:
+                logging.error(f"[RESUME BULK] Failed to insert a batch of {len(rows)} resumes: {e}", exc_info=True)
+                for _, resume_link, _ in rows:
+                    await self.delete_resume_file(resume_link)
+                counters["failed"] += len(rows)
+                return [line({"filename": filename, "status": "failed", "error": "Database error"}) for filename, _, _ in rows]
+
+            counters["processed"] += len(rows)
+            invalidate_user_recommendations(user_id)
+            if self.embedding_service:
+                for (_, _, schema), resume_id in zip(rows, resume_ids):
+                    self.embedding_service.index_resume(resume_id, schema)
+            return [
+                line({"filename": filename, "status": "processed", "resume_id": resume_id})
+                for (filename, _, _), resume_id in zip(rows, resume_ids)
+            ]
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                upload, processed, error = await next_done
+                if error is not None:
+                    counters["failed"] += 1
+                    yield line({"filename": upload.filename, "status": "failed", "error": error})
+                    continue
+
+                resume_link, resume_text, resume_data, salaries_kzt = processed
+                try:
+                    schema = self.build_resume_schema(resume_data, resume_link, user_id, salaries_kzt, resume_text)
+                except Exception as e:
+                    await self.delete_resume_file(resume_link)
+                    counters["failed"] += 1
+                    yield line({"filename": upload.filename, "status": "failed", "error": str(e)})
+                    continue
+
+                batch.append((upload.filename, resume_link, schema))
+                if len(batch) >= batch_size:
+                    for result_line in await flush():
+                        yield result_line
+
+            if batch:
+                for result_line in await flush():
+                    yield result_line
+
+            logging.info(f"[RESUME BULK] User {user_id}: {counters['processed']} processed, {counters['failed']} failed")
+            yield line({"status": "completed", **counters})
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for upload in uploads:
+                upload.cleanup()
+
+    async def download_resume(self, resume_link: str) -> bytes:
+        return await self.storage.read(self.storage.key_for(resume_link))
+
+    async def get_resume_file(self, db: AsyncSession, resume_id: int, viewer: Union[User, HR]) -> tuple[object, StoredObject]:
+        """The stored PDF of a resume, for its owner or for an HR who received it with an application."""
+        resume = await self.resume_database.get_resume_by_id(db, resume_id)
+        if not resume:
+            raise HTTPException(status_code=404, detail="Resume not found")
+
+        if isinstance(viewer, User):
+            allowed = resume.user_id == viewer.id
+        elif isinstance(viewer, HR):
+            allowed = await self.resume_database.hr_has_application_for_resume(db, viewer.id, resume.id)
+        else:
+            allowed = False
+        if not allowed:
+            logging.warning(f"[RESUME DOWNLOAD] Access to resume {resume_id} denied for {type(viewer).__name__} {viewer.id}")
+            raise HTTPException(status_code=403, detail="Access denied")
+
+        stored = await self.storage.stat(self.storage.key_for(resume.resume_link))
+        if not stored:
+            logging.error(f"[RESUME DOWNLOAD] File of resume {resume_id} is missing: {resume.resume_link}")
+            raise HTTPException(status_code=404, detail="Resume file not found")
+        return resume, stored
+
+    async def reanalyze_resume(self, db: AsyncSession, resume, reextract: bool = False):
+        """
+        Re-runs the LLM analysis of a stored resume with the current prompt.
+        Uses the stored normalized text when available, so neither the file download
+        nor PDF parsing is repeated; `reextract` forces both, e.g. after preprocessing changes.
+        """
+        if resume.resume_text and not reextract:
+            resume_text = decompress_text(resume.resume_text)
+        else:
+            logging.info(f"[RESUME REANALYSIS] Re-extracting text of resume {resume.id} from {resume.resume_link}")
+            pdf_bytes = await self.download_resume(resume.resume_link)
+            resume_text = self.prepare_resume_text(await self.extract_text_from_pdf(pdf_bytes))
+
+        resume_data = await self.analyze_resume(resume_text)
+        salaries_kzt = await self.convert_resume_salary(resume_data)
+        resume_schema = self.build_resume_schema(resume_data, resume.resume_link, resume.user_id, salaries_kzt, resume_text)
+        changed_fields = changed_matching_fields(resume, resume_schema.model_dump(), RESUME_MATCHING_FIELDS)
+        if changed_fields and self.rescoring_service:
+            await self.rescoring_service.schedule(db, RESCORING_TARGET_RESUME, resume.id, changed_fields)
+        if self.embedding_service:
+            await self.embedding_service.embed_resume_schemas([resume_schema])
+        resume = await self.resume_database.update_resume(db, resume, resume_schema)
+        if self.embedding_service:
+            self.embedding_service.index_resume(resume.id, resume_schema)
+        invalidate_user_recommendations(resume.user_id)
+        logging.info(f"[RESUME REANALYSIS] Resume {resume.id} re-analyzed with {RESUME_PROMPT_VERSION}")
+        return resume
+
     async def get_resume_by_id(self, db: AsyncSession, resume_id: int):
         logging.info(f"[RESUME] Fetching resume with ID {resume_id}")
         resume = await self.resume_database.get_resume_by_id(db, resume_id)
         return resume
 
+    async def get_resume_by_link(self, db: AsyncSession, user_id: int, resume_link: str):
+        """The user's resume stored under `resume_link`, if it was already saved."""
+        return await self.resume_database.get_user_resume_by_link(db, user_id, resume_link)
+
     async def get_user_resumes(self, db: AsyncSession, user_id: int):
         logging.info(f"[RESUME] Fetching resumes for user with ID {user_id}")
         resumes = await self.resume_database.get_resumes_by_user_id(db, user_id)
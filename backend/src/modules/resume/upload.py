@@ -0,0 +1,135 @@
+import hashlib
+import logging
+import os
+import tempfile
+import zipfile
+from dataclasses import dataclass
+from typing import BinaryIO, List
+import aiofiles
+from fastapi import HTTPException, Request, UploadFile
+from src.core.config import BackendConfig
+
+
+@dataclass
+class SpooledUpload:
+    """An uploaded file written to a temporary file on disk, with its size and SHA-256 computed on the way."""
+    path: str
+    size: int
+    sha256: str
+    filename: str
+
+    def open(self) -> BinaryIO:
+        return open(self.path, "rb")
+
+    def cleanup(self) -> None:
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def _check_content_length(request: Request, max_bytes: int):
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+        logging.warning(f"[RESUME UPLOAD] Rejected upload of {content_length} bytes")
+        raise HTTPException(status_code=413, detail="Uploaded file is too large")
+
+
+async def limit_upload_size(request: Request):
+    """
+    Route dependency rejecting oversized uploads from the Content-Length header,
+    before the multipart body is parsed.
+    """
+    _check_content_length(request, BackendConfig.MAX_RESUME_UPLOAD_BYTES)
+
+
+async def limit_bulk_upload_size(request: Request):
+    _check_content_length(request, BackendConfig.BULK_MAX_UPLOAD_BYTES)
+
+
+async def spool_upload(
+    file: UploadFile,
+    max_bytes: int = BackendConfig.MAX_RESUME_UPLOAD_BYTES,
+    chunk_size: int = BackendConfig.UPLOAD_CHUNK_SIZE
+) -> SpooledUpload:
+    """
+    Copies an upload to a temporary file chunk by chunk, so at most one chunk is held in memory.
+    Raises 413 as soon as the size limit is exceeded.
+    """
+    fd, path = tempfile.mkstemp(suffix=".pdf", dir=BackendConfig.UPLOAD_TMP_DIR or None)
+    os.close(fd)
+    digest = hashlib.sha256()
+    size = 0
+
+    try:
+        async with aiofiles.open(path, "wb") as out:
+            while chunk := await file.read(chunk_size):
+                size += len(chunk)
+                if size > max_bytes:
+                    logging.warning(f"[RESUME UPLOAD] {file.filename} exceeds {max_bytes} bytes")
+                    raise HTTPException(status_code=413, detail="Uploaded file is too large")
+                digest.update(chunk)
+                await out.write(chunk)
+    except BaseException:
+        os.unlink(path)
+        raise
+
+    if size == 0:
+        os.unlink(path)
+        raise HTTPException(status_code=400, detail="Uploaded file is empty")
+
+    logging.info(f"[RESUME UPLOAD] Spooled {file.filename} ({size} bytes) to {path}")
+    return SpooledUpload(path=path, size=size, sha256=digest.hexdigest(), filename=file.filename)
+
+
+def extract_zip_pdfs(
+    archive: SpooledUpload,
+    max_files: int = BackendConfig.BULK_MAX_FILES,
+    max_entry_bytes: int = BackendConfig.MAX_RESUME_UPLOAD_BYTES,
+    chunk_size: int = BackendConfig.UPLOAD_CHUNK_SIZE
+) -> List[SpooledUpload]:
+    """
+    Unpacks the PDF entries of a ZIP archive into temporary files.
+    Entry sizes are enforced on the decompressed stream, not on the (forgeable) header,
+    so a zip bomb cannot exhaust the disk. Blocking: call it from a thread.
+    """
+    uploads: List[SpooledUpload] = []
+    try:
+        with zipfile.ZipFile(archive.path) as zip_file:
+            entries = [
+                info for info in zip_file.infolist()
+                if not info.is_dir() and info.filename.lower().endswith(".pdf")
+                and not os.path.basename(info.filename).startswith(".")
+            ]
+            if len(entries) > max_files:
+                raise HTTPException(status_code=413, detail=f"Archive contains more than {max_files} PDF files")
+
+            for info in entries:
+                fd, path = tempfile.mkstemp(suffix=".pdf", dir=BackendConfig.UPLOAD_TMP_DIR or None)
+                digest = hashlib.sha256()
+                size = 0
+                try:
+                    with os.fdopen(fd, "wb") as out, zip_file.open(info) as entry:
+                        while chunk := entry.read(chunk_size):
+                            size += len(chunk)
+                            if size > max_entry_bytes:
+                                raise HTTPException(status_code=413, detail=f"{info.filename} is too large")
+                            digest.update(chunk)
+                            out.write(chunk)
+                except BaseException:
+                    os.unlink(path)
+                    raise
+                uploads.append(SpooledUpload(
+                    path=path, size=size, sha256=digest.hexdigest(), filename=os.path.basename(info.filename)
+                ))
+    except zipfile.BadZipFile:
+        for upload in uploads:
+            upload.cleanup()
+        raise HTTPException(status_code=400, detail=f"{archive.filename} is not a valid ZIP archive")
+    except BaseException:
+        for upload in uploads:
+            upload.cleanup()
+        raise
+
+    logging.info(f"[RESUME UPLOAD] Extracted {len(uploads)} PDF files from {archive.filename}")
+    return uploads
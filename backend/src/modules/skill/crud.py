@@ -0,0 +1,81 @@
+from collections import defaultdict
+from typing import Dict, Iterable, List, Set
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from src.models import Resume, ResumeSkill, Skill, Vacancy, VacancySkill, VacancyStatusEnum
+
+SKILL_NAME_MAX_LENGTH = Skill.name.type.length
+
+
+class SkillIndexDatabase():
+    """
+    Posting lists of the inverted skill index. The writes join the caller's transaction without committing,
+    so the skills of a resume or vacancy are saved together with it.
+    """
+
+    async def get_skill_ids(self, db: AsyncSession, names: Iterable[str]) -> Dict[str, int]:
+        """Ids of the skills with these names, adding the ones seen for the first time."""
+        names = sorted({name for name in names if name and len(name) <= SKILL_NAME_MAX_LENGTH})
+        if not names:
+            return {}
+        # Sorted, so concurrent transactions adding the same new skills lock them in the same order
+        await db.execute(
+            insert(Skill).values([{"name": name} for name in names]).on_conflict_do_nothing(index_elements=["name"])
+        )
+        result = await db.execute(select(Skill.name, Skill.id).where(Skill.name.in_(names)))
+        return dict(result.all())
+
+    async def _replace_postings(self, db: AsyncSession, table, owner_column, skills_by_owner: Dict[int, Iterable[str]]) -> None:
+        skills_by_owner = {owner_id: set(names or []) for owner_id, names in skills_by_owner.items()}
+        if not skills_by_owner:
+            return
+        skill_ids = await self.get_skill_ids(db, set().union(*skills_by_owner.values()))
+        await db.execute(delete(table).where(owner_column.in_(list(skills_by_owner))))
+        postings = [
+            {"skill_id": skill_ids[name], owner_column.key: owner_id}
+            for owner_id, names in skills_by_owner.items() for name in names if name in skill_ids
+        ]
+        if postings:
+            await db.execute(insert(table), postings)
+
+    async def replace_resume_skills(self, db: AsyncSession, skills_by_resume: Dict[int, Iterable[str]]) -> None:
+        """`skills_by_resume` maps resume ids to their normalized skills (Resume.skill_tags)."""
+        await self._replace_postings(db, ResumeSkill, ResumeSkill.resume_id, skills_by_resume)
+
+    async def replace_vacancy_skills(self, db: AsyncSession, skills_by_vacancy: Dict[int, Iterable[str]]) -> None:
+        """`skills_by_vacancy` maps vacancy ids to their normalized skills (parse_skills of Vacancy.skills)."""
+        await self._replace_postings(db, VacancySkill, VacancySkill.vacancy_id, skills_by_vacancy)
+
+    async def get_resume_skills(self, db: AsyncSession, resume_id: int) -> Set[str]:
+        result = await db.execute(
+            select(Skill.name).join(ResumeSkill, ResumeSkill.skill_id == Skill.id).where(ResumeSkill.resume_id == resume_id)
+        )
+        return set(result.scalars().all())
+
+    async def get_vacancy_skills_by_status(self, db: AsyncSession, status: VacancyStatusEnum) -> Dict[int, Set[str]]:
+        """Skill names of every vacancy with this status, by vacancy id; vacancies without skills are left out."""
+        result = await db.execute(
+            select(VacancySkill.vacancy_id, Skill.name)
+            .join(Skill, Skill.id == VacancySkill.skill_id)
+            .join(Vacancy, Vacancy.id == VacancySkill.vacancy_id)
+            .where(Vacancy.status == status)
+        )
+        skills: Dict[int, Set[str]] = defaultdict(set)
+        for vacancy_id, name in result.all():
+            skills[vacancy_id].add(name)
+        return skills
+
+    async def get_resumes_for_indexing(self, db: AsyncSession, after_id: int, limit: int) -> List[Row]:
+        result = await db.execute(
+            select(Resume.id, Resume.skills).where(Resume.id > after_id).order_by(Resume.id).limit(limit)
+        )
+        return result.all()
+
+    async def get_vacancies_for_indexing(self, db: AsyncSession, after_id: int, limit: int) -> List[Row]:
+        result = await db.execute(
+            select(Vacancy.id, Vacancy.skills).where(Vacancy.id > after_id).order_by(Vacancy.id).limit(limit)
+        )
+        return result.all()
@@ -0,0 +1,153 @@
+# Canonical skill names and the spellings resumes and vacancies use for them. Keys and aliases are compared
+# after normalize_skill's cleaning (lower case, runs of spaces, dashes and underscores as one space), and also
+# without spaces, so "Postgre SQL" and "postgre-sql" need no alias of their own.
+SKILL_DICTIONARY = {
+    # Languages
+    "python": ["py", "python3", "питон", "пайтон"],
+    "javascript": ["js", "java script", "ecmascript", "es6", "джаваскрипт"],
+    "typescript": ["ts"],
+    "java": ["java se", "java ee", "джава"],
+    "kotlin": [],
+    "swift": [],
+    "objective-c": ["objective c", "objc"],
+    "c": [],
+    "c++": ["cpp", "с++"],
+    "c#": ["c sharp", "csharp", "с#"],
+    "go": ["golang"],
+    "rust": [],
+    "php": [],
+    "ruby": [],
+    "scala": [],
+    "r": [],
+    "dart": [],
+    "bash": ["shell", "shell scripting", "sh"],
+    "sql": ["t-sql", "tsql", "pl/sql", "plsql", "sql запросы"],
+    "html": ["html5"],
+    "css": ["css3"],
+    # Frameworks and libraries
+    "react": ["reactjs", "react.js", "react js"],
+    "vue": ["vuejs", "vue.js", "vue js"],
+    "angular": ["angularjs", "angular.js"],
+    "next.js": ["nextjs", "next js"],
+    "node.js": ["nodejs", "node", "node js"],
+    "express": ["express.js", "expressjs"],
+    "django": ["django rest framework", "drf"],
+    "flask": [],
+    "fastapi": ["fast api"],
+    "spring": ["spring boot", "springboot", "spring framework"],
+    "hibernate": [],
+    "dotnet": [".net", "net", ".net core", "net core", "dotnet core"],
+    "asp.net": ["asp.net core", "asp net"],
+    "laravel": [],
+    "symfony": [],
+    "ruby on rails": ["rails", "ror"],
+    "flutter": [],
+    "react native": [],
+    "jquery": [],
+    "redux": [],
+    "tailwind": ["tailwind css", "tailwindcss"],
+    "bootstrap": [],
+    "sass": ["scss"],
+    "webpack": [],
+    "graphql": [],
+    "rest api": ["rest", "restful", "restful api"],
+    "grpc": [],
+    "celery": [],
+    "sqlalchemy": [],
+    "pandas": [],
+    "numpy": [],
+    "scikit-learn": ["sklearn", "scikit learn"],
+    "pytorch": ["torch"],
+    "tensorflow": [],
+    "keras": [],
+    "opencv": [],
+    "selenium": [],
+    "pytest": [],
+    "junit": [],
+    "playwright": [],
+    "cypress": [],
+    "postman": [],
+    # Data stores and messaging
+    "postgresql": ["postgres", "psql", "постгрес", "postgre"],
+    "mysql": [],
+    "oracle": ["oracle db", "oracle database"],
+    "ms sql server": ["mssql", "sql server", "microsoft sql server"],
+    "sqlite": [],
+    "mongodb": ["mongo"],
+    "redis": [],
+    "elasticsearch": ["elastic search", "elastic"],
+    "clickhouse": [],
+    "cassandra": [],
+    "kafka": ["apache kafka"],
+    "rabbitmq": ["rabbit mq"],
+    # Infrastructure
+    "docker": ["docker compose", "docker-compose"],
+    "kubernetes": ["k8s", "кубернетес"],
+    "terraform": [],
+    "ansible": [],
+    "jenkins": [],
+    "gitlab ci": ["gitlab ci/cd", "gitlab-ci"],
+    "github actions": [],
+    "ci/cd": ["ci cd", "cicd"],
+    "linux": ["unix", "ubuntu", "centos", "debian"],
+    "nginx": [],
+    "aws": ["amazon web services"],
+    "azure": ["microsoft azure"],
+    "gcp": ["google cloud", "google cloud platform"],
+    "git": ["github", "gitlab", "bitbucket"],
+    "prometheus": [],
+    "grafana": [],
+    # Data and analytics
+    "machine learning": ["ml", "машинное обучение"],
+    "deep learning": ["глубокое обучение"],
+    "nlp": ["natural language processing"],
+    "computer vision": ["компьютерное зрение"],
+    "data analysis": ["анализ данных", "data analytics"],
+    "statistics": ["статистика", "математическая статистика"],
+    "excel": ["ms excel", "microsoft excel", "эксель", "эксел"],
+    "power bi": ["powerbi", "microsoft power bi"],
+    "tableau": [],
+    "looker": [],
+    "airflow": ["apache airflow"],
+    "spark": ["apache spark", "pyspark"],
+    "hadoop": [],
+    "etl": [],
+    "google analytics": [],
+    "яндекс метрика": ["yandex metrica", "yandex metrika", "метрика"],
+    # Design
+    "figma": ["фигма"],
+    "photoshop": ["adobe photoshop", "фотошоп"],
+    "illustrator": ["adobe illustrator"],
+    "after effects": ["adobe after effects"],
+    "autocad": ["автокад"],
+    "ui/ux": ["ui ux", "ux/ui", "ux ui", "ui", "ux"],
+    # Business, finance and office
+    "1c": ["1с", "1с: предприятие", "1c: предприятие", "1с предприятие", "1с бухгалтерия", "1c бухгалтерия"],
+    "ms office": ["microsoft office", "office"],
+    "word": ["ms word", "microsoft word"],
+    "powerpoint": ["ms powerpoint", "microsoft powerpoint"],
+    "jira": [],
+    "confluence": [],
+    "scrum": [],
+    "agile": [],
+    "kanban": [],
+    "crm": ["crm системы", "amocrm", "битрикс24", "bitrix24"],
+    "sap": [],
+    "ifrs": ["мсфо"],
+    "seo": [],
+    "smm": [],
+    "копирайтинг": ["copywriting"],
+    "бухгалтерский учет": ["бухучет", "бух учет", "accounting"],
+    "налоговый учет": ["налогообложение"],
+    "управление проектами": ["project management"],
+    "переговоры": ["ведение переговоров", "negotiations"],
+    "продажи": ["активные продажи", "b2b продажи", "sales"],
+}
+
+# Aliases that are common words or single letters elsewhere: they name the skill only when they are
+# the whole skill entry, never inside a longer one ("go", "c", "node", "office", ...)
+WHOLE_ENTRY_ONLY = {
+    "c", "r", "go", "sh", "ts", "py", "ml", "ui", "ux", "net", "node", "rest", "shell", "office", "word", "express",
+    "elastic", "mongo", "torch", "rails", "ror", "drf", "postgre", "sales", "accounting", "метрика", "статистика",
+    "продажи", "переговоры",
+}
@@ -0,0 +1,96 @@
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional
+from .dictionary import SKILL_DICTIONARY, WHOLE_ENTRY_ONLY
+
+_SKILL_CLEAN_RE = re.compile(r"[\s\-_]+")
+_TOKEN_STRIP = "()[]{}<>:;,.!?\"'«»"
+
+
+def clean_skill(skill: str) -> str:
+    """Lower case, runs of spaces, dashes and underscores as one space, no surrounding spaces or dots."""
+    return _SKILL_CLEAN_RE.sub(" ", skill.strip().lower()).strip(" .")
+
+
+def skill_tokens(text: str) -> List[str]:
+    tokens = (token.strip(_TOKEN_STRIP) for token in clean_skill(text).split(" "))
+    return [token for token in tokens if token]
+
+
+class SkillMatcher:
+    """
+    Maps skill entries to canonical names from a {canonical: [aliases]} dictionary.
+    A whole entry is looked up as is and without spaces ("Postgre SQL" is "postgresql"); otherwise known skills
+    are found inside it ("опыт работы с Postgres и Docker") by walking a trie of alias tokens, longest match first,
+    so the cost depends on the entry length and not on the dictionary size.
+    """
+
+    def __init__(self, dictionary: Dict[str, Iterable[str]], whole_entry_only: Iterable[str] = (), cache_size: int = 65536):
+        self.names: Dict[str, str] = {}
+        self.trie: dict = {}
+        whole_entry_only = {" ".join(skill_tokens(alias)) for alias in whole_entry_only}
+        for canonical, aliases in dictionary.items():
+            for alias in [canonical, *aliases]:
+                tokens = skill_tokens(alias)
+                key = " ".join(tokens)
+                self.names.setdefault(key, canonical)
+                self.names.setdefault(key.replace(" ", ""), canonical)
+                if key not in whole_entry_only:
+                    self._add_to_trie(tokens, canonical)
+        # Skill entries repeat a lot between resumes and vacancies
+        self.normalize = lru_cache(maxsize=cache_size)(self._normalize)
+        self.extract = lru_cache(maxsize=cache_size)(self._extract)
+
+    def _add_to_trie(self, tokens: List[str], canonical: str) -> None:
+        node = self.trie
+        for token in tokens:
+            node = node.setdefault(token, {})
+        node.setdefault(None, canonical)
+
+    def lookup(self, entry: str) -> Optional[str]:
+        """Canonical name when the whole entry is a known skill."""
+        key = " ".join(skill_tokens(entry))
+        return self.names.get(key) or self.names.get(key.replace(" ", ""))
+
+    def _normalize(self, skill: str) -> str:
+        return self.lookup(skill) or clean_skill(skill)
+
+    def scan(self, text: str) -> List[str]:
+        """Canonical names of the known skills mentioned in `text`, in order of appearance."""
+        tokens = skill_tokens(text)
+        found: List[str] = []
+        start = 0
+        while start < len(tokens):
+            node, match, end = self.trie, None, start
+            for position in range(start, len(tokens)):
+                node = node.get(tokens[position])
+                if node is None:
+                    break
+                if None in node:
+                    match, end = node[None], position + 1
+            if match is None:
+                start += 1
+            else:
+                found.append(match)
+                start = end
+        return found
+
+    def _extract(self, entry: str) -> FrozenSet[str]:
+        """
+        Canonical skills of one skill entry. Parts separated by "/" ("Excel/Word") are tried one by one;
+        an entry without any known skill is kept as cleaned, so rare skills still match each other.
+        """
+        canonical = self.lookup(entry)
+        if canonical:
+            return frozenset([canonical])
+        found = set()
+        for part in entry.split("/"):
+            canonical = self.lookup(part)
+            found.update([canonical] if canonical else self.scan(part))
+        if found:
+            return frozenset(found)
+        cleaned = clean_skill(entry)
+        return frozenset([cleaned] if cleaned else [])
+
+
+skill_matcher = SkillMatcher(SKILL_DICTIONARY, WHOLE_ENTRY_ONLY)
@@ -0,0 +1,57 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncIterator, Optional
+
+
+@dataclass
+class StoredObject:
+    key: str
+    size: int
+    etag: str
+    last_modified: Optional[datetime] = None
+    content_type: str = "application/pdf"
+    # Set by backends that keep files on the local filesystem, so responses can use sendfile
+    path: Optional[str] = None
+
+
+class ResumeStorage(ABC):
+    """
+    Where uploaded resume files live. Objects are addressed by key; the link stored on a resume
+    is built by the backend and always ends with the key.
+    """
+    name: str = "storage"
+
+    @abstractmethod
+    async def save_file(self, key: str, path: str, size: int) -> str:
+        """Stores a file from disk without reading it into memory and returns its link."""
+
+    @abstractmethod
+    async def save_bytes(self, key: str, data: bytes) -> str:
+        """Stores in-memory content and returns its link."""
+
+    @abstractmethod
+    async def read(self, key: str) -> bytes:
+        ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    async def stat(self, key: str) -> Optional[StoredObject]:
+        """Returns size and ETag of an object, or None if it does not exist."""
+
+    @abstractmethod
+    def iter_range(self, key: str, start: int, end: int, chunk_size: int) -> AsyncIterator[bytes]:
+        """Yields bytes start..end (inclusive) of an object in chunks of at most chunk_size."""
+
+    @abstractmethod
+    def link_for(self, key: str) -> str:
+        ...
+
+    def key_for(self, link: str) -> str:
+        return link.rsplit("/", 1)[-1]
+
+    async def close(self) -> None:
+        pass
@@ -0,0 +1,22 @@
+from azure.storage.blob.aio import BlobServiceClient
+from src.core.config import BackendConfig
+from .azure_storage import AzureBlobStorage
+from .base import ResumeStorage
+from .local_storage import LocalFileStorage
+from .memory_storage import InMemoryStorage
+
+def get_blob_service_client():
+    return BlobServiceClient.from_connection_string(
+        BackendConfig.AZURE_STORAGE_CONNECTION_STRING,
+        max_single_put_size=BackendConfig.BLOB_UPLOAD_BLOCK_SIZE,
+        max_block_size=BackendConfig.BLOB_UPLOAD_BLOCK_SIZE
+    )
+
+def build_resume_storage(backend: str = BackendConfig.RESUME_STORAGE_BACKEND) -> ResumeStorage:
+    if backend == "local":
+        return LocalFileStorage(BackendConfig.LOCAL_STORAGE_PATH)
+    if backend == "memory":
+        return InMemoryStorage(BackendConfig.MEMORY_STORAGE_LATENCY_MS / 1000)
+    if backend == "azure":
+        return AzureBlobStorage(get_blob_service_client(), BackendConfig.AZURE_STORAGE_CONTAINER_NAME)
+    raise ValueError(f"Unknown RESUME_STORAGE_BACKEND: {backend}")
@@ -0,0 +1,81 @@
+import asyncio
+import os
+import shutil
+from datetime import datetime, timezone
+from typing import AsyncIterator, Optional
+import aiofiles
+from fastapi import HTTPException
+from src.core.config import BackendConfig
+from .base import ResumeStorage, StoredObject
+
+
+class LocalFileStorage(ResumeStorage):
+    """
+    Keeps resume files in a directory on the local filesystem, for on-prem deployments and
+    for running without network access. Links have the form local://<key>.
+    """
+    name = "local"
+
+    def __init__(self, root: str = BackendConfig.LOCAL_STORAGE_PATH):
+        self.root = os.path.abspath(root)
+        os.makedirs(self.root, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        path = os.path.abspath(os.path.join(self.root, key))
+        if os.path.dirname(path) != self.root:
+            raise HTTPException(status_code=400, detail="Invalid storage key")
+        return path
+
+    def link_for(self, key: str) -> str:
+        return f"local://{key}"
+
+    async def save_file(self, key: str, path: str, size: int) -> str:
+        target = self._path(key)
+        # Written under a temporary name and renamed, so a partial file is never served
+        tmp_target = f"{target}.part"
+        await asyncio.to_thread(shutil.copyfile, path, tmp_target)
+        os.replace(tmp_target, target)
+        return self.link_for(key)
+
+    async def save_bytes(self, key: str, data: bytes) -> str:
+        target = self._path(key)
+        tmp_target = f"{target}.part"
+        async with aiofiles.open(tmp_target, "wb") as out:
+            await out.write(data)
+        os.replace(tmp_target, target)
+        return self.link_for(key)
+
+    async def read(self, key: str) -> bytes:
+        async with aiofiles.open(self._path(key), "rb") as f:
+            return await f.read()
+
+    async def delete(self, key: str) -> None:
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    async def stat(self, key: str) -> Optional[StoredObject]:
+        path = self._path(key)
+        try:
+            stat_result = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return StoredObject(
+            key=key,
+            size=stat_result.st_size,
+            etag=f"{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}",
+            last_modified=datetime.fromtimestamp(stat_result.st_mtime, tz=timezone.utc),
+            path=path
+        )
+
+    async def iter_range(self, key: str, start: int, end: int, chunk_size: int) -> AsyncIterator[bytes]:
+        async with aiofiles.open(self._path(key), "rb") as f:
+            await f.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                chunk = await f.read(min(chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
@@ -0,0 +1,64 @@
+import asyncio
+import hashlib
+from datetime import datetime, timezone
+from typing import AsyncIterator, Dict, Optional, Tuple
+from .base import ResumeStorage, StoredObject
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+class InMemoryStorage(ResumeStorage):
+    """
+    Keeps resume files in process memory, for load tests and benchmarks without Azure Blob Storage.
+    `latency` seconds are added to every operation to stand in for the network round trip.
+    Links have the form memory://<key>.
+    """
+    name = "memory"
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self._objects: Dict[str, Tuple[bytes, StoredObject]] = {}
+
+    async def _delay(self):
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+
+    def link_for(self, key: str) -> str:
+        return f"memory://{key}"
+
+    async def save_file(self, key: str, path: str, size: int) -> str:
+        data = await asyncio.to_thread(_read_file, path)
+        return await self.save_bytes(key, data)
+
+    async def save_bytes(self, key: str, data: bytes) -> str:
+        await self._delay()
+        self._objects[key] = (data, StoredObject(
+            key=key,
+            size=len(data),
+            etag=hashlib.md5(data).hexdigest(),
+            last_modified=datetime.now(timezone.utc)
+        ))
+        return self.link_for(key)
+
+    async def read(self, key: str) -> bytes:
+        await self._delay()
+        if key not in self._objects:
+            raise FileNotFoundError(key)
+        return self._objects[key][0]
+
+    async def delete(self, key: str) -> None:
+        await self._delay()
+        self._objects.pop(key, None)
+
+    async def stat(self, key: str) -> Optional[StoredObject]:
+        await self._delay()
+        entry = self._objects.get(key)
+        return entry[1] if entry else None
+
+    async def iter_range(self, key: str, start: int, end: int, chunk_size: int) -> AsyncIterator[bytes]:
+        data = await self.read(key)
+        for offset in range(start, end + 1, chunk_size):
+            yield data[offset:min(offset + chunk_size, end + 1)]
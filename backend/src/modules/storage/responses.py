@@ -0,0 +1,92 @@
+import re
+from email.utils import format_datetime
+from typing import Optional, Tuple
+from fastapi import HTTPException, Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from src.core.config import BackendConfig
+from .base import ResumeStorage, StoredObject
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def parse_range(range_header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parses a single-range `Range` header into inclusive (start, end) offsets.
+    Returns None for a missing header or a multi-range request, which are answered with the full file.
+    """
+    if not range_header or "," in range_header:
+        return None
+
+    match = _RANGE_RE.match(range_header.strip())
+    if not match or match.groups() == ("", ""):
+        raise HTTPException(status_code=416, detail="Invalid range", headers={"Content-Range": f"bytes */{size}"})
+
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    else:
+        # Suffix range: the last N bytes
+        start = max(size - int(last), 0)
+        end = size - 1
+
+    if start > end or start >= size:
+        raise HTTPException(status_code=416, detail="Range not satisfiable", headers={"Content-Range": f"bytes */{size}"})
+    return start, end
+
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    candidates = [value.strip().removeprefix("W/").strip('"') for value in header.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def build_download_response(
+    request: Request,
+    storage: ResumeStorage,
+    stored: StoredObject,
+    filename: str,
+    chunk_size: int = BackendConfig.STORAGE_DOWNLOAD_CHUNK_SIZE
+) -> Response:
+    """
+    Serves a stored file with ETag revalidation and single byte-range support.
+    Full responses for files on local disk go through FileResponse, so the server can use sendfile.
+    """
+    headers = {
+        "ETag": f'"{stored.etag}"',
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": f'inline; filename="{filename}"',
+        "Cache-Control": "private, max-age=0, must-revalidate",
+    }
+    if stored.last_modified:
+        headers["Last-Modified"] = format_datetime(stored.last_modified, usegmt=True)
+
+    if _etag_matches(request.headers.get("if-none-match"), stored.etag):
+        return Response(status_code=304, headers=headers)
+
+    byte_range = parse_range(request.headers.get("range"), stored.size)
+    if_range = request.headers.get("if-range")
+    if byte_range and if_range and if_range.strip('"') != stored.etag:
+        # The client's partial copy is outdated: send the whole file
+        byte_range = None
+
+    if byte_range is None:
+        if stored.path:
+            return FileResponse(stored.path, media_type=stored.content_type, headers=headers)
+        headers["Content-Length"] = str(stored.size)
+        return StreamingResponse(
+            storage.iter_range(stored.key, 0, stored.size - 1, chunk_size),
+            media_type=stored.content_type,
+            headers=headers
+        )
+
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{stored.size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(
+        storage.iter_range(stored.key, start, end, chunk_size),
+        status_code=206,
+        media_type=stored.content_type,
+        headers=headers
+    )
@@ -0,0 +1,31 @@
+import hashlib
+import re
+from src.core.cache import DatabaseCacheTier, TTLCache
+from src.core.config import BackendConfig
+from .constants import VACANCY_CLASSIFICATION_PROMPT_VERSION
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+vacancy_classification_cache: TTLCache[list] = TTLCache(
+    name="vacancy_classification",
+    max_size=BackendConfig.VACANCY_CLASSIFICATION_CACHE_MAX_SIZE,
+    ttl_seconds=BackendConfig.VACANCY_CLASSIFICATION_CACHE_TTL_SECONDS,
+)
+
+vacancy_classification_db_cache = DatabaseCacheTier(
+    namespace="vacancy_classification",
+    ttl_seconds=BackendConfig.VACANCY_CLASSIFICATION_CACHE_TTL_SECONDS,
+) if BackendConfig.VACANCY_CLASSIFICATION_DB_CACHE else None
+
+def normalize_description(description: str) -> str:
+    """
+    Descriptions differing only in case or whitespace (e.g. re-pasted into the form) share a cache entry.
+    """
+    return _WHITESPACE_RE.sub(" ", description).strip().casefold()
+
+def build_classification_cache_key(description: str) -> str:
+    """
+    Cache key for a vacancy classification: normalized description hash + prompt version + model deployment.
+    """
+    digest = hashlib.sha256(normalize_description(description).encode("utf-8")).hexdigest()
+    return f"vacancy:{digest}:{VACANCY_CLASSIFICATION_PROMPT_VERSION}:{BackendConfig.AZURE_OPENAI_DEPLOYMENT_NAME}"
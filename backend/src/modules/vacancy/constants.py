@@ -0,0 +1,11 @@
+# Bump whenever the classification prompt changes, so cached classifications are not reused.
+VACANCY_CLASSIFICATION_PROMPT_VERSION = "vacancy-classify-v1"
+
+# Full-text search: matched words in snippets are wrapped in these markers by PostgreSQL, then the snippet
+# is HTML-escaped and the markers become <mark> tags
+SEARCH_MATCH_START = "\x02"
+SEARCH_MATCH_STOP = "\x03"
+SEARCH_HEADLINE_OPTIONS = (
+    f'MaxFragments=2, MaxWords=30, MinWords=12, FragmentDelimiter=" … ", '
+    f'StartSel={SEARCH_MATCH_START}, StopSel={SEARCH_MATCH_STOP}'
+)
@@ -1,12 +1,29 @@
+from sqlalchemy import func, text, true, tuple_
+from sqlalchemy.dialects.postgresql import TSQUERY
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from src.models import Vacancy, VacancyStatusEnum, Application, Resume
+from src.modules.application.scoring import parse_skills
+from src.modules.skill.crud import SkillIndexDatabase
+from .constants import SEARCH_HEADLINE_OPTIONS
+
+
+def search_tsquery(query: str):
+    """Web-search syntax ("quoted phrases", or, -excluded) parsed with both configurations of the search vector."""
+    return func.websearch_to_tsquery("russian", query).op("||", return_type=TSQUERY)(
+        func.websearch_to_tsquery("simple", query)
+    )
 
 
 class VacancyDatabase():
+    def __init__(self, skill_index_database: Optional[SkillIndexDatabase] = None):
+        self.skill_index_database = skill_index_database or SkillIndexDatabase()
+
     async def create_vacancy(self, db: AsyncSession, vacancy: Vacancy) -> Vacancy:
         db.add(vacancy)
+        await db.flush()
+        await self.skill_index_database.replace_vacancy_skills(db, {vacancy.id: parse_skills(vacancy.skills)})
         await db.commit()
         await db.refresh(vacancy)
         return vacancy
@@ -26,6 +43,80 @@ class VacancyDatabase():
         result = await db.execute(query)
         return result.scalars().all()
 
+    async def search_rank_window(
+        self,
+        db: AsyncSession,
+        tsquery,
+        window_start: Optional[int],
+        after: Optional[Tuple[float, int]],
+        limit: int,
+        rank_window: int
+    ) -> Tuple[List[Tuple[int, float]], Optional[int], bool]:
+        """
+        Ranks the newest `rank_window` accepted vacancies matching `tsquery` below id `window_start` and returns
+        (id, rank) of up to `limit` of them after `after`, best first, the smallest id of the window and whether it was full.
+        """
+        window = (
+            select(Vacancy.id, Vacancy.search_vector)
+            .where(Vacancy.status == VacancyStatusEnum.accepted, Vacancy.search_vector.bool_op("@@")(tsquery))
+        )
+        if window_start is not None:
+            window = window.where(Vacancy.id < window_start)
+        window = window.order_by(Vacancy.id.desc()).limit(rank_window).cte("search_window")
+
+        rank = func.ts_rank(window.c.search_vector, tsquery)
+        page = select(window.c.id, rank.label("rank"))
+        if after is not None:
+            page = page.where(tuple_(rank, window.c.id) < tuple_(*after))
+        page = page.order_by(rank.desc(), window.c.id.desc()).limit(limit).subquery()
+        stats = select(func.min(window.c.id).label("floor"), func.count().label("size")).subquery()
+
+        result = await db.execute(
+            select(stats.c.floor, stats.c.size, page.c.id, page.c.rank)
+            .select_from(stats.outerjoin(page, true()))
+            .order_by(page.c.rank.desc(), page.c.id.desc())
+        )
+        rows = result.all()
+        ranked = [(row.id, row.rank) for row in rows if row.id is not None]
+        return ranked, rows[0].floor, rows[0].size >= rank_window
+
+    async def search_accepted_vacancies(
+        self,
+        db: AsyncSession,
+        query: str,
+        after: Optional[Tuple[Optional[int], float, int]],
+        limit: int,
+        rank_window: int
+    ) -> List[Tuple[Vacancy, str, float, Optional[int]]]:
+        """
+        (vacancy, snippet, rank, window start) of accepted vacancies matching `query`: newest matches first in
+        windows of `rank_window`, best rank and then newest first within a window. `after` is the
+        (window start, rank, id) of the last vacancy of the previous page. Snippets are built for the page only.
+        """
+        # Custom plans: whether the GIN index or the primary key is faster depends on how common the words are
+        await db.execute(text("SET LOCAL plan_cache_mode = force_custom_plan"))
+        tsquery = search_tsquery(query)
+
+        window_start, position = (after[0], after[1:]) if after is not None else (None, None)
+        ranked: List[Tuple[int, float, Optional[int]]] = []
+        while len(ranked) < limit:
+            page, floor, full = await self.search_rank_window(
+                db, tsquery, window_start, position, limit - len(ranked), rank_window
+            )
+            ranked.extend((vacancy_id, rank, window_start) for vacancy_id, rank in page)
+            if len(ranked) >= limit or not full:
+                break
+            window_start, position = floor, None
+
+        if not ranked:
+            return []
+        snippet = func.ts_headline("russian", Vacancy.description, tsquery, SEARCH_HEADLINE_OPTIONS)
+        result = await db.execute(select(Vacancy, snippet).where(Vacancy.id.in_([row[0] for row in ranked])))
+        found = {vacancy.id: (vacancy, headline) for vacancy, headline in result.all()}
+        return [
+            (*found[vacancy_id], rank, start) for vacancy_id, rank, start in ranked if vacancy_id in found
+        ]
+
     async def get_accepted_vacancy_by_id(self, db: AsyncSession, vacancy_id: int) -> Optional[Vacancy]:
         query = select(Vacancy).filter(
             Vacancy.id == vacancy_id, 
@@ -35,6 +126,7 @@ class VacancyDatabase():
         return result.scalars().first()
 
     async def update_vacancy(self, db: AsyncSession, vacancy: Vacancy) -> Vacancy:
+        await self.skill_index_database.replace_vacancy_skills(db, {vacancy.id: parse_skills(vacancy.skills)})
         await db.commit()
         await db.refresh(vacancy)
         return vacancy
@@ -53,6 +145,11 @@ class VacancyDatabase():
         result = await db.execute(select(Application.vacancy_id).filter(Application.user_id == user_id))
         return list(result.scalars().all())
 
+    async def get_accepted_vacancies_by_ids(self, db: AsyncSession, vacancy_ids: List[int]) -> List[Vacancy]:
+        query = select(Vacancy).filter(Vacancy.id.in_(vacancy_ids), Vacancy.status == VacancyStatusEnum.accepted)
+        result = await db.execute(query)
+        return result.scalars().all()
+
     async def get_applied_vacancy_details(self, db: AsyncSession, user_id: int) -> List[Vacancy]:
         result = await db.execute(
             select(Vacancy)
@@ -71,6 +168,7 @@ class VacancyDatabase():
             Resume.resume_link,
             Resume.profession,
             Application.matching_score,
+            Application.matching_source,
             Application.summary,
             Application.status
         ).join(Application, Application.resume_id == Resume.id) \
@@ -1,22 +1,23 @@
 from fastapi import Depends
 from langchain_openai import AzureChatOpenAI
-from src.core.config import BackendConfig
+from src.core.clients import get_matching_llm
+from src.modules.embedding.dependencies import get_embedding_service
+from src.modules.embedding.service import EmbeddingService
+from src.modules.rescoring.crud import RescoringJobDatabase
+from src.modules.rescoring.service import RescoringService
+from .cache import vacancy_classification_cache, vacancy_classification_db_cache
 from .crud import VacancyDatabase
 from .service import VacancyService
 
-def get_llm() -> AzureChatOpenAI:
-    return AzureChatOpenAI(
-        azure_endpoint=BackendConfig.AZURE_OPENAI_ENDPOINT,
-        openai_api_key=BackendConfig.AZURE_OPENAI_API_KEY,
-        deployment_name=BackendConfig.AZURE_OPENAI_DEPLOYMENT_NAME,
-        api_version=BackendConfig.AZURE_OPENAI_API_VERSION,
-        temperature=0.4
-    )
-
 def get_vacancy_service(
-    llm: AzureChatOpenAI = Depends(get_llm),
+    llm: AzureChatOpenAI = Depends(get_matching_llm),
+    embedding_service: EmbeddingService = Depends(get_embedding_service)
 ) -> VacancyService:
     return VacancyService(
         vacancy_database=VacancyDatabase(),
-        llm=llm
+        llm=llm,
+        classification_cache=vacancy_classification_cache,
+        classification_db_cache=vacancy_classification_db_cache,
+        rescoring_service=RescoringService(job_database=RescoringJobDatabase()),
+        embedding_service=embedding_service
     )
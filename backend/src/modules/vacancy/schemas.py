@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import Dict, List, Optional
 from decimal import Decimal
 from src.models import EmploymentTypeEnum, ExperienceTimeEnum, JobFormatEnum, VacancyStatusEnum
 
@@ -56,9 +56,22 @@ class VacancyPublic(BaseModel):
     email: Optional[str] = None
     location: Optional[str] = None 
 
+class VacancySearchResult(VacancyPublic):
+    company: Optional[str] = None
+    # ts_rank of the vacancy for the query, higher is better
+    rank: float
+    # Parts of the description around the matched words, HTML-escaped, matches wrapped in <mark>
+    snippet: str = ""
+
+class VacancySearchPage(BaseModel):
+    items: List[VacancySearchResult]
+    # Pass as `cursor` to get the next page; None on the last page
+    next_cursor: Optional[str] = None
+
 class VacancyInDBBase(VacancyBase):
     id: int
     status: VacancyStatusEnum
+    classification: Optional[List[Dict[str, str]]] = None
 
     class Config:
         orm_mode = True
\ No newline at end of file
@@ -1,22 +1,87 @@
+import html
 import logging
+import time
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
-from typing import List
+from typing import List, Optional
 from src.models import Vacancy, VacancyStatusEnum
 from .crud import VacancyDatabase
-from .schemas import VacancyCreate, VacancyUpdate, VacancyInDBBase, VacancyStatusUpdate, VacancyPublic
+from .schemas import (
+    VacancyCreate, VacancyUpdate, VacancyInDBBase, VacancyStatusUpdate, VacancyPublic, VacancySearchPage, VacancySearchResult
+)
 from src.modules.application.schemas import CandidateResponseSchema
 from langchain_openai import AzureChatOpenAI
 from langchain.schema import SystemMessage, HumanMessage
 from langchain_core.runnables import RunnableLambda
 import json
+from src.core.cache import DatabaseCacheTier, TTLCache
 from src.core.config import BackendConfig
+from src.core.pagination import decode_cursor, encode_cursor
+from src.core.llm_metrics import llm_run_config, response_for_log
+from src.core.llm_limiter import LLMPriority, estimate_tokens
+from src.core.llm_resilience import LLM_UNAVAILABLE_ERRORS, LLMCaller, llm_caller as default_llm_caller
+from src.modules.embedding.service import VACANCY_EMBEDDING_FIELDS, EmbeddingService
+from src.modules.recommendation.cache import invalidate_all_recommendations
+from src.modules.rescoring.constants import RESCORING_TARGET_VACANCY, VACANCY_MATCHING_FIELDS
+from src.modules.rescoring.service import RescoringService, changed_matching_fields
+from .cache import build_classification_cache_key
+from .constants import SEARCH_MATCH_START, SEARCH_MATCH_STOP, VACANCY_CLASSIFICATION_PROMPT_VERSION
+
+
+def render_snippet(headline: Optional[str]) -> str:
+    """HTML-escapes a ts_headline fragment and turns its match markers into <mark> tags."""
+    escaped = html.escape(headline or "")
+    return escaped.replace(SEARCH_MATCH_START, "<mark>").replace(SEARCH_MATCH_STOP, "</mark>")
 
 
 class VacancyService:
-    def __init__(self, vacancy_database = VacancyDatabase, llm = AzureChatOpenAI):
+    def __init__(
+        self,
+        vacancy_database = VacancyDatabase,
+        llm = AzureChatOpenAI,
+        classification_cache: TTLCache = None,
+        classification_db_cache: Optional[DatabaseCacheTier] = None,
+        llm_caller: LLMCaller = None,
+        rescoring_service: Optional[RescoringService] = None,
+        embedding_service: Optional[EmbeddingService] = None
+    ):
         self.llm = llm
         self.vacancy_database = vacancy_database
+        self.classification_cache = classification_cache
+        self.classification_db_cache = classification_db_cache
+        self.llm_caller = llm_caller or default_llm_caller
+        self.rescoring_service = rescoring_service
+        self.embedding_service = embedding_service
+
+    async def get_vacancy_classification(self, description: str) -> list[dict]:
+        """
+        Classification of a description, served from the in-process LRU, then from the shared
+        database tier, and only then from the LLM. Classifying and then creating the same vacancy
+        therefore calls the LLM once.
+        """
+        cache_key = build_classification_cache_key(description)
+
+        if self.classification_cache:
+            cached = self.classification_cache.get(cache_key)
+            if cached is not None:
+                logging.info(f"[AI CLASSIFY CACHE] Memory hit for {cache_key}")
+                return [dict(p) for p in cached]
+
+        if self.classification_db_cache:
+            cached = await self.classification_db_cache.get(cache_key)
+            if cached is not None:
+                logging.info(f"[AI CLASSIFY CACHE] Database hit for {cache_key}")
+                if self.classification_cache:
+                    self.classification_cache.set(cache_key, cached)
+                return [dict(p) for p in cached]
+
+        professions = await self.classify_vacancy_with_ai(description)
+        if professions:
+            if self.classification_cache:
+                self.classification_cache.set(cache_key, [dict(p) for p in professions])
+            if self.classification_db_cache:
+                await self.classification_db_cache.set(cache_key, professions)
+        return professions
 
     async def classify_vacancy_with_ai(self, description: str) -> list[dict]:
         logging.info("[AI CLASSIFY] Analyzing vacancy description")
@@ -36,7 +101,18 @@ class VacancyService:
         ]
 
         try:
-            response = await self.llm.ainvoke(messages)
+            # The HR user is waiting on the form: served before resume analysis and bulk work
+            estimated_tokens = estimate_tokens(messages[0].content + messages[1].content, 300)
+            response = await self.llm_caller.call(
+                "classify_vacancy",
+                lambda: self.llm.ainvoke(messages, config=llm_run_config("classify_vacancy", VACANCY_CLASSIFICATION_PROMPT_VERSION)),
+                estimated_tokens,
+                LLMPriority.interactive,
+                llm=self.llm,
+                hedge=True
+            )
+        except HTTPException:
+            raise
         except Exception as e:
             logging.error(f"[AI ERROR] OpenAI request failed: {e}")
             raise ValueError("Error during AI query")
@@ -65,21 +141,28 @@ class VacancyService:
             return professions
 
         except (json.JSONDecodeError, ValueError) as e:
-            logging.error(f"[AI CLASSIFICATION ERROR] Invalid AI response: {response.content} | Exception: {e}")
+            logging.error(f"[AI CLASSIFICATION ERROR] Invalid AI response: {response_for_log(response.content)} | Exception: {e}")
             raise ValueError(f"AI returned incorrect JSON: {str(e)}")
         
     async def create_vacancy(self, db: AsyncSession, vacancy_data: VacancyCreate, hr):
         logging.info(f"[VACANCY CREATE] Creating vacancy for HR ID {hr.id}")
 
-        suggested_professions = await self.classify_vacancy_with_ai(vacancy_data.description)
-        if not suggested_professions:
-            raise HTTPException(status_code=400, detail="AI could not identify the occupation. Clarify the description.")
-
-    
-        valid_options = {(p["profession"], p["grade"]) for p in suggested_professions}
-
-
-        vacancy = Vacancy(**vacancy_data.model_dump(), hr_id=hr.id, company=hr.company)
+        try:
+            suggested_professions = await self.get_vacancy_classification(vacancy_data.description)
+        except LLM_UNAVAILABLE_ERRORS:
+            # The vacancy still goes through admin review; it is saved without suggestions instead of failing
+            logging.warning(f"[VACANCY CREATE] AI unavailable, creating vacancy for HR ID {hr.id} without classification")
+            suggested_professions = None
+        else:
+            if not suggested_professions:
+                raise HTTPException(status_code=400, detail="AI could not identify the occupation. Clarify the description.")
+
+        vacancy = Vacancy(
+            **vacancy_data.model_dump(), hr_id=hr.id, company=hr.company, classification=suggested_professions
+        )
+        if self.embedding_service:
+            # Indexed for search once an admin accepts it
+            await self.embedding_service.embed_vacancy(vacancy)
         new_vacancy = await self.vacancy_database.create_vacancy(db=db, vacancy=vacancy)
 
         logging.info(f"✅ [VACANCY CREATED] Vacancy ID {new_vacancy.id} created successfully")
@@ -114,12 +197,27 @@ class VacancyService:
 
         update_data = vacancy_data.model_dump(exclude_unset=True)
 
+        if update_data.get("description") and update_data["description"] != vacancy.description:
+            try:
+                update_data["classification"] = await self.get_vacancy_classification(update_data["description"])
+            except LLM_UNAVAILABLE_ERRORS:
+                logging.warning(f"[VACANCY UPDATE] AI unavailable, clearing classification of vacancy {vacancy_id}")
+                update_data["classification"] = None
+
         if vacancy.status == VacancyStatusEnum.rejected:
             update_data["status"] = VacancyStatusEnum.under_review
 
+        changed_fields = changed_matching_fields(vacancy, update_data, VACANCY_MATCHING_FIELDS)
+        if changed_fields and self.rescoring_service:
+            # Saved in the same commit as the edit; the applications are re-scored in the background
+            await self.rescoring_service.schedule(db, RESCORING_TARGET_VACANCY, vacancy.id, changed_fields)
+
         for field, value in update_data.items():
             setattr(vacancy, field, value)
 
+        if self.embedding_service and any(field in changed_fields for field in VACANCY_EMBEDDING_FIELDS):
+            await self.embedding_service.embed_vacancy(vacancy)
+
         updated_vacancy = await self.vacancy_database.update_vacancy(db, vacancy)
 
         logging.info(f"✅ [VACANCY UPDATED] Vacancy ID {updated_vacancy.id} updated successfully")
@@ -139,6 +237,8 @@ class VacancyService:
             )
 
         await self.vacancy_database.delete_vacancy(db, vacancy)
+        if self.embedding_service:
+            self.embedding_service.remove_vacancy(vacancy_id)
         logging.info(f"✅ [VACANCY DELETED] Vacancy ID {vacancy_id} deleted successfully")
 
     async def update_vacancy_status(self, db: AsyncSession, vacancy_id: int, status_data: VacancyStatusUpdate) -> VacancyInDBBase:
@@ -149,7 +249,13 @@ class VacancyService:
             logging.warning(f"❗ [VACANCY STATUS UPDATE] Vacancy ID {vacancy_id} not found")
             raise HTTPException(status_code=404, detail="Vacancy not found")
 
+        previous_status = vacancy.status
         updated_vacancy = await self.vacancy_database.update_vacancy_status(db, vacancy, status_data.status)
+        if VacancyStatusEnum.accepted in (previous_status, status_data.status):
+            invalidate_all_recommendations()
+        if self.embedding_service:
+            # Only accepted vacancies are searchable
+            await self.embedding_service.sync_vacancy(db, vacancy_id)
 
         logging.info(f"✅ [VACANCY STATUS UPDATED] Vacancy ID {vacancy_id} status updated to {updated_vacancy.status}")
         return updated_vacancy
@@ -164,6 +270,38 @@ class VacancyService:
         vacancies = await self.vacancy_database.get_vacancies_by_status(db, VacancyStatusEnum.accepted)
         return vacancies
     
+    async def search_accepted_vacancies(
+        self, db: AsyncSession, query: str, limit: int, cursor: Optional[str] = None
+    ) -> VacancySearchPage:
+        after = None
+        if cursor:
+            window_start, rank, vacancy_id = decode_cursor(cursor, 3)
+            if (
+                not isinstance(window_start, (int, type(None))) or not isinstance(rank, (int, float))
+                or not isinstance(vacancy_id, int)
+            ):
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            after = (window_start, float(rank), vacancy_id)
+
+        started = time.perf_counter()
+        # One extra row tells whether there is a next page
+        rows = await self.vacancy_database.search_accepted_vacancies(
+            db, query, after, limit + 1, BackendConfig.VACANCY_SEARCH_RANK_WINDOW
+        )
+        logging.info(
+            f"[VACANCY SEARCH] {min(len(rows), limit)} vacancies for '{query}' in {(time.perf_counter() - started) * 1000:.1f} ms"
+        )
+
+        items = [
+            VacancySearchResult(**vacancy.__dict__, rank=rank, snippet=render_snippet(headline))
+            for vacancy, headline, rank, _ in rows[:limit]
+        ]
+        next_cursor = None
+        if len(rows) > limit:
+            _, _, rank, window_start = rows[limit - 1]
+            next_cursor = encode_cursor([window_start, rank, items[-1].id])
+        return VacancySearchPage(items=items, next_cursor=next_cursor)
+
     async def get_accepted_vacancy_by_id(self, db: AsyncSession, vacancy_id: int) -> VacancyPublic:
         logging.info(f"[VACANCY FETCH] Fetching accepted vacancy with ID {vacancy_id}")
 
@@ -175,6 +313,10 @@ class VacancyService:
 
         return vacancy
 
+    async def get_accepted_vacancies_by_ids(self, db: AsyncSession, vacancy_ids: List[int]) -> List[Vacancy]:
+        logging.info(f"[VACANCY FETCH] Fetching accepted vacancies {vacancy_ids}")
+        return await self.vacancy_database.get_accepted_vacancies_by_ids(db, vacancy_ids)
+
     async def fetch_candidates_by_vacancy(self, db: AsyncSession, vacancy_id: int) -> List[CandidateResponseSchema]:
         logging.info(f"[CANDIDATES] Fetching candidates for vacancy {vacancy_id}")
         candidates = await self.vacancy_database.get_candidates_by_vacancy(db, vacancy_id)
@@ -12,6 +12,18 @@ from src.modules.admin.services.user_admin_service import UserAdminService
 from src.modules.admin.schemas import HRInDBAdmin, UserInDBAdmin
 from src.modules.vacancy.service import VacancyService
 from src.modules.vacancy.schemas import VacancyInDBBase, VacancyStatusUpdate
+from src.modules.resume.cache import resume_analysis_cache
+from src.modules.resume.pdf_extractor import pdf_extraction_pool
+from src.modules.resume.preprocessing import preprocessing_metrics
+from src.core.llm_limiter import llm_limiter
+from src.core.llm_metrics import llm_metrics
+from src.core.llm_resilience import llm_caller
+from src.modules.application.scoring import local_scorer
+from src.modules.embedding.dependencies import resume_index, vacancy_index
+from src.modules.recommendation.cache import recommendation_cache
+from src.modules.recommendation.catalog import vacancy_catalog
+from src.modules.exchange_rate.service import exchange_rate_service
+from src.modules.vacancy.cache import vacancy_classification_cache, vacancy_classification_db_cache
 
 router = APIRouter(prefix="/admin", tags=["Admin"], dependencies=[Depends(admin_required)])
 
@@ -110,4 +122,23 @@ async def get_vacancies_under_review(
     vacancy_service: VacancyService = Depends(get_vacancy_service)
 ):
     logging.info("[VACANCY FETCH] Fetching vacancies under review")
-    return await vacancy_service.get_vacancies_under_review(db)
\ No newline at end of file
+    return await vacancy_service.get_vacancies_under_review(db)
+
+# METRICS
+@router.get("/metrics")
+async def get_metrics():
+    logging.info("[METRICS] Fetching runtime metrics")
+    return {
+        "llm_limiter": llm_limiter.stats(),
+        "llm_usage": llm_metrics.stats(),
+        "llm_resilience": llm_caller.stats(),
+        "local_matching": local_scorer.stats(),
+        "resume_analysis_cache": resume_analysis_cache.stats(),
+        "pdf_extraction": pdf_extraction_pool.stats(),
+        "resume_preprocessing": preprocessing_metrics.stats(),
+        "exchange_rates": exchange_rate_service.stats(),
+        "vacancy_classification_cache": vacancy_classification_cache.stats(),
+        "vacancy_classification_db_cache": vacancy_classification_db_cache.stats() if vacancy_classification_db_cache else None,
+        "embedding_index": {"resumes": resume_index.stats(), "vacancies": vacancy_index.stats()},
+        "recommendations": {"cache": recommendation_cache.stats(), "catalog": vacancy_catalog.stats()},
+    }
@@ -1,6 +1,6 @@
 import logging
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List, Literal, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.core.database import get_db
 from src.modules.auth.service import AuthService
@@ -15,6 +15,15 @@ from src.modules.vacancy.schemas import VacancyCreate, VacancyUpdate, VacancyInD
 from src.modules.application.service import ApplicationService
 from src.modules.application.dependencies import get_application_service
 from src.modules.application.schemas import CandidateResponseSchema
+from src.modules.candidate.dependencies import get_candidate_service
+from src.modules.candidate.schemas import CandidateSearchPage, CandidateSearchQuery
+from src.modules.candidate.service import CandidateService
+from src.modules.embedding.dependencies import get_embedding_service
+from src.modules.embedding.schemas import SimilarCandidate
+from src.modules.embedding.service import EmbeddingService
+from src.modules.rescoring.dependencies import get_rescoring_service
+from src.modules.rescoring.schemas import VacancyRescoringStatus
+from src.modules.rescoring.service import RescoringService
 
 
 router = APIRouter(prefix="/hr", tags=["HR"], dependencies=[Depends(hr_required)])
@@ -52,6 +61,32 @@ async def delete_hr(
     await hr_service.delete_hr(db, hr.id)
     return {"message": "HR account deleted successfully"}
 
+@router.get("/candidates/search", response_model=CandidateSearchPage)
+async def search_candidates(
+    profession: Optional[str] = None,
+    grade: Optional[str] = None,
+    skills: List[str] = Query([]),
+    skills_match: Literal["any", "all"] = "any",
+    min_experience: Optional[float] = Query(None, ge=0),
+    max_experience: Optional[float] = Query(None, ge=0),
+    min_salary: Optional[float] = Query(None, ge=0),
+    max_salary: Optional[float] = Query(None, ge=0),
+    languages: List[str] = Query([]),
+    sort: Literal["relevance", "newest"] = "relevance",
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    hr: HR = Depends(hr_required),
+    db: AsyncSession = Depends(get_db),
+    candidate_service: CandidateService = Depends(get_candidate_service)
+):
+    logging.info(f"[CANDIDATE SEARCH] HR {hr.id} searches resumes: profession={profession}, grade={grade}, skills={skills}")
+    query = CandidateSearchQuery(
+        profession=profession, grade=grade, skills=skills, skills_match=skills_match,
+        min_experience=min_experience, max_experience=max_experience, min_salary=min_salary, max_salary=max_salary,
+        languages=languages, sort=sort, limit=limit, cursor=cursor
+    )
+    return await candidate_service.search(db, query)
+
 
 @router.get("/{vacancy_id}", response_model=VacancyInDBBase)
 async def get_vacancy(
@@ -72,7 +107,7 @@ async def classify_vacancy(
 ):
     logging.info("[VACANCY CLASSICATION]Request received for vacancy classification.")
     try:
-        suggested_professions = await vacancy_service.classify_vacancy_with_ai(description)
+        suggested_professions = await vacancy_service.get_vacancy_classification(description)
         logging.info(f"[VACANCY CLASSIFICATION] Successfully classified the vacancy")
         return {"professions": suggested_professions}
     except ValueError as e:
@@ -117,6 +152,41 @@ async def update_vacancy(
     return await vacancy_service.update_vacancy(db, vacancy_id, vacancy)
 
 
+@router.get("/{vacancy_id}/rescoring", response_model=VacancyRescoringStatus)
+async def get_vacancy_rescoring(
+    vacancy_id: int,
+    hr: HR = Depends(hr_required),
+    db: AsyncSession = Depends(get_db),
+    vacancy_service: VacancyService = Depends(get_vacancy_service),
+    rescoring_service: RescoringService = Depends(get_rescoring_service)
+):
+    logging.info(f"[RESCORING] HR {hr.id} checks re-scoring progress of vacancy {vacancy_id}")
+    existing_vacancy = await vacancy_service.get_vacancy_by_id(db, vacancy_id)
+
+    if existing_vacancy.hr_id != hr.id:
+        raise HTTPException(status_code=403, detail="You cannot view someone else's vacancy")
+
+    return await rescoring_service.get_vacancy_progress(db, vacancy_id)
+
+
+@router.get("/{vacancy_id}/similar-candidates", response_model=List[SimilarCandidate])
+async def get_similar_candidates(
+    vacancy_id: int,
+    limit: int = Query(50, ge=1, le=200),
+    hr: HR = Depends(hr_required),
+    db: AsyncSession = Depends(get_db),
+    vacancy_service: VacancyService = Depends(get_vacancy_service),
+    embedding_service: EmbeddingService = Depends(get_embedding_service)
+):
+    logging.info(f"[SIMILAR CANDIDATES] HR {hr.id} searches candidates for vacancy {vacancy_id}")
+    existing_vacancy = await vacancy_service.get_vacancy_by_id(db, vacancy_id)
+
+    if existing_vacancy.hr_id != hr.id:
+        raise HTTPException(status_code=403, detail="You cannot view someone else's vacancy")
+
+    return await embedding_service.find_candidates(db, existing_vacancy, limit)
+
+
 @router.delete("/{vacancy_id}")
 async def delete_vacancy(
     vacancy_id: int,
@@ -154,6 +224,23 @@ async def accept_candidate(
     return await application_service.accept_candidate(db, application_id)
 
 
+@router.post("/applications/{application_id}/analysis")
+async def request_application_analysis(
+    application_id: int,
+    hr: HR = Depends(hr_required),
+    db: AsyncSession = Depends(get_db),
+    application_service: ApplicationService = Depends(get_application_service)
+):
+    logging.info(f"[MATCHING ON DEMAND] HR {hr.id} requests LLM analysis of application {application_id}")
+    application = await application_service.request_llm_analysis(db, application_id, hr)
+    return {
+        "application_id": application.id,
+        "matching_score": application.matching_score,
+        "matching_source": application.matching_source,
+        "summary": application.summary
+    }
+
+
 @router.post("/applications/{application_id}/reject")
 async def reject_candidate(
     application_id: int,
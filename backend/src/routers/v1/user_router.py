@@ -1,22 +1,31 @@
-from typing import List
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from typing import List, Optional
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.core.database import get_db
 from src.modules.application.dependencies import get_application_service
 from src.modules.resume.dependencies import get_resume_service
 from src.modules.vacancy.dependencies import get_vacancy_service
 from src.core.dependencies import get_current_user, user_required
-from src.modules.vacancy.schemas import VacancyPublic
+from src.modules.vacancy.schemas import VacancyPublic, VacancySearchPage
 from src.modules.vacancy.service import VacancyService
-from typing import List
-from fastapi import APIRouter, UploadFile, File, Depends, HTTPException
-from sqlalchemy.orm import Session
 from src.modules.resume.service import ResumeService
+from src.modules.resume.upload import limit_upload_size, limit_bulk_upload_size
+from fastapi.responses import StreamingResponse
 from src.modules.application.service import ApplicationService
-from src.models import User
+from src.modules.application.schemas import BatchApplicationCreate, BatchApplicationResult
+from src.models import JobFormatEnum, User
+from src.modules.recommendation.dependencies import get_recommendation_service
+from src.modules.recommendation.schemas import RecommendedVacancy
+from src.modules.recommendation.service import RecommendationService
 from src.modules.user.schemas import UserProfile
 from src.modules.user.service import UserService
 from src.modules.user.dependencies import get_user_service
+from src.modules.ingestion.dependencies import get_ingestion_service
+from src.modules.ingestion.service import IngestionService
+from src.modules.ingestion.schemas import IngestionJobAccepted, IngestionJobResponse
+from src.modules.storage.responses import build_download_response
+from src.core.llm_resilience import LLM_UNAVAILABLE_ERRORS
+from fastapi.responses import JSONResponse
 import logging
 
 router = APIRouter(prefix="/user", tags=["User"])
@@ -49,12 +58,36 @@ async def get_accepted_vacancy_by_id(
     logging.info(f"[VACANCY FETCH] Fetching accepted vacancy ID {vacancy_id}")
     return await vacancy_service.get_accepted_vacancy_by_id(db, vacancy_id)
 
-@router.post("/")
+@router.get("/vacancies/search", response_model=VacancySearchPage)
+async def search_vacancies(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+    vacancy_service: VacancyService = Depends(get_vacancy_service),
+    user: User = Depends(user_required)
+):
+    logging.info(f"[VACANCY SEARCH] User {user.id} searches vacancies for '{q}'")
+    return await vacancy_service.search_accepted_vacancies(db, q, limit, cursor)
+
+@router.get("/recommendations", response_model=List[RecommendedVacancy])
+async def get_recommendations(
+    limit: int = Query(20, ge=1, le=100),
+    job_format: Optional[JobFormatEnum] = None,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(user_required),
+    recommendation_service: RecommendationService = Depends(get_recommendation_service)
+):
+    logging.info(f"[RECOMMENDATIONS] Fetching recommendations for user {user.id}")
+    return await recommendation_service.get_recommendations(db, user.id, limit, job_format)
+
+@router.post("/", dependencies=[Depends(limit_upload_size)])
 async def upload_resume(
     file: UploadFile = File(...), 
     db: AsyncSession = Depends(get_db), 
     user: User = Depends(user_required),
-    resume_service: ResumeService = Depends(get_resume_service)
+    resume_service: ResumeService = Depends(get_resume_service),
+    ingestion_service: IngestionService = Depends(get_ingestion_service)
 ):
     logging.info(f"[RESUME UPLOAD] User uploading file: {file.filename}")
     
@@ -62,9 +95,60 @@ async def upload_resume(
         logging.warning(f"[RESUME UPLOAD ERROR] User uploaded invalid file type: {file.content_type}")
         raise HTTPException(status_code=400, detail="Только PDF-файлы поддерживаются")
     
-    resume = await resume_service.create_resume(file, user.id, db)  
-    logging.info(f"[RESUME UPLOAD SUCCESS] Resume ID {resume.id} uploaded by user")
-    return {"message": "Резюме загружено", "resume_id": resume.id}
+    if resume_service.llm_caller.is_available(resume_service.llm):
+        try:
+            resume = await resume_service.create_resume(file, user.id, db)
+            logging.info(f"[RESUME UPLOAD SUCCESS] Resume ID {resume.id} uploaded by user")
+            return {"message": "Резюме загружено", "resume_id": resume.id}
+        except LLM_UNAVAILABLE_ERRORS:
+            await file.seek(0)
+
+    # AI service is down: the upload is queued and analyzed once it recovers
+    logging.warning(f"[RESUME UPLOAD] AI unavailable, queueing {file.filename} for user {user.id}")
+    job = await ingestion_service.enqueue_resume(db, file, user.id)
+    return JSONResponse(
+        status_code=202,
+        content={"message": "Резюме принято в обработку", "job_id": job.id, "status": job.status.value}
+    )
+
+@router.post("/bulk", dependencies=[Depends(limit_bulk_upload_size)])
+async def bulk_upload_resumes(
+    files: List[UploadFile] = File(...),
+    user: User = Depends(user_required),
+    resume_service: ResumeService = Depends(get_resume_service)
+):
+    logging.info(f"[RESUME BULK] User {user.id} uploading {len(files)} files")
+    uploads, rejected = await resume_service.prepare_bulk_uploads(files)
+    return StreamingResponse(
+        resume_service.bulk_import(uploads, rejected, user.id),
+        media_type="application/x-ndjson"
+    )
+
+@router.post("/ingest", status_code=202, response_model=IngestionJobAccepted, dependencies=[Depends(limit_upload_size)])
+async def ingest_resume(
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(user_required),
+    ingestion_service: IngestionService = Depends(get_ingestion_service)
+):
+    logging.info(f"[RESUME INGESTION] User queueing file: {file.filename}")
+
+    if file.content_type != "application/pdf":
+        logging.warning(f"[RESUME INGESTION ERROR] User uploaded invalid file type: {file.content_type}")
+        raise HTTPException(status_code=400, detail="Только PDF-файлы поддерживаются")
+
+    job = await ingestion_service.enqueue_resume(db, file, user.id)
+    return {"message": "Резюме принято в обработку", "job_id": job.id, "status": job.status}
+
+@router.get("/jobs/{job_id}", response_model=IngestionJobResponse)
+async def get_ingestion_job(
+    job_id: int,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(user_required),
+    ingestion_service: IngestionService = Depends(get_ingestion_service)
+):
+    logging.info(f"[RESUME INGESTION] Fetching job {job_id} for USER ID {user.id}")
+    return await ingestion_service.get_job_status(db, job_id, user.id)
 
 @router.get("/")
 async def get_resumes(
@@ -85,11 +169,23 @@ async def get_resume(
     logging.info(f"[RESUME FETCH] Fetching resume ID {resume_id}")
     return await resume_service.get_resume_by_id(db, resume_id)
 
+@router.get("/{resume_id}/file")
+async def download_resume_file(
+    resume_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    resume_service: ResumeService = Depends(get_resume_service),
+    auth = Depends(get_current_user)
+):
+    logging.info(f"[RESUME DOWNLOAD] Serving file of resume ID {resume_id}")
+    resume, stored = await resume_service.get_resume_file(db, resume_id, auth)
+    return build_download_response(request, resume_service.storage, stored, f"resume_{resume.id}.pdf")
+
 @router.post("/applications/")
 async def create_application(
     vacancy_id: int, 
     resume_id: int, 
-    db: Session = Depends(get_db), 
+    db: AsyncSession = Depends(get_db), 
     user: User = Depends(user_required),
     application_service: ApplicationService = Depends(get_application_service)
 ):
@@ -103,6 +199,44 @@ async def create_application(
         logging.warning(f"[APPLICATION ERROR] User failed to apply: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
     
+@router.post("/applications/stream")
+async def create_application_stream(
+    vacancy_id: int,
+    resume_id: int,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(user_required),
+    application_service: ApplicationService = Depends(get_application_service)
+):
+    logging.info(f"[APPLICATION STREAM] User applying to vacancy {vacancy_id} with resume {resume_id}")
+
+    try:
+        request = await application_service.prepare_application_stream(db, user.id, vacancy_id, resume_id)
+    except ValueError as e:
+        logging.warning(f"[APPLICATION STREAM ERROR] User failed to apply: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return StreamingResponse(
+        application_service.stream_application(request),
+        media_type="text/event-stream",
+        # Proxies must not buffer the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.post("/applications/batch", response_model=List[BatchApplicationResult])
+async def create_applications(
+    data: BatchApplicationCreate,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(user_required),
+    application_service: ApplicationService = Depends(get_application_service)
+):
+    logging.info(f"[APPLICATION BATCH] User applying to vacancies {data.vacancy_ids} with resume {data.resume_id}")
+
+    try:
+        return await application_service.create_applications(db, user.id, data.resume_id, data.vacancy_ids)
+    except ValueError as e:
+        logging.warning(f"[APPLICATION BATCH ERROR] User failed to apply: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.get("/applications/")
 async def get_applications(
     user: User = Depends(user_required), 
@@ -0,0 +1,7 @@
+from src.main import app
+
+
+def test_app_imports_with_every_router():
+    paths = app.openapi()["paths"]
+    for path in ["/api/v1/auth/login", "/api/v1/admin/users", "/api/v1/hr/me", "/api/v1/user/profile"]:
+        assert path in paths
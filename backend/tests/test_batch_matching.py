@@ -0,0 +1,110 @@
+import asyncio
+import json
+from types import SimpleNamespace
+import pytest
+from fastapi import HTTPException
+from src.core.llm_resilience import LLMUnavailableError
+from src.modules.application.service import ApplicationService
+
+
+def parse(response, expected_ids):
+    return ApplicationService(llm=None).parse_batch_response(response, expected_ids)
+
+
+def test_results_are_keyed_by_id():
+    response = json.dumps({"results": [
+        {"id": 1, "score": 75, "analysis": "Нет опыта с Kubernetes"},
+        {"id": "2", "score": "40", "analysis": ""},
+    ]}, ensure_ascii=False)
+    assert parse(response, [1, 2]) == {
+        1: {"score": 75, "summary": "- Соответствие: 75\n- Пояснение: Нет опыта с Kubernetes"},
+        2: {"score": 40, "summary": "- Соответствие: 40\n- Пояснение: "},
+    }
+
+
+def test_markdown_fence_and_bare_list():
+    response = '```json\n[{"id": 3, "score": 90, "analysis": "ok"}]\n```'
+    assert parse(response, [3]) == {3: {"score": 90, "summary": "- Соответствие: 90\n- Пояснение: ok"}}
+
+
+def test_invalid_entries_are_dropped():
+    response = json.dumps({"results": [
+        {"id": 1, "score": 101},
+        {"id": 2, "score": -1},
+        {"id": 9, "score": 50},
+        {"id": 3},
+        {"id": "x", "score": 50},
+        "not an entry",
+        {"id": 4, "score": 0},
+    ]})
+    assert list(parse(response, [1, 2, 3, 4])) == [4]
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_failed_pair_does_not_discard_other_scores():
+    items = [SimpleNamespace(id=item_id) for item_id in (1, 2, 3)]
+
+    async def score_batch(batch):
+        return {1: {"score": 80, "summary": "batch"}}
+
+    async def score_pair(item):
+        if item.id == 2:
+            raise HTTPException(status_code=500, detail="Error processing matching with Langchain")
+        return {"score": 60, "summary": "pair"}
+
+    matchings = run(ApplicationService(llm=None)._match_in_batches(items, 3, score_batch, score_pair))
+    assert matchings == {
+        1: {"score": 80, "summary": "batch"},
+        2: {"error": "Error processing matching with Langchain"},
+        3: {"score": 60, "summary": "pair"},
+    }
+
+
+def test_unavailable_ai_is_raised_from_pair_fallback():
+    async def score_pair(item):
+        raise LLMUnavailableError(5)
+
+    with pytest.raises(LLMUnavailableError):
+        run(ApplicationService(llm=None)._match_in_batches([SimpleNamespace(id=1)], 3, None, score_pair))
+
+
+def test_vacancy_that_could_not_be_scored_is_skipped():
+    resume = SimpleNamespace(id=7, user_id=1, resume_link="resumes/7.pdf")
+    vacancies = {vacancy_id: SimpleNamespace(id=vacancy_id) for vacancy_id in (10, 11)}
+
+    async def get_resume_by_id(db, resume_id):
+        return resume
+
+    async def get_applied_vacancies(db, user_id):
+        return []
+
+    async def get_accepted_vacancies_by_ids(db, vacancy_ids):
+        return [vacancies[vacancy_id] for vacancy_id in vacancy_ids]
+
+    async def create_applications(db, applications):
+        for application_id, application in enumerate(applications, start=100):
+            application.id = application_id
+        return applications
+
+    async def match_resume_to_vacancies(resume, to_llm):
+        return {10: {"score": 70, "summary": "ok"}, 11: {"error": "Error processing matching with Langchain"}}
+
+    service = ApplicationService(
+        application_database=SimpleNamespace(create_applications=create_applications),
+        vacancy_service=SimpleNamespace(
+            get_applied_vacancies=get_applied_vacancies, get_accepted_vacancies_by_ids=get_accepted_vacancies_by_ids
+        ),
+        resume_service=SimpleNamespace(get_resume_by_id=get_resume_by_id),
+        llm=None,
+        matching_mode="llm"
+    )
+    service.match_resume_to_vacancies = match_resume_to_vacancies
+
+    results = run(service.create_applications(None, 1, 7, [10, 11]))
+    assert [(result.vacancy_id, result.status, result.matching_score) for result in results] == [
+        (10, "created", 70), (11, "skipped", None)
+    ]
+    assert results[1].detail
@@ -0,0 +1,52 @@
+import pytest
+from src.core.llm_resilience import CircuitBreaker, LLMUnavailableError
+
+
+def test_opens_after_consecutive_failures():
+    breaker = CircuitBreaker("test", failure_threshold=3, reset_seconds=60)
+    for _ in range(2):
+        breaker.record_failure(breaker.acquire())
+    breaker.record_success(breaker.acquire())
+    assert breaker.state == "closed" and breaker.consecutive_failures == 0
+
+    for _ in range(3):
+        breaker.record_failure(breaker.acquire())
+    assert breaker.state == "open" and breaker.times_opened == 1
+    with pytest.raises(LLMUnavailableError) as error:
+        breaker.acquire()
+    assert error.value.status_code == 503
+    assert 1 <= int(error.value.headers["Retry-After"]) <= 60
+    assert breaker.rejected == 1
+    assert breaker.stats()["state"] == "open"
+
+
+def test_half_open_probe_success_closes():
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_seconds=0)
+    breaker.record_failure(breaker.acquire())
+    assert breaker.state == "open"
+
+    probe = breaker.acquire()
+    assert probe is True and breaker.state == "half_open"
+    # Only one probe at a time
+    with pytest.raises(LLMUnavailableError):
+        breaker.acquire()
+
+    breaker.record_success(probe)
+    assert breaker.state == "closed"
+    assert breaker.acquire() is False
+
+
+def test_half_open_probe_failure_reopens():
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_seconds=0)
+    breaker.record_failure(breaker.acquire())
+    breaker.record_failure(breaker.acquire())
+    probe = breaker.acquire()
+    breaker.record_failure(probe)
+    assert breaker.state == "open" and breaker.times_opened == 2
+
+
+def test_released_probe_lets_another_probe_through():
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_seconds=0)
+    breaker.record_failure(breaker.acquire())
+    breaker.release(breaker.acquire())
+    assert breaker.acquire() is True
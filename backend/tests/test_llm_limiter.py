@@ -0,0 +1,101 @@
+import asyncio
+import pytest
+from src.core.llm_limiter import LLMLimiter, LLMOverloadedError, LLMPriority
+
+
+def make_limiter(**limits) -> LLMLimiter:
+    options = dict(max_concurrency=1, requests_per_minute=0, tokens_per_minute=0, max_queue_size=0, max_wait_seconds=0)
+    return LLMLimiter(**{**options, **limits})
+
+
+async def hold_slot(limiter: LLMLimiter, release: asyncio.Event):
+    async with limiter.limit("holder"):
+        await release.wait()
+
+
+def test_queued_calls_start_by_priority_then_arrival():
+    async def scenario():
+        limiter = make_limiter()
+        release = asyncio.Event()
+        started = []
+
+        async def call(name, priority):
+            async with limiter.limit(name, priority=priority):
+                started.append(name)
+
+        holder = asyncio.create_task(hold_slot(limiter, release))
+        await asyncio.sleep(0)
+        calls = [
+            asyncio.create_task(call(name, priority)) for name, priority in [
+                ("bulk", LLMPriority.bulk), ("standard 1", LLMPriority.standard),
+                ("interactive", LLMPriority.interactive), ("standard 2", LLMPriority.standard),
+            ]
+        ]
+        await asyncio.sleep(0)
+        assert limiter.stats()["queue_depth"] == 4
+        release.set()
+        await asyncio.gather(holder, *calls)
+        return started, limiter.stats()
+
+    started, stats = asyncio.run(scenario())
+    assert started == ["interactive", "standard 1", "standard 2", "bulk"]
+    assert stats["in_flight"] == 0 and stats["queue_depth"] == 0
+
+
+def test_full_queue_rejects_with_retry_after():
+    async def scenario():
+        limiter = make_limiter(max_queue_size=1)
+        release = asyncio.Event()
+        holder = asyncio.create_task(hold_slot(limiter, release))
+        await asyncio.sleep(0)
+        queued = asyncio.create_task(hold_slot(limiter, release))
+        await asyncio.sleep(0)
+        try:
+            with pytest.raises(LLMOverloadedError) as error:
+                async with limiter.limit("rejected"):
+                    pass
+        finally:
+            release.set()
+            await asyncio.gather(holder, queued)
+        return error.value, limiter.stats()
+
+    error, stats = asyncio.run(scenario())
+    assert error.status_code == 503 and int(error.headers["Retry-After"]) >= 1
+    assert stats["call_sites"]["rejected"]["rejected"] == 1
+    assert stats["call_sites"]["holder"]["started"] == 2
+
+
+def test_wait_longer_than_max_wait_is_rejected():
+    async def scenario():
+        limiter = make_limiter(max_wait_seconds=0.05)
+        release = asyncio.Event()
+        holder = asyncio.create_task(hold_slot(limiter, release))
+        await asyncio.sleep(0)
+        try:
+            with pytest.raises(LLMOverloadedError):
+                async with limiter.limit("waiting"):
+                    pass
+        finally:
+            release.set()
+            await holder
+        return limiter.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["call_sites"]["waiting"]["timed_out"] == 1
+    assert stats["in_flight"] == 0 and stats["queue_depth"] == 0
+
+
+def test_spent_request_budget_makes_calls_wait():
+    async def scenario():
+        limiter = make_limiter(max_concurrency=0, requests_per_minute=1, max_wait_seconds=0.05)
+        async with limiter.limit("first"):
+            pass
+        # The bucket refills one request per minute, so the second call cannot start within max_wait_seconds
+        with pytest.raises(LLMOverloadedError):
+            async with limiter.limit("second"):
+                pass
+        return limiter.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["call_sites"]["first"]["started"] == 1
+    assert stats["call_sites"]["second"]["timed_out"] == 1
@@ -0,0 +1,28 @@
+import base64
+import pytest
+from fastapi import HTTPException
+from src.core.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    values = [0.75, "2026-01-31T10:00:00", 42, None]
+    cursor = encode_cursor(values)
+    assert "=" not in cursor
+    assert decode_cursor(cursor, 4) == values
+
+
+def test_cursor_with_unicode_values():
+    assert decode_cursor(encode_cursor(["Разработчик", 7]), 2) == ["Разработчик", 7]
+
+
+@pytest.mark.parametrize("cursor, size", [
+    (encode_cursor([1, 2]), 3),
+    ("not a cursor!", 2),
+    (base64.urlsafe_b64encode(b'{"id": 1}').decode(), 1),
+    (base64.urlsafe_b64encode(b"\xff\xfe").decode(), 1),
+    ("", 1),
+])
+def test_invalid_cursor_is_a_bad_request(cursor, size):
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(cursor, size)
+    assert error.value.status_code == 400
@@ -0,0 +1,37 @@
+import pytest
+from src.modules.resume.preprocessing import is_page_number, remove_repeated_lines
+
+
+@pytest.mark.parametrize("line", ["Page 2", "стр. 2", "Страница 1 из 3", "2 of 3", "3/3", "2 из 3"])
+def test_page_markers(line):
+    assert is_page_number(line, 3)
+
+
+@pytest.mark.parametrize("line", ["2019", "500000", "2019 / 2021", "Page 7", "1 из 5", "12 лет"])
+def test_numbers_that_are_not_page_markers(line):
+    assert not is_page_number(line, 3)
+
+
+def test_running_header_and_page_numbers_are_removed():
+    pages = [
+        "Иванов Иван\nPython разработчик\nОпыт работы\n2019\nОбязанности:\nРазработка API\n500000\nСтраница 1 из 2",
+        "Иванов Иван\nPython разработчик\nОбязанности:\nПоддержка сервисов\n2021\nСтраница 2 из 2",
+    ]
+    cleaned, removed = remove_repeated_lines(pages)
+    assert cleaned == [
+        "Иванов Иван\nPython разработчик\nОпыт работы\n2019\nОбязанности:\nРазработка API\n500000",
+        "Обязанности:\nПоддержка сервисов\n2021",
+    ]
+    assert removed == 4
+
+
+def test_line_repeated_at_different_edges_is_kept():
+    # A heading at the bottom of one page and the top of the next is not a running header
+    pages = ["Опыт работы\nТОО Ромашка\nОбязанности:", "Обязанности:\nРазработка API\nОбразование"]
+    cleaned, removed = remove_repeated_lines(pages)
+    assert cleaned == pages and removed == 0
+
+
+def test_single_page_keeps_everything_but_page_numbers():
+    cleaned, removed = remove_repeated_lines(["Иванов Иван\n2019\n1 / 1"])
+    assert cleaned == ["Иванов Иван\n2019"] and removed == 1
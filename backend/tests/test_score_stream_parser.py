@@ -0,0 +1,24 @@
+from src.modules.application.streaming import ScoreStreamParser
+
+
+def test_score_is_returned_once_it_is_complete():
+    parser = ScoreStreamParser()
+    assert parser.feed("- Соответ") is None
+    assert parser.feed("ствие: 7") is None
+    assert parser.feed("5\n- Пояснение: ") == 75
+    assert parser.score == 75
+
+
+def test_score_is_returned_only_once():
+    parser = ScoreStreamParser()
+    assert parser.feed("- Соответствие: 100\n") == 100
+    assert parser.feed("- Соответствие: 20\n") is None
+    assert parser.score == 100
+
+
+def test_answer_without_score_line():
+    parser = ScoreStreamParser(max_prefix=20)
+    assert parser.feed("Кандидат хорошо подходит для этой вакансии. ") is None
+    # Past max_prefix the parser stops looking, even if the line comes later
+    assert parser.feed("- Соответствие: 80\n") is None
+    assert parser.score is None
@@ -0,0 +1,49 @@
+from src.modules.skill.matcher import SkillMatcher, clean_skill
+
+matcher = SkillMatcher(
+    {
+        "postgresql": ["postgres"],
+        "docker": ["docker compose"],
+        "sql": [],
+        "ms sql server": ["sql server"],
+        "go": ["golang"],
+        "excel": [],
+        "word": ["ms word"],
+    },
+    whole_entry_only={"go", "word"}
+)
+
+
+def test_clean_skill():
+    assert clean_skill("  Node_JS -- Developer. ") == "node js developer"
+
+
+def test_aliases_and_spacing_map_to_the_canonical_name():
+    assert matcher.normalize("Postgres") == "postgresql"
+    assert matcher.normalize("Postgre SQL") == "postgresql"
+    assert matcher.normalize("Docker-Compose") == "docker"
+    assert matcher.normalize("Rare Skill") == "rare skill"
+
+
+def test_known_skills_are_found_inside_an_entry():
+    assert matcher.extract("опыт работы с Postgres и Docker") == {"postgresql", "docker"}
+    assert matcher.scan("Docker, Postgres") == ["docker", "postgresql"]
+
+
+def test_longest_alias_wins():
+    assert matcher.scan("администрирование SQL Server") == ["ms sql server"]
+
+
+def test_slash_separated_parts():
+    assert matcher.extract("Excel/MS Word") == {"excel", "word"}
+
+
+def test_whole_entry_only_aliases():
+    assert matcher.extract("Go") == {"go"}
+    assert matcher.extract("Word") == {"word"}
+    assert matcher.extract("ready to go") == {"ready to go"}
+    assert matcher.extract("Golang backend") == {"go"}
+
+
+def test_empty_entry():
+    assert matcher.extract(" - ") == frozenset()
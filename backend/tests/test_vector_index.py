@@ -0,0 +1,68 @@
+import asyncio
+import numpy as np
+from src.modules.embedding.encoders import normalize_rows
+from src.modules.embedding.index import VectorIndex
+
+
+def unit(*values) -> np.ndarray:
+    return normalize_rows(np.array([values], dtype=np.float32))[0]
+
+
+def flat_index() -> VectorIndex:
+    index = VectorIndex("test", dimensions=3, ivf_min_size=1000)
+    index.add(1, unit(1, 0, 0))
+    index.add(2, unit(0, 1, 0))
+    index.add(3, unit(1, 1, 0))
+    return index
+
+
+def test_search_returns_the_most_similar_first():
+    index = flat_index()
+    hits = index.search(unit(1, 0.1, 0), 2)
+    assert [item_id for item_id, _ in hits] == [1, 3]
+    assert hits[0][1] > hits[1][1]
+    assert abs(index.search(unit(0, 1, 0), 1)[0][1] - 1.0) < 0.01
+
+
+def test_search_with_exclusions_and_large_k():
+    index = flat_index()
+    assert [item_id for item_id, _ in index.search(unit(1, 0, 0), 10, exclude=[1])] == [3, 2]
+
+
+def test_remove():
+    index = flat_index()
+    assert index.remove(1) is True
+    assert index.remove(1) is False
+    assert len(index) == 2 and 1 not in index
+    assert [item_id for item_id, _ in index.search(unit(1, 0, 0), 3)] == [3, 2]
+    # The last row moved into the removed one and is still found by id
+    assert np.allclose(index.get(3), unit(1, 1, 0), atol=0.01)
+
+
+def test_adding_an_id_again_replaces_its_vector():
+    index = flat_index()
+    index.add(2, unit(0, 0, 1))
+    assert len(index) == 3
+    assert index.search(unit(0, 0, 1), 1)[0][0] == 2
+
+
+def test_empty_index():
+    index = VectorIndex("test", dimensions=3)
+    assert index.search(unit(1, 0, 0), 5) == []
+    assert index.get(1) is None
+
+
+def test_ivf_index_after_rebuild():
+    rng = np.random.default_rng(0)
+    vectors = normalize_rows(rng.normal(size=(200, 8)).astype(np.float32))
+    ids = np.arange(1, 201)
+    index = VectorIndex("test", dimensions=8, ivf_min_size=100, ivf_lists=4, ivf_probes=4)
+    asyncio.run(index.rebuild(ids, vectors))
+    assert len(index) == 200 and not index.needs_rebuild()
+
+    # All lists probed: the same answer as an exhaustive search
+    assert index.search(vectors[41], 1)[0][0] == 42
+    index.remove(42)
+    assert 42 not in [item_id for item_id, _ in index.search(vectors[41], 5)]
+    index.add(500, vectors[41])
+    assert index.search(vectors[41], 1)[0][0] == 500
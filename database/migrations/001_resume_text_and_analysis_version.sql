@@ -0,0 +1,13 @@
+-- Stored normalized resume text (zlib-compressed) and the prompt version of the analysis.
+-- Existing rows keep NULL and are picked up by `python -m src.commands.reanalyze_resumes`.
+ALTER TABLE resumes ADD COLUMN IF NOT EXISTS resume_text BYTEA;
+ALTER TABLE resumes ADD COLUMN IF NOT EXISTS analysis_version VARCHAR(50);
+CREATE INDEX IF NOT EXISTS ix_resumes_analysis_version ON resumes (analysis_version);
+
+-- resume_ingestion_jobs is created on startup, already with this column; only an existing table is altered
+DO $$
+BEGIN
+    IF to_regclass('resume_ingestion_jobs') IS NOT NULL THEN
+        ALTER TABLE resume_ingestion_jobs ADD COLUMN IF NOT EXISTS resume_text TEXT;
+    END IF;
+END $$;
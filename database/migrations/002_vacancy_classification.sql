@@ -0,0 +1,2 @@
+-- Classification used when the vacancy was created; llm_response_cache itself is created on startup.
+ALTER TABLE vacancy ADD COLUMN IF NOT EXISTS classification JSON;
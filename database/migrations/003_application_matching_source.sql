@@ -0,0 +1,2 @@
+-- Whether the matching score came from the LLM or from the local scorer.
+ALTER TABLE applications ADD COLUMN IF NOT EXISTS matching_source VARCHAR(20);
@@ -0,0 +1,10 @@
+-- float16 embeddings of resumes and vacancies for semantic candidate search.
+-- Existing rows keep NULL and are picked up by `python -m src.commands.backfill_embeddings`.
+ALTER TABLE resumes ADD COLUMN IF NOT EXISTS embedding BYTEA;
+ALTER TABLE resumes ADD COLUMN IF NOT EXISTS embedding_model VARCHAR(100);
+ALTER TABLE resumes ADD COLUMN IF NOT EXISTS embedded_at TIMESTAMP;
+CREATE INDEX IF NOT EXISTS ix_resumes_embedded_at ON resumes (embedded_at);
+
+ALTER TABLE vacancy ADD COLUMN IF NOT EXISTS embedding BYTEA;
+ALTER TABLE vacancy ADD COLUMN IF NOT EXISTS embedding_model VARCHAR(100);
+ALTER TABLE vacancy ADD COLUMN IF NOT EXISTS embedded_at TIMESTAMP;
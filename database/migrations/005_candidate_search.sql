@@ -0,0 +1,18 @@
+-- Indexed filters of the HR candidate search (GET /hr/candidates/search).
+-- JSON has no operators or index support in PostgreSQL; JSONB keeps the same values.
+ALTER TABLE resumes ALTER COLUMN skills TYPE JSONB USING skills::jsonb;
+ALTER TABLE resumes ALTER COLUMN languages TYPE JSONB USING languages::jsonb;
+
+-- Normalized values the search filters on. Existing rows keep NULL until
+-- `python -m src.commands.backfill_search_tags` fills them.
+ALTER TABLE resumes ADD COLUMN IF NOT EXISTS skill_tags VARCHAR[];
+ALTER TABLE resumes ADD COLUMN IF NOT EXISTS language_tags VARCHAR[];
+ALTER TABLE resumes ADD COLUMN IF NOT EXISTS profession_tags VARCHAR[];
+ALTER TABLE resumes ADD COLUMN IF NOT EXISTS grade_level SMALLINT;
+
+CREATE INDEX IF NOT EXISTS ix_resumes_skill_tags ON resumes USING gin (skill_tags);
+CREATE INDEX IF NOT EXISTS ix_resumes_language_tags ON resumes USING gin (language_tags);
+CREATE INDEX IF NOT EXISTS ix_resumes_profession_tags ON resumes USING gin (profession_tags);
+CREATE INDEX IF NOT EXISTS ix_resumes_grade_level ON resumes (grade_level);
+CREATE INDEX IF NOT EXISTS ix_resumes_experience_time ON resumes (experience_time);
+CREATE INDEX IF NOT EXISTS ix_resumes_min_salary ON resumes (min_salary);
@@ -0,0 +1,9 @@
+-- Full-text vacancy search (GET /user/vacancies/search). The expression must stay identical to
+-- VACANCY_SEARCH_VECTOR in src/models.py. Adding a stored generated column rewrites the table once.
+ALTER TABLE vacancy ADD COLUMN IF NOT EXISTS search_vector TSVECTOR GENERATED ALWAYS AS (
+    setweight(to_tsvector('russian', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('russian', coalesce(position, '') || ' ' || coalesce(skills, '')), 'B') ||
+    setweight(to_tsvector('russian', coalesce(description, '')), 'C') ||
+    setweight(to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(skills, '')), 'D')
+) STORED;
+CREATE INDEX IF NOT EXISTS ix_vacancy_search_vector ON vacancy USING gin (search_vector);
@@ -0,0 +1,22 @@
+-- Canonical skill names and the inverted skill index of resumes and vacancies (src/modules/skill).
+-- Existing rows are indexed by `python -m src.commands.backfill_skill_index`; run
+-- `python -m src.commands.backfill_search_tags --all` too, so skill_tags use the dictionary names.
+CREATE TABLE IF NOT EXISTS skill (
+    id SERIAL PRIMARY KEY,
+    name VARCHAR(100) NOT NULL UNIQUE
+);
+
+-- The primary keys are the posting lists of each skill, in id order
+CREATE TABLE IF NOT EXISTS resume_skill (
+    skill_id INTEGER NOT NULL REFERENCES skill (id) ON DELETE CASCADE,
+    resume_id INTEGER NOT NULL REFERENCES resumes (id) ON DELETE CASCADE,
+    PRIMARY KEY (skill_id, resume_id)
+);
+CREATE INDEX IF NOT EXISTS ix_resume_skill_resume_id ON resume_skill (resume_id);
+
+CREATE TABLE IF NOT EXISTS vacancy_skill (
+    skill_id INTEGER NOT NULL REFERENCES skill (id) ON DELETE CASCADE,
+    vacancy_id INTEGER NOT NULL REFERENCES vacancy (id) ON DELETE CASCADE,
+    PRIMARY KEY (skill_id, vacancy_id)
+);
+CREATE INDEX IF NOT EXISTS ix_vacancy_skill_vacancy_id ON vacancy_skill (vacancy_id);